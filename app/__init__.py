@@ -1,20 +1,151 @@
+import asyncio
+import os
+import signal
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.api import router as api_router
-from app.config.config_loader import ConfigLoader
+from app.api import include_api_routes
+from app.api.dependencies import build_request_processor
+from app.adapters.api.http_client import close_http_clients
+from app.adapters.feast.feast_client import preload_feast
+from app.adapters.ml.prediction_request_builder import clear_compiled_schemas
+from app.config.config_loader import get_config_loader
+from app.config.data_source_config_manager import DataSourceConfigManager
+from app.common.errors.error_handlers import register_exception_handlers
+from app.common.middleware.cors_middleware import FastCORSMiddleware
+from app.common.middleware.error_middleware import ErrorASGIMiddleware
+from app.common.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+def reload_configuration(app: FastAPI) -> None:
+    """Drop all cached configuration and load it again from disk.
+    
+    Data source clients whose configuration changed are rebuilt. Settings
+    applied when the app is created, such as CORS, the docs routes and
+    connection warmup, only change on restart.
+    """
+    app.state.data_source_config.reload_data_source_config()
+    
+    # Rebuild the database engines and API clients of changed sources
+    sources = app.state.request_processor.data_orchestrator.sources
+    sources["database"].reload_engines()
+    sources["api"].reload_clients()
+    sources["feast"].reload_feature_stores()
+    
+    request_processor = app.state.request_processor
+    endpoint_config = request_processor.endpoint_config
+    endpoint_config.reload_endpoint_config()
+    endpoint_config.preload_endpoint_configs()
+    
+    # Entries compiled from the old configuration objects are never hit
+    # again, so drop them along with the objects they keep alive
+    request_processor.data_orchestrator.clear_caches()
+    request_processor.response_assembler.clear_caches()
+    clear_compiled_schemas()
+    
+    app.state.model_client.preload_models()
+
+def _log_feast_preload_failure(future: "asyncio.Future[None]") -> None:
+    """Log the error of a failed background Feast import."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Failed to preload Feast: %s", future.exception(), exc_info=future.exception())
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage resources that live for the lifetime of the application."""
+    # Reload configuration on SIGHUP where the platform and thread allow it
+    loop = asyncio.get_running_loop()
+    reload_on_sighup = False
+    if hasattr(signal, "SIGHUP"):
+        try:
+            loop.add_signal_handler(signal.SIGHUP, reload_configuration, app)
+            reload_on_sighup = True
+        except (NotImplementedError, RuntimeError, ValueError):
+            pass
+    
+    # Import Feast in the background so neither startup nor the first
+    # feature request waits for it
+    app.state.feast_preload = loop.run_in_executor(None, preload_feast)
+    app.state.feast_preload.add_done_callback(_log_feast_preload_failure)
+    
+    # Resolve model endpoints so the first prediction doesn't have to
+    app.state.model_client.preload_models()
+    
+    # Connect to the databases and APIs before serving, so the first requests
+    # find open connections in the pools
+    if app.state.warmup_connections:
+        sources = app.state.request_processor.data_orchestrator.sources
+        await asyncio.gather(sources["database"].warmup(), sources["api"].warmup())
+    
+    yield
+    
+    if reload_on_sighup:
+        loop.remove_signal_handler(signal.SIGHUP)
+    
+    # Don't wait on an unfinished Feast import; the thread ends on its own
+    if not app.state.feast_preload.done():
+        app.state.feast_preload.cancel()
+    
+    # Close pooled outbound HTTP connections
+    await close_http_clients()
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     # Load configuration
-    config = ConfigLoader().load_config()
+    config_loader = get_config_loader()
+    config = config_loader.load_config()
+    
+    # Only register the OpenAPI schema and docs routes in debug mode, so
+    # production deployments don't carry them in the route table
+    docs_enabled = config.get("app", {}).get("debug", True)
+    if os.environ.get("ORCH_DISABLE_DOCS", "").lower() in ("1", "true", "yes"):
+        docs_enabled = False
     
-    # Initialize FastAPI app
+    docs_options = {}
+    if not docs_enabled:
+        docs_options = {"openapi_url": None, "docs_url": None, "redoc_url": None}
+    
+    # Initialize FastAPI app. The default response class is kept on purpose:
+    # for routes with a response_model FastAPI serializes straight to JSON
+    # bytes with pydantic, which a custom class like ORJSONResponse bypasses
     app = FastAPI(
         title="Orchestrator API Service",
         description="API service for orchestrating data flows across multiple sources",
-        version="0.1.0"
+        version="0.1.0",
+        lifespan=lifespan,
+        **docs_options
     )
     
+    # Map domain errors to responses, and any other exception to a JSON 500
+    # in a pure ASGI middleware (inside CORS, so error responses get headers)
+    register_exception_handlers(app)
+    app.add_middleware(ErrorASGIMiddleware)
+    
+    # Add CORS headers as a pure ASGI middleware
+    cors_config = config.get("cors", {})
+    if cors_config.get("enabled", False):
+        app.add_middleware(
+            FastCORSMiddleware,
+            allow_origins=cors_config.get("allow_origins", ["*"]),
+            allow_methods=cors_config.get("allow_methods", ["*"]),
+            allow_headers=cors_config.get("allow_headers", ["*"]),
+            expose_headers=cors_config.get("expose_headers", []),
+            allow_credentials=cors_config.get("allow_credentials", False),
+            max_age=cors_config.get("max_age", 86400)
+        )
+    
     # Include API routes
-    app.include_router(api_router)
+    include_api_routes(app)
+    
+    # Open connections at startup unless disabled, e.g. for tests that never
+    # reach the configured services
+    app.state.warmup_connections = config.get("performance", {}).get("warmup_connections", True)
+    if os.environ.get("ORCH_SKIP_WARMUP", "").lower() in ("1", "true", "yes"):
+        app.state.warmup_connections = False
+    
+    # Build the request processing graph once rather than on every request
+    app.state.data_source_config = DataSourceConfigManager(config_loader)
+    app.state.request_processor = build_request_processor(config_loader, app.state.data_source_config)
+    app.state.model_client = app.state.request_processor.data_orchestrator.sources["ml"]
     
     return app
@@ -1,7 +1,53 @@
-from typing import Any, Dict, List, Optional
-import json
+import functools
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+import orjson
 from urllib.parse import urlencode
 
+# Shared read-only headers returned when there is nothing to merge
+_EMPTY_HEADERS: Mapping[str, str] = MappingProxyType({})
+
+# Characters used to sniff whether an untyped response body is JSON
+_WHITESPACE = frozenset(" \t\r\n")
+_JSON_STARTS = frozenset("{[")
+
+# MIME types whose bodies are parsed as JSON
+_JSON_MIMES = frozenset({
+    "application/json",
+    "application/problem+json",
+    "application/vnd.api+json",
+    "text/json"
+})
+
+@functools.lru_cache(maxsize=64)
+def is_json_content_type(content_type: str) -> bool:
+    """Check whether a Content-Type header value denotes JSON.
+    
+    Services send the same few header values over and over, so the parsed
+    result is cached per distinct value.
+    """
+    return content_type.split(";", 1)[0].strip().lower() in _JSON_MIMES
+
+def _encode_form(data: Any) -> bytes:
+    """Encode data as an application/x-www-form-urlencoded body."""
+    return urlencode(data, doseq=True).encode("ascii")
+
+def _encode_text(data: Any) -> bytes:
+    """Encode data as a UTF-8 text body."""
+    return data.encode("utf-8") if isinstance(data, str) else str(data).encode("utf-8")
+
+def _encode_bytes(data: Any) -> bytes:
+    """Pass raw bytes through, converting other buffers to bytes."""
+    return data if isinstance(data, bytes) else bytes(data)
+
+# Request body encoders by content type
+_ENCODERS: Dict[str, Callable[[Any], bytes]] = {
+    "application/json": orjson.dumps,
+    "application/x-www-form-urlencoded": _encode_form,
+    "text/plain": _encode_text,
+    "application/octet-stream": _encode_bytes
+}
+
 class ApiRequestBuilder:
     """Builds API requests for external services."""
     
@@ -17,24 +63,29 @@ class ApiRequestBuilder:
         Returns:
             The complete URL
         """
-        # Ensure base_url doesn't end with / and path starts with /
-        base_url = base_url.rstrip("/")
-        path = "/" + path.lstrip("/")
-        
-        url = base_url + path
+        # Ensure base_url doesn't end with / and path starts with /, only
+        # building new strings when they don't already
+        if base_url.endswith("/"):
+            base_url = base_url.rstrip("/")
+        if not path.startswith("/"):
+            path = "/" + path
+        elif path.startswith("//"):
+            path = "/" + path.lstrip("/")
         
         # Add query parameters if provided
         if query_params:
-            query_string = urlencode(query_params)
-            url = f"{url}?{query_string}"
+            return f"{base_url}{path}?{urlencode(query_params, doseq=True)}"
         
-        return url
+        return base_url + path
     
     @staticmethod
-    def build_headers(default_headers: Optional[Dict[str, str]] = None, 
-                     additional_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    def build_headers(default_headers: Optional[Mapping[str, str]] = None, 
+                     additional_headers: Optional[Mapping[str, str]] = None) -> Mapping[str, str]:
         """Build request headers.
         
+        The defaults are only copied when additional headers have to be merged
+        in, so the returned mapping may be shared and must not be mutated.
+        
         Args:
             default_headers: Default headers to include
             additional_headers: Additional headers to add or override defaults
@@ -42,16 +93,17 @@ class ApiRequestBuilder:
         Returns:
             The combined headers
         """
-        headers = default_headers or {}
+        if not additional_headers:
+            return default_headers if default_headers is not None else _EMPTY_HEADERS
         
         # Add or override with additional headers
-        if additional_headers:
-            headers.update(additional_headers)
+        headers = dict(default_headers) if default_headers else {}
+        headers.update(additional_headers)
         
         return headers
     
     @staticmethod
-    def build_request_body(data: Dict[str, Any], content_type: str = "application/json") -> tuple[str, Dict[str, str]]:
+    def build_request_body(data: Any, content_type: str = "application/json") -> Tuple[bytes, Dict[str, str]]:
         """Build a request body with appropriate content type.
         
         Args:
@@ -59,18 +111,26 @@ class ApiRequestBuilder:
             content_type: The content type (default: application/json)
             
         Returns:
-            Tuple of (body_content, headers)
+            Tuple of (encoded body bytes, headers)
+            
+        Raises:
+            ValueError: If no encoder is registered for the content type
         """
-        headers = {"Content-Type": content_type}
-        
-        if content_type == "application/json":
-            body = json.dumps(data)
-        elif content_type == "application/x-www-form-urlencoded":
-            body = urlencode(data)
-        else:
+        encoder = _ENCODERS.get(content_type)
+        if encoder is None:
             raise ValueError(f"Unsupported content type: {content_type}")
         
-        return body, headers
+        return encoder(data), {"Content-Type": content_type}
+    
+    @staticmethod
+    def register_encoder(content_type: str, encoder: Callable[[Any], bytes]) -> None:
+        """Register or replace the body encoder for a content type.
+        
+        Args:
+            content_type: The content type the encoder handles
+            encoder: Callable converting request data to body bytes
+        """
+        _ENCODERS[content_type] = encoder
     
     @staticmethod
     def parse_response(response_text: str, content_type: Optional[str] = None) -> Any:
@@ -86,14 +146,19 @@ class ApiRequestBuilder:
         if not response_text:
             return None
         
-        if content_type and "application/json" in content_type:
-            return json.loads(response_text)
+        if content_type and is_json_content_type(content_type):
+            return orjson.loads(response_text)
         
-        # Try to parse as JSON anyway if it looks like JSON
-        if response_text.strip().startswith(("{" ,"[")):
+        # Try to parse as JSON anyway if it looks like JSON, peeking past
+        # leading whitespace instead of stripping a copy of the whole body
+        whitespace = _WHITESPACE
+        i, n = 0, len(response_text)
+        while i < n and response_text[i] in whitespace:
+            i += 1
+        if i < n and response_text[i] in _JSON_STARTS:
             try:
-                return json.loads(response_text)
-            except json.JSONDecodeError:
+                return orjson.loads(response_text)
+            except orjson.JSONDecodeError:
                 pass
         
         # Return as text if can't parse as JSON
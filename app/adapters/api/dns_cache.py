@@ -0,0 +1,182 @@
+import asyncio
+import socket
+import time
+from contextlib import contextmanager
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterator, Optional, Tuple
+
+import httpcore
+import httpx
+
+from app.common.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Default time to keep a resolved address, in seconds
+DEFAULT_DNS_TTL = 60.0
+
+# Resolved addresses shared by all transports: (host, port) -> (expiry, addresses)
+_resolved_hosts: Dict[Tuple[str, int], Tuple[float, Tuple[str, ...]]] = {}
+
+async def resolve_host(host: str, port: int, ttl: float = DEFAULT_DNS_TTL) -> Tuple[str, ...]:
+    """Resolve a host name to its IP addresses, reusing recent lookups.
+    
+    Args:
+        host: The host name to resolve
+        port: The port being connected to
+        ttl: How long resolved addresses are reused, in seconds
+    
+    Returns:
+        The distinct addresses in the order returned by the resolver
+    """
+    cache_key = (host, port)
+    cached = _resolved_hosts.get(cache_key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    
+    infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    addresses = tuple(dict.fromkeys(info[4][0] for info in infos))
+    _resolved_hosts[cache_key] = (time.monotonic() + ttl, addresses)
+    return addresses
+
+def clear_dns_cache() -> None:
+    """Forget all resolved addresses."""
+    _resolved_hosts.clear()
+
+class CachingDNSBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that connects to addresses from the shared DNS cache.
+    
+    Only the TCP connect is redirected to the cached address; TLS server name
+    indication and the Host header still use the original host name.
+    """
+    
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, ttl: float = DEFAULT_DNS_TTL):
+        self.backend = backend
+        self.ttl = ttl
+    
+    async def connect_tcp(self, host: str, port: int, timeout: Optional[float] = None,
+                          local_address: Optional[str] = None, socket_options: Any = None) -> httpcore.AsyncNetworkStream:
+        try:
+            addresses = await resolve_host(host, port, self.ttl)
+        except OSError as e:
+            # Let the wrapped backend resolve it and report the failure
+            logger.debug("DNS lookup for %s failed: %s", host, e)
+            addresses = (host,)
+        
+        # Try each address in turn, as the resolver-based connect would
+        for address in addresses[:-1]:
+            try:
+                return await self.backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout):
+                continue
+        
+        return await self.backend.connect_tcp(
+            addresses[-1],
+            port,
+            timeout=timeout,
+            local_address=local_address,
+            socket_options=socket_options
+        )
+    
+    async def connect_unix_socket(self, path: str, timeout: Optional[float] = None,
+                                  socket_options: Any = None) -> httpcore.AsyncNetworkStream:
+        return await self.backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+    
+    async def sleep(self, seconds: float) -> None:
+        await self.backend.sleep(seconds)
+
+# httpcore errors mapped to their httpx equivalents, most specific first, as
+# httpx's own transport does, so callers only need to handle httpx errors
+_HTTPCORE_ERRORS: Tuple[Tuple[type, type], ...] = (
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+
+@contextmanager
+def _map_httpcore_errors() -> Iterator[None]:
+    """Re-raise httpcore errors as the matching httpx errors."""
+    try:
+        yield
+    except Exception as e:
+        for httpcore_error, httpx_error in _HTTPCORE_ERRORS:
+            if isinstance(e, httpcore_error):
+                raise httpx_error(str(e)) from e
+        raise
+
+class _ResponseStream(httpx.AsyncByteStream):
+    """Response body stream of an httpcore response, with errors mapped."""
+    
+    def __init__(self, stream: AsyncIterable[bytes]):
+        self.stream = stream
+    
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _map_httpcore_errors():
+            async for chunk in self.stream:
+                yield chunk
+    
+    async def aclose(self) -> None:
+        if hasattr(self.stream, "aclose"):
+            await self.stream.aclose()
+
+class CachingDNSTransport(httpx.AsyncBaseTransport):
+    """httpx transport whose new connections resolve hosts through the DNS cache.
+    
+    httpx's own transport doesn't accept a network backend, so this one
+    builds the httpcore connection pool itself and adapts requests and
+    responses through the public httpx and httpcore APIs.
+    """
+    
+    def __init__(self, dns_ttl: float = DEFAULT_DNS_TTL, limits: Optional[httpx.Limits] = None,
+                 http2: bool = False, verify: Any = True):
+        limits = limits or httpx.Limits()
+        self.pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(verify=verify),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http2=http2,
+            network_backend=CachingDNSBackend(httpcore.AnyIOBackend(), dns_ttl)
+        )
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions
+        )
+        with _map_httpcore_errors():
+            core_response = await self.pool.handle_async_request(core_request)
+        
+        return httpx.Response(
+            status_code=core_response.status,
+            headers=core_response.headers,
+            stream=_ResponseStream(core_response.stream),
+            extensions=core_response.extensions
+        )
+    
+    async def aclose(self) -> None:
+        await self.pool.aclose()
@@ -1,25 +1,86 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from fastapi import Depends
+from urllib.request import getproxies
+import asyncio
 import httpx
-import json
+import orjson
 
+from app.adapters.api.api_request_builder import is_json_content_type
+from app.adapters.api.dns_cache import DEFAULT_DNS_TTL, CachingDNSTransport
 from app.config.data_source_config_manager import DataSourceConfigManager
 from app.common.errors.custom_exceptions import ApiError
 from app.common.utils.logging_utils import get_logger
+from app.common.utils.ttl_cache import TTLCache
 
 logger = get_logger(__name__)
 
+# HTTP clients shared by all HttpClient instances, keyed by source ID, so
+# connections are kept alive and reused across requests
+_shared_clients: Dict[str, httpx.AsyncClient] = {}
+
+# The source configuration each shared client was created from, keyed by
+# source ID, so a reload can tell which clients are out of date
+_shared_client_configs: Dict[str, Dict[str, Any]] = {}
+
+# Clients replaced after a configuration reload. Requests may still be using
+# them, and they may share a transport with current clients, so they are
+# only closed at shutdown.
+_retired_clients: List[httpx.AsyncClient] = []
+
+# Transports shared by API sources with the same connection settings, keyed by
+# those settings; a transport pools connections per origin, so sources on the
+# same host reuse each other's connections
+_shared_transports: Dict[Tuple[Any, ...], CachingDNSTransport] = {}
+
+# Connection pool defaults for API sources that don't configure their own;
+# httpx's own defaults (100 connections, 20 kept alive) throttle fan-out
+_DEFAULT_MAX_CONNECTIONS = 1000
+_DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 100
+_DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+# Timeout of the warmup requests, in seconds; kept short so an unreachable
+# source delays startup by this much at most, not by its full timeout
+_WARMUP_TIMEOUT = 2.0
+
+# Headers for request bodies encoded as JSON
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Credit scores change slowly, so each one is reused for a minute instead of
+# calling the credit API on every request; keyed by (source ID, customer ID)
+_credit_score_cache = TTLCache(maxsize=10000, ttl=60.0)
+
+class _TextContent(dict):
+    """Payload standing in for a successful response whose body is not JSON."""
+
+async def close_http_clients() -> None:
+    """Close all shared HTTP clients and release their connections."""
+    clients = [*_shared_clients.values(), *_retired_clients]
+    _shared_clients.clear()
+    _shared_client_configs.clear()
+    _retired_clients.clear()
+    _shared_transports.clear()
+    
+    # Each client closes its transport; a shared transport is just closed
+    # again by every client using it, which is harmless
+    for client in clients:
+        await client.aclose()
+
 class HttpClient:
     """Client for external API operations."""
     
     def __init__(self, config_manager: DataSourceConfigManager = Depends()):
         self.config_manager = config_manager
-        self.clients = {}
+        self.clients = _shared_clients
     
     def _get_client(self, source_id: str):
-        """Get an HTTP client for the specified source ID."""
-        if source_id in self.clients:
-            return self.clients[source_id]
+        """Get an HTTP client for the specified source ID.
+        
+        Clients are created once per source and shared, so every request,
+        including those to absolute URLs, reuses the source's connection pool.
+        """
+        client = self.clients.get(source_id)
+        if client is not None:
+            return client
         
         # Get the API configuration
         config = self.config_manager.get_data_source_config("api", source_id)
@@ -36,13 +97,93 @@ class HttpClient:
             headers = config.get("headers", {})
             timeout = config.get("timeout", 30.0)
             
-            client = httpx.AsyncClient(base_url=base_url, headers=headers, timeout=timeout)
+            # Size the connection pool so concurrent requests reuse live
+            # connections instead of opening new ones
+            limits = httpx.Limits(
+                max_connections=config.get("max_connections", _DEFAULT_MAX_CONNECTIONS),
+                max_keepalive_connections=config.get("max_keepalive_connections", _DEFAULT_MAX_KEEPALIVE_CONNECTIONS),
+                keepalive_expiry=config.get("keepalive_expiry", _DEFAULT_KEEPALIVE_EXPIRY)
+            )
+            
+            # New connections reuse cached DNS lookups. HTTP/2 multiplexes
+            # requests over one connection per host, but needs the optional
+            # h2 package (httpx[http2])
+            dns_ttl = config.get("dns_cache_ttl", DEFAULT_DNS_TTL)
+            http2 = config.get("http2", False)
+            
+            # httpx only routes through the proxies set in the environment
+            # when it builds the transports itself, so behind a proxy the
+            # client keeps its own stock transport and skips the DNS cache
+            # (the proxy resolves the hosts anyway)
+            if getproxies():
+                client = httpx.AsyncClient(base_url=base_url, headers=headers, timeout=timeout, limits=limits, http2=http2)
+                self.clients[source_id] = client
+                _shared_client_configs[source_id] = config
+                return client
+            
+            # Share the transport, and so the connection pool, with the other
+            # sources that have the same connection settings
+            transport_key = (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry, dns_ttl, http2)
+            transport = _shared_transports.get(transport_key)
+            if transport is None:
+                transport = CachingDNSTransport(dns_ttl=dns_ttl, limits=limits, http2=http2)
+                _shared_transports[transport_key] = transport
+            
+            client = httpx.AsyncClient(base_url=base_url, headers=headers, timeout=timeout, transport=transport)
             self.clients[source_id] = client
+            _shared_client_configs[source_id] = config
             return client
         except Exception as e:
-            logger.error(f"Error creating HTTP client for source '{source_id}': {str(e)}")
+            logger.error("Error creating HTTP client for source '%s': %s", source_id, e)
             raise ApiError(f"Error initializing API client: {str(e)}", source_id)
     
+    def reload_clients(self) -> int:
+        """Replace the clients of API sources whose configuration changed.
+        
+        Call this after the data source configuration has been reloaded. The
+        next request to a changed or removed source creates its client from
+        the new configuration. Cached credit scores are dropped too.
+        
+        Returns:
+            The number of clients replaced
+        """
+        retired = 0
+        for source_id, client in list(self.clients.items()):
+            if self.config_manager.get_data_source_config("api", source_id) != _shared_client_configs.get(source_id):
+                del self.clients[source_id]
+                _shared_client_configs.pop(source_id, None)
+                _retired_clients.append(client)
+                retired += 1
+        
+        _credit_score_cache.clear()
+        
+        logger.info("Reloaded API clients, %s replaced", retired)
+        return retired
+    
+    async def warmup(self) -> int:
+        """Open a connection to every configured API source.
+        
+        A HEAD request to each source's base URL creates its client and
+        leaves a connection in the pool, so the first real request doesn't
+        pay for the TCP and TLS handshakes. Any response counts; sources that
+        can't be reached are logged and left to connect on first use.
+        
+        Returns:
+            The number of sources that responded
+        """
+        source_ids = list(self.config_manager.get_all_data_sources("api"))
+        results = await asyncio.gather(*(self._warmup_source(source_id) for source_id in source_ids))
+        return sum(results)
+    
+    async def _warmup_source(self, source_id: str) -> bool:
+        """Open a connection to one API source, reporting whether it responded."""
+        try:
+            await self._get_client(source_id).head("/", timeout=_WARMUP_TIMEOUT)
+            return True
+        except (ApiError, httpx.HTTPError) as e:
+            logger.warning("Could not warm up API source '%s': %s", source_id, e)
+            return False
+    
     async def request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, 
                      data: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None, 
                      source_id: str = "default") -> Dict[str, Any]:
@@ -70,50 +211,83 @@ class HttpClient:
         if params:
             request_args["params"] = params
         
-        if data:
-            request_args["json"] = data
-        
         if headers:
             request_args["headers"] = headers
         
+        # Encode JSON bodies with orjson rather than httpx's json.dumps,
+        # declaring the content type unless the caller already did
+        if data:
+            request_args["content"] = orjson.dumps(data)
+            if not headers:
+                request_args["headers"] = _JSON_HEADERS
+            elif not any(name.lower() == "content-type" for name in headers):
+                request_args["headers"] = {**headers, **_JSON_HEADERS}
+        
         try:
-            logger.info(f"Making {method} request to {path} on API source '{source_id}'")
+            logger.info("Making %s request to %s on API source '%s'", method, path, source_id)
             response = await client.request(**request_args)
             
             # Check for error status codes
             response.raise_for_status()
             
-            # Parse response
-            if response.headers.get("content-type", "").startswith("application/json"):
-                return response.json()
-            else:
-                return {"content": response.text, "status_code": response.status_code}
+            return self._parse_response(response)
             
         except httpx.HTTPStatusError as e:
-            # Handle HTTP error responses
-            error_message = f"HTTP error {e.response.status_code}"
-            
-            # Try to parse error response
-            try:
-                error_data = e.response.json()
-                if isinstance(error_data, dict) and "message" in error_data:
-                    error_message = error_data["message"]
-            except Exception:
-                pass
-            
-            logger.error(f"API error from source '{source_id}': {error_message}")
-            raise ApiError(error_message, source_id, e.response.status_code)
+            raise self._status_error(e.response, source_id)
             
         except httpx.RequestError as e:
             # Handle request exceptions (network errors, timeouts, etc.)
-            logger.error(f"Request error for API source '{source_id}': {str(e)}")
+            logger.error("Request error for API source '%s': %s", source_id, e)
             raise ApiError(f"Request failed: {str(e)}", source_id)
             
         except Exception as e:
             # Handle any other exceptions
-            logger.error(f"Unexpected error for API source '{source_id}': {str(e)}")
+            logger.error("Unexpected error for API source '%s': %s", source_id, e)
             raise ApiError(f"Unexpected error: {str(e)}", source_id)
     
+    @staticmethod
+    def _parse_response(response: httpx.Response) -> Dict[str, Any]:
+        """Parse a successful response.
+        
+        The body is buffered once as bytes and parsed by orjson without an
+        intermediate str; streaming it would not lower peak memory, since the
+        parsed object is materialized in full anyway.
+        
+        Args:
+            response: The HTTP response
+            
+        Returns:
+            The decoded JSON, or the body text and status code for other content
+        """
+        content_type = response.headers.get("content-type")
+        if content_type and is_json_content_type(content_type):
+            return orjson.loads(response.content)
+        return _TextContent(content=response.text, status_code=response.status_code)
+    
+    @staticmethod
+    def _status_error(response: httpx.Response, source_id: str) -> ApiError:
+        """Build the error for an HTTP error response.
+        
+        Args:
+            response: The HTTP error response
+            source_id: The API source ID
+            
+        Returns:
+            An ApiError with the service's message, if it sent one
+        """
+        error_message = f"HTTP error {response.status_code}"
+        
+        # Try to parse error response
+        try:
+            error_data = orjson.loads(response.content)
+            if isinstance(error_data, dict) and "message" in error_data:
+                error_message = error_data["message"]
+        except Exception:
+            pass
+        
+        logger.error("API error from source '%s': %s", source_id, error_message)
+        return ApiError(error_message, source_id, response.status_code)
+    
     # Convenience methods for common HTTP methods
     
     async def get(self, path: str, params: Optional[Dict[str, Any]] = None, 
@@ -138,7 +312,7 @@ class HttpClient:
     
     # Example operations for external API integration
     
-    async def get_customer_credit_score(self, customer_id: str, source_id: str = "credit_api") -> Dict[str, Any]:
+    async def get_customer_credit_score(self, customer_id: str, source_id: str = "credit_api") -> Any:
         """Get a customer's credit score from an external API.
         
         Args:
@@ -146,10 +320,24 @@ class HttpClient:
             source_id: The API source ID
             
         Returns:
-            Credit score data
+            Credit score data, normally a JSON object
         """
+        # Callers get their own copy, so they can't change the cached data
+        cache_key = (source_id, customer_id)
+        credit_score = _credit_score_cache.get(cache_key)
+        if credit_score is not None:
+            return dict(credit_score)
+        
         try:
-            return await self.get(f"/customers/{customer_id}/credit-score", source_id=source_id)
+            credit_score = await self.get(f"/customers/{customer_id}/credit-score", source_id=source_id)
         except Exception as e:
-            logger.error(f"Error fetching credit score for customer {customer_id}: {str(e)}")
+            logger.error("Error fetching credit score for customer %s: %s", customer_id, e)
             raise ApiError(f"Failed to retrieve credit score: {str(e)}", source_id)
+        
+        # Only JSON objects are cached; anything else is passed through as is
+        # and fetched again next time
+        if type(credit_score) is not dict:
+            return credit_score
+        
+        _credit_score_cache.set(cache_key, credit_score)
+        return dict(credit_score)
@@ -1,101 +1,557 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 from fastapi import Depends
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import sqlalchemy
-from sqlalchemy.orm import sessionmaker
 from datetime import datetime
-import uuid
+import secrets
+import functools
 import os
+import threading
 
 from app.config.data_source_config_manager import DataSourceConfigManager
 from app.common.errors.custom_exceptions import DatabaseError, ResourceNotFoundError
 from app.common.utils.logging_utils import get_logger
+from app.common.utils.ttl_cache import TTLCache
 
 logger = get_logger(__name__)
 
+# Columns of the customers table, selected explicitly instead of with *
+_CUSTOMER_COLUMNS = ("customer_id", "name", "email", "phone", "address", "date_of_birth", "created_at", "updated_at")
+_CUSTOMER_SELECT_LIST = ", ".join(_CUSTOMER_COLUMNS)
+
+# Columns a customer update may change
+_UPDATABLE_CUSTOMER_COLUMNS = frozenset(("name", "email", "phone", "address", "date_of_birth"))
+
+# Slowly changing per-customer lookups shared by all client instances, keyed
+# by (source ID, customer ID, lookup); only rows that were found are cached
+_lookup_cache = TTLCache(maxsize=10000, ttl=60.0)
+_CACHED_LOOKUPS = ("customer features", "credit score", "churn prediction")
+
+# Fixed statements are parsed into text clauses once, at import time,
+# instead of on every query
+_GET_CUSTOMER_QUERY = sqlalchemy.text(
+    f"SELECT {_CUSTOMER_SELECT_LIST} FROM customers WHERE customer_id = :customer_id"
+)
+_LIST_CUSTOMERS_QUERY = sqlalchemy.text(
+    f"SELECT {_CUSTOMER_SELECT_LIST} FROM customers "
+    "ORDER BY created_at DESC, customer_id DESC LIMIT :limit OFFSET :offset"
+)
+# Keyset variant: continues after the last customer of the previous page, so
+# each page reads only its own rows from the (created_at, customer_id) index
+# however deep it is
+_LIST_CUSTOMERS_AFTER_QUERY = sqlalchemy.text(
+    f"SELECT {_CUSTOMER_SELECT_LIST} FROM customers "
+    "WHERE (created_at, customer_id) < (:cursor_created_at, :cursor_customer_id) "
+    "ORDER BY created_at DESC, customer_id DESC LIMIT :limit"
+)
+_INSERT_CUSTOMER_QUERY = sqlalchemy.text(
+    f"INSERT INTO customers ({_CUSTOMER_SELECT_LIST}) "
+    f"VALUES ({', '.join(f':{col}' for col in _CUSTOMER_COLUMNS)}) "
+    f"RETURNING {_CUSTOMER_SELECT_LIST}"
+)
+_DELETE_CUSTOMER_QUERY = sqlalchemy.text("DELETE FROM customers WHERE customer_id = :customer_id")
+_PING_QUERY = sqlalchemy.text("SELECT 1")
+
+# Settings applied once to each new SQLite connection; pooled connections
+# keep them, along with their page cache, for their whole lifetime. Pages are
+# read through a memory map of up to 256 MB instead of copied by read calls,
+# and writers wait up to 5 seconds for a lock instead of failing at once.
+# None of them is stored in the database file: the journal mode is, so it is
+# left to whoever creates the database (setup_database.py uses WAL) rather
+# than switched by simply opening an existing file.
+_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA cache_size=-64000;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA mmap_size=268435456;"
+    "PRAGMA busy_timeout=5000;"
+)
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Configure a new SQLite connection when the pool opens it."""
+    # Run all the settings in a single call into SQLite
+    dbapi_connection.executescript(_SQLITE_PRAGMAS)
+
+# Per-customer lookups on the other tables, with their column lists spelled
+# out so the queries only depend on the columns the responses use
+_FEATURES_QUERY = sqlalchemy.text(
+    "SELECT customer_id, customer_lifetime_value, days_since_last_purchase, "
+    "purchase_frequency, average_order_value, total_purchases "
+    "FROM customer_features WHERE customer_id = :customer_id"
+)
+_CREDIT_SCORE_QUERY = sqlalchemy.text(
+    "SELECT customer_id, score, risk_tier, updated_at "
+    "FROM credit_scores WHERE customer_id = :customer_id"
+)
+_RECENT_ORDERS_QUERY = sqlalchemy.text(
+    "SELECT order_id, customer_id, order_date, total_amount, status, items_count "
+    "FROM orders WHERE customer_id = :customer_id ORDER BY order_date DESC LIMIT :limit"
+)
+_CHURN_PREDICTION_QUERY = sqlalchemy.text(
+    "SELECT id, customer_id, probability, risk_level, recommendation, created_at "
+    "FROM churn_predictions WHERE customer_id = :customer_id ORDER BY created_at DESC LIMIT 1"
+)
+
+# The lookups behind a customer 360 view, run together on one connection:
+# (result key, query, whether only the first row is used)
+_CUSTOMER_360_QUERIES = (
+    ("features", _FEATURES_QUERY, True),
+    ("credit_score", _CREDIT_SCORE_QUERY, True),
+    ("recent_orders", _RECENT_ORDERS_QUERY, False),
+    ("churn_prediction", _CHURN_PREDICTION_QUERY, True),
+)
+
+# Customers per multi-row insert; at 8 parameters a row this stays below the
+# 999 bound variables that older SQLite versions allow per statement
+_INSERT_CUSTOMERS_BATCH_SIZE = 100
+
+@functools.lru_cache(maxsize=None)
+def _insert_customers_query(row_count: int) -> sqlalchemy.TextClause:
+    """Build the INSERT ... RETURNING statement for a batch of customers.
+    
+    Each row's parameters are suffixed with its index in the batch. There is
+    one statement per batch size, so at most _INSERT_CUSTOMERS_BATCH_SIZE.
+    """
+    values = ", ".join(
+        "(" + ", ".join(f":{col}_{i}" for col in _CUSTOMER_COLUMNS) + ")"
+        for i in range(row_count)
+    )
+    return sqlalchemy.text(
+        f"INSERT INTO customers ({_CUSTOMER_SELECT_LIST}) VALUES {values} RETURNING {_CUSTOMER_SELECT_LIST}"
+    )
+
+def _fetch_rows(connection, query: sqlalchemy.TextClause, params: Dict[str, Any], max_rows: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Execute a query on a connection and return its rows as dictionaries."""
+    result = connection.execute(query, params)
+    # Materialize the column names once; zipping each row against a
+    # plain tuple is much cheaper than against the keys view, and
+    # also beats Row._mapping and sqlite3.Row conversion
+    columns = tuple(result.keys())
+    fetched = result.fetchall() if max_rows is None else result.fetchmany(max_rows)
+    return [dict(zip(columns, row)) for row in fetched]
+
+# Pool settings that database sources may configure
+_POOL_OPTIONS = ("pool_size", "max_overflow", "pool_timeout", "pool_recycle", "pool_pre_ping")
+
+# Pool defaults for file-backed SQLite databases, whose single writer gains
+# nothing from overflow connections
+_SQLITE_POOL_DEFAULTS = {"pool_size": 10, "max_overflow": 0}
+
+# Pool defaults for server databases: a warm pool sized for concurrent
+# requests, with stale connections checked and recycled
+_SERVER_POOL_DEFAULTS = {"pool_size": 20, "max_overflow": 40, "pool_pre_ping": True, "pool_recycle": 1800}
+
+# Environment variables that resize every database pool, overriding the
+# configuration, so deployments can tune pools to their worker count
+_POOL_ENV_OVERRIDES = (("pool_size", "ORCH_DB_POOL_SIZE"), ("max_overflow", "ORCH_DB_MAX_OVERFLOW"))
+
+# Queries block on the database driver, so they run on their own threads,
+# no more than there are pooled connections. Sharing the event loop's default
+# threadpool would let queries waiting for a connection hold threads the rest
+# of the app needs, e.g. for FastAPI's sync dependencies. Each shared engine
+# gets an executor sized to its pool, keyed here by engine.
+_engine_executors: Dict[Any, ThreadPoolExecutor] = {}
+
+def _create_engine(connection_string: str, config: Optional[Dict[str, Any]] = None):
+    """Create a database engine for a connection string.
+    
+    The pool is sized from the environment overrides and then the source
+    configuration, falling back to defaults for the kind of database.
+    File-backed SQLite databases get connections that may be used from
+    worker threads, each configured with the SQLite settings above.
+    
+    Args:
+        connection_string: The database connection string
+        config: The database source configuration, if any
+    
+    Returns:
+        The engine and the number of connections its pool may open
+    """
+    config = config or {}
+    url = sqlalchemy.engine.make_url(connection_string)
+    is_sqlite = url.get_backend_name() == "sqlite"
+    if is_sqlite and url.database in (None, "", ":memory:"):
+        return sqlalchemy.create_engine(connection_string), 1
+    
+    options = dict(_SQLITE_POOL_DEFAULTS if is_sqlite else _SERVER_POOL_DEFAULTS)
+    options.update((name, config[name]) for name in _POOL_OPTIONS if name in config)
+    for name, env_var in _POOL_ENV_OVERRIDES:
+        value = os.environ.get(env_var)
+        if value:
+            options[name] = int(value)
+    
+    connect_args = dict(config.get("connect_args") or {})
+    if is_sqlite:
+        connect_args["check_same_thread"] = False
+    
+    engine = sqlalchemy.create_engine(connection_string, connect_args=connect_args, **options)
+    if is_sqlite:
+        sqlalchemy.event.listen(engine, "connect", _apply_sqlite_pragmas)
+    
+    return engine, options["pool_size"] + max(options["max_overflow"], 0)
+
+# SQL strings passed to query(), such as the update statements built for each
+# set of changed columns, repeat too; parse each one only once
+_text = functools.lru_cache(maxsize=256)(sqlalchemy.text)
+
+# Used for the default source when the database configuration has none
+_DEFAULT_CONNECTION_STRING = "sqlite:///customer360.db"
+
+@functools.lru_cache(maxsize=None)
+def _resolve_connection_string(connection_string: str) -> str:
+    """Pin a relative SQLite database path to the current working directory.
+    
+    The result is cached, so each connection string is parsed and resolved
+    once per process.
+    """
+    url = sqlalchemy.engine.make_url(connection_string)
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:") or os.path.isabs(url.database):
+        return connection_string
+    return url.set(database=os.path.abspath(url.database)).render_as_string(hide_password=False)
+
+# Engines shared by all client instances, keyed by resolved connection string
+_shared_engines: Dict[str, Any] = {}
+_shared_engines_lock = threading.Lock()
+
+def _get_shared_engine(connection_string: str, config: Optional[Dict[str, Any]] = None):
+    """Get the engine for a database, creating it on first use.
+    
+    The engine owns the connection pool, so it is created once per database
+    and process instead of once per client instance, along with an executor
+    for its queries sized to the pool.
+    """
+    connection_string = _resolve_connection_string(connection_string)
+    engine = _shared_engines.get(connection_string)
+    if engine is None:
+        with _shared_engines_lock:
+            engine = _shared_engines.get(connection_string)
+            if engine is None:
+                logger.info("Using database at: %s", sqlalchemy.engine.make_url(connection_string))
+                engine, max_connections = _create_engine(connection_string, config)
+                _engine_executors[engine] = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix="db-query")
+                _shared_engines[connection_string] = engine
+    return engine
+
+def _retire_shared_engine(engine: Any) -> None:
+    """Stop sharing an engine and release its idle connections and threads.
+    
+    Queries already running or queued finish first: checked-out connections
+    are closed when they are returned, and the executor only stops taking
+    new work.
+    """
+    with _shared_engines_lock:
+        for connection_string, shared_engine in list(_shared_engines.items()):
+            if shared_engine is engine:
+                del _shared_engines[connection_string]
+        executor = _engine_executors.pop(engine, None)
+    
+    engine.dispose()
+    if executor is not None:
+        executor.shutdown(wait=False)
+
 class DatabaseClient:
     """Client for database operations."""
     
     def __init__(self, config_manager: DataSourceConfigManager = Depends()):
         self.config_manager = config_manager
         self.engines = {}
-        self.sessions = {}
         
-        # Direct initialization for SQLite database
+        # The source configuration each engine was created from, keyed by
+        # source ID, so a reload can tell which engines are out of date
+        self.engine_configs: Dict[str, Optional[Dict[str, Any]]] = {}
+        
+        self._create_engines()
+    
+    def _create_engines(self) -> None:
+        """Create the engines of the default and all configured databases.
+        
+        This is done up front, so requests only ever look engines up.
+        """
+        source_ids = ["default"]
         try:
-            # Get the absolute path to the database file
-            db_path = os.path.join(os.getcwd(), "customer360.db")
-            logger.info(f"Using SQLite database at: {db_path}")
-            
-            # Create SQLite engine directly
-            connection_string = f"sqlite:///{db_path}"
-            engine = sqlalchemy.create_engine(
-                connection_string,
-                connect_args={"check_same_thread": False}
-            )
-            self.engines["default"] = engine
+            source_ids.extend(s for s in self.config_manager.get_all_data_sources("database") if s != "default")
         except Exception as e:
-            logger.error(f"Error creating SQLite engine: {str(e)}")
+            logger.error("Error reading database source configurations: %s", e)
+        
+        for source_id in source_ids:
+            try:
+                self._get_engine(source_id)
+            except Exception as e:
+                logger.error("Error creating database engine for source '%s': %s", source_id, e)
     
     def _get_engine(self, source_id: str = "default"):
         """Get a database engine for the specified source ID."""
-        if source_id in self.engines:
-            return self.engines[source_id]
+        engine = self.engines.get(source_id)
+        if engine is not None:
+            return engine
         
-        # Get the database configuration
+        # Get the database configuration; the default source falls back to
+        # the local SQLite database
         config = self.config_manager.get_data_source_config("database", source_id)
-        if not config:
-            raise DatabaseError(f"Database configuration not found for source '{source_id}'", source_id)
+        connection_string = config.get("connection_string") if config else None
+        if not connection_string:
+            if source_id != "default":
+                if not config:
+                    raise DatabaseError(f"Database configuration not found for source '{source_id}'", source_id)
+                raise DatabaseError(f"Missing connection string for database source '{source_id}'", source_id)
+            connection_string = _DEFAULT_CONNECTION_STRING
         
-        # Create the engine
+        # Get the shared engine
         try:
-            connection_string = config.get("connection_string")
-            if not connection_string:
-                raise DatabaseError(f"Missing connection string for database source '{source_id}'", source_id)
-            
-            engine = sqlalchemy.create_engine(connection_string)
+            engine = _get_shared_engine(connection_string, config)
             self.engines[source_id] = engine
+            self.engine_configs[source_id] = config
             return engine
         except Exception as e:
-            logger.error(f"Error creating database engine for source '{source_id}': {str(e)}")
+            logger.error("Error creating database engine for source '%s': %s", source_id, e)
             raise DatabaseError(f"Error connecting to database: {str(e)}", source_id)
     
-    def _get_session(self, source_id: str = "default"):
-        """Get a database session for the specified source ID."""
-        if source_id in self.sessions:
-            return self.sessions[source_id]()
+    def reload_engines(self) -> int:
+        """Recreate the engines of database sources whose configuration changed.
         
-        # Create a new session factory
-        engine = self._get_engine(source_id)
-        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-        self.sessions[source_id] = Session
-        return Session()
+        Call this after the data source configuration has been reloaded.
+        Engines of changed or removed sources, and of any other source sharing
+        them, are retired; new and changed sources get engines built from the
+        new configuration. Cached lookups are dropped, since they may come
+        from a database that is no longer configured.
+        
+        Returns:
+            The number of engines retired
+        """
+        retired = set()
+        for source_id, old_config in self.engine_configs.items():
+            if self.config_manager.get_data_source_config("database", source_id) != old_config:
+                retired.add(self.engines[source_id])
+        
+        for source_id, engine in list(self.engines.items()):
+            if engine in retired:
+                del self.engines[source_id]
+                self.engine_configs.pop(source_id, None)
+        for engine in retired:
+            _retire_shared_engine(engine)
+        
+        self._create_engines()
+        _lookup_cache.clear()
+        
+        logger.info("Reloaded database engines, %s retired", len(retired))
+        return len(retired)
     
-    async def query(self, query: str, params: Optional[Dict[str, Any]] = None, source_id: str = "default") -> List[Dict[str, Any]]:
+    async def query(
+        self,
+        query: Union[str, sqlalchemy.TextClause],
+        params: Optional[Dict[str, Any]] = None,
+        source_id: str = "default",
+        max_rows: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """Execute a raw SQL query.
         
         Args:
-            query: The SQL query string
+            query: The SQL query string, or a prepared text clause
             params: Query parameters
             source_id: The database source ID
+            max_rows: If provided, stop fetching after this many rows
             
         Returns:
             List of result rows as dictionaries
         """
-        params = params or {}
-        session = self._get_session(source_id)
+        if isinstance(query, str):
+            query = _text(query)
+        
+        # Queries block on the database driver, so run them off the event
+        # loop, on the executor sized to the engine's connection pool
+        executor = _engine_executors[self._get_engine(source_id)]
+        return await asyncio.get_running_loop().run_in_executor(
+            executor,
+            self._execute_query,
+            query,
+            params or {},
+            source_id,
+            max_rows
+        )
+    
+    def _execute_query(self, query: sqlalchemy.TextClause, params: Dict[str, Any], source_id: str, max_rows: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Execute a raw SQL query synchronously on a pooled connection.
+        
+        Args:
+            query: The prepared text clause
+            params: Query parameters
+            source_id: The database source ID
+            max_rows: If provided, stop fetching after this many rows
+            
+        Returns:
+            List of result rows as dictionaries
+        """
+        engine = self._get_engine(source_id)
         
         try:
-            result = session.execute(sqlalchemy.text(query), params)
-            columns = result.keys()
-            rows = [dict(zip(columns, row)) for row in result.fetchall()]
-            session.commit()
-            return rows
+            # Raw SQL needs no ORM session; the transaction commits when the
+            # block exits and rolls back if it raises
+            with engine.begin() as connection:
+                return _fetch_rows(connection, query, params, max_rows)
         except Exception as e:
-            session.rollback()
-            logger.error(f"Error executing query on database '{source_id}': {str(e)}")
+            logger.error("Error executing query on database '%s': %s", source_id, e)
             raise DatabaseError(f"Error executing query: {str(e)}", source_id)
-        finally:
-            session.close()
+    
+    def _execute_customer_360(self, customer_id: str, orders_limit: int, source_id: str) -> Optional[Dict[str, Any]]:
+        """Run all the lookups for a customer 360 view in one transaction.
+        
+        Args:
+            customer_id: The customer ID
+            orders_limit: Maximum number of recent orders to return
+            source_id: The database source ID
+            
+        Returns:
+            The customer record with its related data, or None if not found
+        """
+        engine = self._get_engine(source_id)
+        params = {"customer_id": customer_id, "limit": orders_limit}
+        
+        try:
+            with engine.begin() as connection:
+                customers = _fetch_rows(connection, _GET_CUSTOMER_QUERY, params, 1)
+                if not customers:
+                    return None
+                
+                result = {"customer": customers[0]}
+                for key, query, first_only in _CUSTOMER_360_QUERIES:
+                    rows = _fetch_rows(connection, query, params, 1 if first_only else None)
+                    result[key] = (rows[0] if rows else None) if first_only else rows
+                return result
+        except Exception as e:
+            logger.error("Error executing query on database '%s': %s", source_id, e)
+            raise DatabaseError(f"Error retrieving customer 360 view: {str(e)}", source_id)
+    
+    async def execute(self, query: Union[str, sqlalchemy.TextClause], params: Optional[Dict[str, Any]] = None, source_id: str = "default") -> int:
+        """Execute a write statement that returns no rows.
+        
+        Args:
+            query: The SQL statement string, or a prepared text clause
+            params: Statement parameters
+            source_id: The database source ID
+            
+        Returns:
+            The number of rows the statement affected
+        """
+        if isinstance(query, str):
+            query = _text(query)
+        
+        executor = _engine_executors[self._get_engine(source_id)]
+        return await asyncio.get_running_loop().run_in_executor(executor, self._execute, query, params or {}, source_id)
+    
+    def _execute(self, query: sqlalchemy.TextClause, params: Dict[str, Any], source_id: str) -> int:
+        """Execute a write statement synchronously, returning its row count."""
+        engine = self._get_engine(source_id)
+        
+        try:
+            with engine.begin() as connection:
+                return connection.execute(query, params).rowcount
+        except Exception as e:
+            logger.error("Error executing query on database '%s': %s", source_id, e)
+            raise DatabaseError(f"Error executing query: {str(e)}", source_id)
+    
+    async def execute_many(self, query: Union[str, sqlalchemy.TextClause], rows: List[Dict[str, Any]], source_id: str = "default") -> None:
+        """Execute a write statement once for each set of parameters.
+        
+        All the rows are sent with a single DB-API executemany call, in one
+        transaction, instead of a round trip per row.
+        
+        Args:
+            query: The SQL statement string, or a prepared text clause
+            rows: The parameters for each execution
+            source_id: The database source ID
+        """
+        if isinstance(query, str):
+            query = _text(query)
+        
+        executor = _engine_executors[self._get_engine(source_id)]
+        await asyncio.get_running_loop().run_in_executor(executor, self._execute_many, query, rows, source_id)
+    
+    def _execute_many(self, query: sqlalchemy.TextClause, rows: List[Dict[str, Any]], source_id: str) -> None:
+        """Execute a write statement for many parameter sets synchronously."""
+        engine = self._get_engine(source_id)
+        
+        try:
+            with engine.begin() as connection:
+                connection.execute(query, rows)
+        except Exception as e:
+            logger.error("Error executing query on database '%s': %s", source_id, e)
+            raise DatabaseError(f"Error executing query: {str(e)}", source_id)
+    
+    async def _query_one(self, query: Union[str, sqlalchemy.TextClause], params: Dict[str, Any], source_id: str, description: str) -> Optional[Dict[str, Any]]:
+        """Execute a query and return only its first row.
+        
+        Args:
+            query: The SQL query string, or a prepared text clause
+            params: Query parameters
+            source_id: The database source ID
+            description: What is being retrieved, used in error messages
+            
+        Returns:
+            The first result row or None if there are no rows
+        """
+        try:
+            # Only the first row is used, so don't fetch the rest
+            result = await self.query(query, params, source_id, max_rows=1)
+            if not result:
+                return None
+            return result[0]
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving {description}: {str(e)}", source_id)
+    
+    async def _cached_query_one(self, query: sqlalchemy.TextClause, customer_id: str, source_id: str, description: str) -> Optional[Dict[str, Any]]:
+        """Look up a customer's row, reusing it for a while once found.
+        
+        Args:
+            query: The prepared text clause, taking a customer_id parameter
+            customer_id: The customer ID
+            source_id: The database source ID
+            description: What is being retrieved, used in error messages
+            
+        Returns:
+            A copy of the row or None if there is none
+        """
+        cache_key = (source_id, customer_id, description)
+        row = _lookup_cache.get(cache_key)
+        if row is None:
+            row = await self._query_one(query, {"customer_id": customer_id}, source_id, description)
+            if row is None:
+                return None
+            _lookup_cache.set(cache_key, row)
+        
+        # Callers get their own copy, so they can't change the cached row
+        return dict(row)
+    
+    @staticmethod
+    def invalidate_customer(customer_id: str, source_id: str = "default") -> None:
+        """Drop a customer's cached lookups so the next reads query the database.
+        
+        Args:
+            customer_id: The customer ID
+            source_id: The database source ID
+        """
+        for description in _CACHED_LOOKUPS:
+            _lookup_cache.pop((source_id, customer_id, description))
+    
+    async def warmup(self) -> int:
+        """Open a pooled connection to every configured database.
+        
+        Running a trivial query creates each source's engine and leaves a
+        configured connection in its pool, so the first real query doesn't
+        pay for connecting. Sources that fail are logged and left to connect
+        on first use.
+        
+        Returns:
+            The number of databases that answered
+        """
+        warmed = 0
+        for source_id in self.config_manager.get_all_data_sources("database"):
+            try:
+                await self.query(_PING_QUERY, None, source_id)
+                warmed += 1
+            except DatabaseError as e:
+                logger.warning("Could not warm up database source '%s': %s", source_id, e)
+        return warmed
     
     # Example operations for the customer domain
     
@@ -109,30 +565,30 @@ class DatabaseClient:
         Returns:
             The customer data or None if not found
         """
-        query = "SELECT * FROM customers WHERE customer_id = :customer_id"
         params = {"customer_id": customer_id}
         
-        try:
-            result = await self.query(query, params, source_id)
-            if not result:
-                return None
-            return result[0]
-        except Exception as e:
-            raise DatabaseError(f"Error retrieving customer: {str(e)}", source_id)
+        return await self._query_one(_GET_CUSTOMER_QUERY, params, source_id, "customer")
     
-    async def list_customers(self, limit: int = 10, offset: int = 0, source_id: str = "default") -> List[Dict[str, Any]]:
-        """List customers with pagination.
+    async def list_customers(self, limit: int = 10, offset: int = 0, cursor: Optional[Sequence[Any]] = None,
+                             source_id: str = "default") -> List[Dict[str, Any]]:
+        """List customers, newest first, with pagination.
         
         Args:
             limit: Maximum number of customers to return
-            offset: Pagination offset
+            offset: Pagination offset, ignored when a cursor is given
+            cursor: The (created_at, customer_id) of the last customer of the
+                previous page, to continue after it
             source_id: The database source ID
             
         Returns:
             List of customer records
         """
-        query = "SELECT * FROM customers ORDER BY created_at DESC LIMIT :limit OFFSET :offset"
-        params = {"limit": limit, "offset": offset}
+        if cursor is None:
+            query = _LIST_CUSTOMERS_QUERY
+            params = {"limit": limit, "offset": offset}
+        else:
+            query = _LIST_CUSTOMERS_AFTER_QUERY
+            params = {"limit": limit, "cursor_created_at": cursor[0], "cursor_customer_id": cursor[1]}
         
         try:
             return await self.query(query, params, source_id)
@@ -149,13 +605,75 @@ class DatabaseClient:
         Returns:
             The created customer record
         """
-        # Generate a unique customer ID
-        customer_id = f"cust_{uuid.uuid4().hex[:10]}"
+        data = self._new_customer_row(customer_data, datetime.utcnow())
+        
+        try:
+            result = await self.query(_INSERT_CUSTOMER_QUERY, data, source_id)
+            if not result:
+                raise DatabaseError("Failed to create customer", source_id)
+            return result[0]
+        except Exception as e:
+            raise DatabaseError(f"Error creating customer: {str(e)}", source_id)
+    
+    async def create_customers(self, customers_data: List[Dict[str, Any]], source_id: str = "default") -> List[Dict[str, Any]]:
+        """Create several customers with batched inserts in one transaction.
+        
+        Args:
+            customers_data: The data of each customer
+            source_id: The database source ID
+            
+        Returns:
+            The created customer records, in the order given
+        """
         now = datetime.utcnow()
+        rows = [self._new_customer_row(customer_data, now) for customer_data in customers_data]
+        if not rows:
+            return []
+        
+        executor = _engine_executors[self._get_engine(source_id)]
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, self._insert_customers, rows, source_id)
+        except Exception as e:
+            raise DatabaseError(f"Error creating customers: {str(e)}", source_id)
+    
+    def _insert_customers(self, rows: List[Dict[str, Any]], source_id: str) -> List[Dict[str, Any]]:
+        """Insert customer rows synchronously in one transaction.
+        
+        The rows go in as multi-row INSERT ... RETURNING statements, so the
+        records returned are the stored ones, exactly as create_customer
+        returns them, at one round trip per batch.
+        
+        Args:
+            rows: The new customers rows
+            source_id: The database source ID
+            
+        Returns:
+            The created customer records, in the order of the rows
+        """
+        engine = self._get_engine(source_id)
+        created = {}
         
-        # Prepare the data
-        data = {
-            "customer_id": customer_id,
+        try:
+            with engine.begin() as connection:
+                for start in range(0, len(rows), _INSERT_CUSTOMERS_BATCH_SIZE):
+                    batch = rows[start:start + _INSERT_CUSTOMERS_BATCH_SIZE]
+                    params = {f"{col}_{i}": row[col] for i, row in enumerate(batch) for col in _CUSTOMER_COLUMNS}
+                    # RETURNING rows come back in no guaranteed order
+                    for record in _fetch_rows(connection, _insert_customers_query(len(batch)), params):
+                        created[record["customer_id"]] = record
+        except Exception as e:
+            logger.error("Error executing query on database '%s': %s", source_id, e)
+            raise DatabaseError(f"Error executing query: {str(e)}", source_id)
+        
+        return [created[row["customer_id"]] for row in rows]
+    
+    @staticmethod
+    def _new_customer_row(customer_data: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+        """Build the customers row for a new customer."""
+        return {
+            # Generate a unique customer ID from 40 random bits, formatted
+            # directly as 10 hex characters
+            "customer_id": f"cust_{secrets.token_hex(5)}",
             "name": customer_data.get("name"),
             "email": customer_data.get("email"),
             "phone": customer_data.get("phone"),
@@ -164,19 +682,6 @@ class DatabaseClient:
             "created_at": now,
             "updated_at": now
         }
-        
-        # Build the query
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(f":{k}" for k in data.keys())
-        query = f"INSERT INTO customers ({columns}) VALUES ({placeholders}) RETURNING *"
-        
-        try:
-            result = await self.query(query, data, source_id)
-            if not result:
-                raise DatabaseError("Failed to create customer", source_id)
-            return result[0]
-        except Exception as e:
-            raise DatabaseError(f"Error creating customer: {str(e)}", source_id)
     
     async def update_customer(self, customer_id: str, customer_data: Dict[str, Any], source_id: str = "default") -> Optional[Dict[str, Any]]:
         """Update an existing customer.
@@ -189,27 +694,25 @@ class DatabaseClient:
         Returns:
             The updated customer record or None if not found
         """
-        # Check if the customer exists
-        existing = await self.get_customer(customer_id, source_id)
-        if not existing:
-            return None
-        
         # Prepare the data for update
-        data = {k: v for k, v in customer_data.items() if k in ["name", "email", "phone", "address", "date_of_birth"]}
+        data = {k: v for k, v in customer_data.items() if k in _UPDATABLE_CUSTOMER_COLUMNS}
         data["updated_at"] = datetime.utcnow()
         data["customer_id"] = customer_id
         
-        # Build the update query
+        # Build the update query; RETURNING reports a missing customer as no
+        # rows, so no separate existence check is needed
         set_clause = ", ".join(f"{k} = :{k}" for k in data.keys() if k != "customer_id")
-        query = f"UPDATE customers SET {set_clause} WHERE customer_id = :customer_id RETURNING *"
+        query = f"UPDATE customers SET {set_clause} WHERE customer_id = :customer_id RETURNING {_CUSTOMER_SELECT_LIST}"
         
         try:
             result = await self.query(query, data, source_id)
-            if not result:
-                return None
-            return result[0]
         except Exception as e:
             raise DatabaseError(f"Error updating customer: {str(e)}", source_id)
+        
+        if not result:
+            return None
+        self.invalidate_customer(customer_id, source_id)
+        return result[0]
     
     async def delete_customer(self, customer_id: str, source_id: str = "default") -> bool:
         """Delete a customer.
@@ -221,19 +724,43 @@ class DatabaseClient:
         Returns:
             True if deleted, False if not found
         """
-        # Check if the customer exists
-        existing = await self.get_customer(customer_id, source_id)
-        if not existing:
-            return False
-        
-        query = "DELETE FROM customers WHERE customer_id = :customer_id"
         params = {"customer_id": customer_id}
         
+        # The affected row count reports whether the customer existed, without
+        # a separate lookup or a RETURNING clause
         try:
-            await self.query(query, params, source_id)
-            return True
+            deleted = await self.execute(_DELETE_CUSTOMER_QUERY, params, source_id)
         except Exception as e:
             raise DatabaseError(f"Error deleting customer: {str(e)}", source_id)
+        
+        self.invalidate_customer(customer_id, source_id)
+        return deleted > 0
+    
+    async def get_customer_360(self, customer_id: str, orders_limit: int = 5, source_id: str = "default") -> Optional[Dict[str, Any]]:
+        """Get a customer along with their related data from the database.
+        
+        The features, credit score, recent orders and churn prediction
+        lookups run back to back on one pooled connection in a single
+        worker thread, instead of taking a connection and a thread hop each.
+        
+        Args:
+            customer_id: The customer ID
+            orders_limit: Maximum number of recent orders to return
+            source_id: The database source ID
+            
+        Returns:
+            A dict with the customer record under "customer" and the related
+            data under "features", "credit_score", "recent_orders" and
+            "churn_prediction", or None if the customer is not found
+        """
+        executor = _engine_executors[self._get_engine(source_id)]
+        return await asyncio.get_running_loop().run_in_executor(
+            executor,
+            self._execute_customer_360,
+            customer_id,
+            orders_limit,
+            source_id
+        )
     
     async def get_customer_features(self, customer_id: str, source_id: str = "default") -> Optional[Dict[str, Any]]:
         """Get customer features from the feature store.
@@ -246,16 +773,7 @@ class DatabaseClient:
             The customer features or None if not found
         """
         # Query the features from the customer_features table
-        query = "SELECT * FROM customer_features WHERE customer_id = :customer_id"
-        params = {"customer_id": customer_id}
-        
-        try:
-            result = await self.query(query, params, source_id)
-            if not result:
-                return None
-            return result[0]
-        except Exception as e:
-            raise DatabaseError(f"Error retrieving customer features: {str(e)}", source_id)
+        return await self._cached_query_one(_FEATURES_QUERY, customer_id, source_id, "customer features")
     
     async def get_customer_credit_score(self, customer_id: str, source_id: str = "default") -> Optional[Dict[str, Any]]:
         """Get a customer's credit score.
@@ -267,16 +785,7 @@ class DatabaseClient:
         Returns:
             The credit score data or None if not found
         """
-        query = "SELECT * FROM credit_scores WHERE customer_id = :customer_id"
-        params = {"customer_id": customer_id}
-        
-        try:
-            result = await self.query(query, params, source_id)
-            if not result:
-                return None
-            return result[0]
-        except Exception as e:
-            raise DatabaseError(f"Error retrieving credit score: {str(e)}", source_id)
+        return await self._cached_query_one(_CREDIT_SCORE_QUERY, customer_id, source_id, "credit score")
     
     async def get_customer_recent_orders(self, customer_id: str, limit: int = 5, source_id: str = "default") -> List[Dict[str, Any]]:
         """Get a customer's recent orders.
@@ -289,11 +798,10 @@ class DatabaseClient:
         Returns:
             List of recent orders
         """
-        query = "SELECT * FROM orders WHERE customer_id = :customer_id ORDER BY order_date DESC LIMIT :limit"
         params = {"customer_id": customer_id, "limit": limit}
         
         try:
-            return await self.query(query, params, source_id)
+            return await self.query(_RECENT_ORDERS_QUERY, params, source_id)
         except Exception as e:
             raise DatabaseError(f"Error retrieving recent orders: {str(e)}", source_id)
     
@@ -307,13 +815,4 @@ class DatabaseClient:
         Returns:
             The churn prediction data or None if not found
         """
-        query = "SELECT * FROM churn_predictions WHERE customer_id = :customer_id ORDER BY created_at DESC LIMIT 1"
-        params = {"customer_id": customer_id}
-        
-        try:
-            result = await self.query(query, params, source_id)
-            if not result:
-                return None
-            return result[0]
-        except Exception as e:
-            raise DatabaseError(f"Error retrieving churn prediction: {str(e)}", source_id)
+        return await self._cached_query_one(_CHURN_PREDICTION_QUERY, customer_id, source_id, "churn prediction")
@@ -1,11 +1,79 @@
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Normalized RETURNING option: False, True for all columns, or a column tuple
+Returning = Union[bool, Tuple[str, ...]]
+
+def _returning_key(returning: Union[bool, List[str]]) -> Returning:
+    """Normalize a RETURNING option into a hashable cache key."""
+    if not returning:
+        return False
+    if returning is True:
+        return True
+    return tuple(returning)
+
+def _returning_clause(returning: Returning) -> str:
+    """Build the RETURNING clause for a list of columns, or all columns if True."""
+    if not returning:
+        return ""
+    if returning is True:
+        return " RETURNING *"
+    return " RETURNING " + ", ".join(returning)
+
+# The SQL text only depends on the shape of a query, never on the parameter
+# values, so it is built once per shape and reused
+
+@lru_cache(maxsize=256)
+def _select_sql(table: str, columns: Tuple[str, ...], where_columns: Tuple[str, ...], order_by: Optional[str],
+                has_limit: bool, has_offset: bool) -> str:
+    """Build the SQL text of a SELECT query."""
+    columns_str = "*" if not columns else ", ".join(columns)
+    query = f"SELECT {columns_str} FROM {table}"
+    
+    # Add WHERE conditions
+    if where_columns:
+        query += " WHERE " + " AND ".join(f"{col} = :param_{i}" for i, col in enumerate(where_columns))
+    
+    # Add ORDER BY
+    if order_by:
+        query += f" ORDER BY {order_by}"
+    
+    # Add LIMIT
+    if has_limit:
+        query += " LIMIT :_limit"
+    
+    # Add OFFSET
+    if has_offset:
+        query += " OFFSET :_offset"
+    
+    return query
+
+@lru_cache(maxsize=256)
+def _insert_sql(table: str, columns: Tuple[str, ...], returning: Returning) -> str:
+    """Build the SQL text of an INSERT query."""
+    columns_str = ", ".join(columns)
+    placeholders_str = ", ".join(f":{col}" for col in columns)
+    return f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders_str})" + _returning_clause(returning)
+
+@lru_cache(maxsize=256)
+def _update_sql(table: str, set_columns: Tuple[str, ...], where_columns: Tuple[str, ...], returning: Returning) -> str:
+    """Build the SQL text of an UPDATE query."""
+    set_clause = ", ".join(f"{col} = :set_{i}" for i, col in enumerate(set_columns))
+    where_clause = " AND ".join(f"{col} = :where_{i}" for i, col in enumerate(where_columns))
+    return f"UPDATE {table} SET {set_clause} WHERE {where_clause}" + _returning_clause(returning)
+
+@lru_cache(maxsize=256)
+def _delete_sql(table: str, where_columns: Tuple[str, ...], returning: Returning) -> str:
+    """Build the SQL text of a DELETE query."""
+    where_clause = " AND ".join(f"{col} = :where_{i}" for i, col in enumerate(where_columns))
+    return f"DELETE FROM {table} WHERE {where_clause}" + _returning_clause(returning)
 
 class SQLQueryBuilder:
     """Utility for building SQL queries."""
     
     @staticmethod
-    def build_select_query(table: str, columns: Optional[List[str]] = None, where: Optional[Dict[str, Any]] = None, 
-                           order_by: Optional[str] = None, limit: Optional[int] = None, 
+    def build_select_query(table: str, columns: Optional[List[str]] = None, where: Optional[Dict[str, Any]] = None,
+                           order_by: Optional[str] = None, limit: Optional[int] = None,
                            offset: Optional[int] = None) -> tuple[str, Dict[str, Any]]:
         """Build a SELECT query.
         
@@ -20,127 +88,67 @@ class SQLQueryBuilder:
         Returns:
             Tuple of (query_string, params_dict)
         """
-        columns_str = "*" if not columns else ", ".join(columns)
-        query = f"SELECT {columns_str} FROM {table}"
-        
-        params = {}
-        where_clauses = []
-        
-        # Add WHERE conditions
-        if where:
-            for i, (col, val) in enumerate(where.items()):
-                param_name = f"param_{i}"
-                where_clauses.append(f"{col} = :{param_name}")
-                params[param_name] = val
-                
-            if where_clauses:
-                query += " WHERE " + " AND ".join(where_clauses)
+        where = where or {}
+        query = _select_sql(table, tuple(columns or ()), tuple(where), order_by, limit is not None, offset is not None)
+        params = {f"param_{i}": val for i, val in enumerate(where.values())}
         
-        # Add ORDER BY
-        if order_by:
-            query += f" ORDER BY {order_by}"
-        
-        # Add LIMIT
+        # Bound rather than inlined, so every page shares one statement
         if limit is not None:
-            query += f" LIMIT {limit}"
-        
-        # Add OFFSET
+            params["_limit"] = limit
         if offset is not None:
-            query += f" OFFSET {offset}"
+            params["_offset"] = offset
         
         return query, params
     
     @staticmethod
-    def build_insert_query(table: str, data: Dict[str, Any], returning: bool = True) -> tuple[str, Dict[str, Any]]:
+    def build_insert_query(table: str, data: Dict[str, Any], returning: Union[bool, List[str]] = True) -> tuple[str, Dict[str, Any]]:
         """Build an INSERT query.
         
         Args:
             table: The table name
             data: Dictionary of column-value pairs to insert
-            returning: Whether to include RETURNING *
+            returning: Columns to return, or True to return all columns
             
         Returns:
             Tuple of (query_string, params_dict)
         """
-        columns = list(data.keys())
-        columns_str = ", ".join(columns)
-        
-        placeholders = [f":{col}" for col in columns]
-        placeholders_str = ", ".join(placeholders)
-        
-        query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders_str})"
-        
-        if returning:
-            query += " RETURNING *"
+        query = _insert_sql(table, tuple(data), _returning_key(returning))
         
         return query, data
     
     @staticmethod
-    def build_update_query(table: str, data: Dict[str, Any], where: Dict[str, Any], returning: bool = True) -> tuple[str, Dict[str, Any]]:
+    def build_update_query(table: str, data: Dict[str, Any], where: Dict[str, Any], returning: Union[bool, List[str]] = True) -> tuple[str, Dict[str, Any]]:
         """Build an UPDATE query.
         
         Args:
             table: The table name
             data: Dictionary of column-value pairs to update
             where: Dictionary of column-value pairs for WHERE clause
-            returning: Whether to include RETURNING *
+            returning: Columns to return, or True to return all columns
             
         Returns:
             Tuple of (query_string, params_dict)
         """
-        params = {}
-        
-        # Set clause
-        set_items = []
-        for i, (col, val) in enumerate(data.items()):
-            param_name = f"set_{i}"
-            set_items.append(f"{col} = :{param_name}")
-            params[param_name] = val
-        
-        set_clause = ", ".join(set_items)
+        query = _update_sql(table, tuple(data), tuple(where), _returning_key(returning))
         
-        # Where clause
-        where_items = []
-        for i, (col, val) in enumerate(where.items()):
-            param_name = f"where_{i}"
-            where_items.append(f"{col} = :{param_name}")
-            params[param_name] = val
-        
-        where_clause = " AND ".join(where_items)
-        
-        query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
-        
-        if returning:
-            query += " RETURNING *"
+        params = {f"set_{i}": val for i, val in enumerate(data.values())}
+        params.update((f"where_{i}", val) for i, val in enumerate(where.values()))
         
         return query, params
     
     @staticmethod
-    def build_delete_query(table: str, where: Dict[str, Any], returning: bool = False) -> tuple[str, Dict[str, Any]]:
+    def build_delete_query(table: str, where: Dict[str, Any], returning: Union[bool, List[str]] = False) -> tuple[str, Dict[str, Any]]:
         """Build a DELETE query.
         
         Args:
             table: The table name
             where: Dictionary of column-value pairs for WHERE clause
-            returning: Whether to include RETURNING *
+            returning: Columns to return, or True to return all columns
             
         Returns:
             Tuple of (query_string, params_dict)
         """
-        params = {}
-        
-        # Where clause
-        where_items = []
-        for i, (col, val) in enumerate(where.items()):
-            param_name = f"where_{i}"
-            where_items.append(f"{col} = :{param_name}")
-            params[param_name] = val
-        
-        where_clause = " AND ".join(where_items)
-        
-        query = f"DELETE FROM {table} WHERE {where_clause}"
-        
-        if returning:
-            query += " RETURNING *"
+        query = _delete_sql(table, tuple(where), _returning_key(returning))
+        params = {f"where_{i}": val for i, val in enumerate(where.values())}
         
         return query, params
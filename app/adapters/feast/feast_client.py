@@ -1,7 +1,10 @@
 from typing import Any, Dict, List, Optional
 from fastapi import Depends
 from datetime import datetime
+import asyncio
+import functools
 import importlib
+import threading
 
 from app.config.data_source_config_manager import DataSourceConfigManager
 from app.common.errors.custom_exceptions import FeastError
@@ -9,20 +12,91 @@ from app.common.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+@functools.lru_cache(maxsize=None)
+def _import_feast():
+    """Import the Feast module once per process.
+    
+    Returns:
+        The feast module, or None if it is not installed
+    """
+    try:
+        feast = importlib.import_module("feast")
+        logger.info("Feast module loaded successfully")
+        return feast
+    except ImportError:
+        logger.warning("Feast module not found. Feature store operations will not be available.")
+        return None
+
+def preload_feast() -> None:
+    """Import the Feast module ahead of its first use.
+    
+    Importing Feast takes long enough to be felt by the first feature request,
+    so the application calls this from a background thread at startup.
+    """
+    _import_feast()
+
+# Feature stores shared by all client instances, keyed by repo path
+_feature_stores: Dict[str, Any] = {}
+_feature_stores_lock = threading.Lock()
+
+def _load_feature_store(feast: Any, repo_path: str) -> Any:
+    """Load a Feast feature store, reusing one instance per repo path.
+    
+    Building a FeatureStore parses the feature repository, so it is done once
+    per process under a lock instead of once per client instance.
+    
+    Args:
+        feast: The imported feast module
+        repo_path: Path to the feature repository
+        
+    Returns:
+        The shared feature store
+    """
+    feature_store = _feature_stores.get(repo_path)
+    if feature_store is None:
+        with _feature_stores_lock:
+            feature_store = _feature_stores.get(repo_path)
+            if feature_store is None:
+                feature_store = feast.FeatureStore(repo_path=repo_path)
+                _feature_stores[repo_path] = feature_store
+    return feature_store
+
+def _fetch_online_features(feature_store: Any, entity_rows: List[Dict[str, Any]], feature_refs: List[str]) -> Dict[str, List[Any]]:
+    """Fetch online features and convert them to lists of values per feature.
+    
+    The Feast SDK is synchronous and blocks on the online store, so this runs
+    on a worker thread, conversion included.
+    """
+    features = feature_store.get_online_features(
+        entity_rows=entity_rows,
+        features=feature_refs
+    )
+    return features.to_dict()
+
 class FeastClient:
     """Client for Feast feature store operations."""
     
     def __init__(self, config_manager: DataSourceConfigManager = Depends()):
         self.config_manager = config_manager
         self.feature_stores = {}
+    
+    @property
+    def feast(self) -> Any:
+        """The Feast module, or None if it is not installed.
         
-        # Check if Feast is installed
-        try:
-            self.feast = importlib.import_module("feast")
-            logger.info("Feast module loaded successfully")
-        except ImportError:
-            logger.warning("Feast module not found. Feature store operations will not be available.")
-            self.feast = None
+        The import is deferred until first use and attempted only once.
+        """
+        return _import_feast()
+    
+    def reload_feature_stores(self) -> None:
+        """Drop all loaded feature stores, e.g. after a configuration reload.
+        
+        Feature stores are loaded again from the configured repo paths on
+        their next use, which also picks up changes to the repositories.
+        """
+        self.feature_stores.clear()
+        with _feature_stores_lock:
+            _feature_stores.clear()
     
     def _get_feature_store(self, source_id: str = "default"):
         """Get a Feast feature store for the specified source ID."""
@@ -43,11 +117,11 @@ class FeastClient:
             if not repo_path:
                 raise FeastError(f"Missing repo path for Feast source '{source_id}'", source_id)
             
-            feature_store = self.feast.FeatureStore(repo_path=repo_path)
+            feature_store = _load_feature_store(self.feast, repo_path)
             self.feature_stores[source_id] = feature_store
             return feature_store
         except Exception as e:
-            logger.error(f"Error creating Feast feature store for source '{source_id}': {str(e)}")
+            logger.error("Error creating Feast feature store for source '%s': %s", source_id, e)
             raise FeastError(f"Error initializing Feast feature store: {str(e)}", source_id)
     
     async def get_online_features(self, entity_rows: List[Dict[str, Any]], feature_refs: List[str], 
@@ -68,20 +142,17 @@ class FeastClient:
         feature_store = self._get_feature_store(source_id)
         
         try:
-            logger.info(f"Retrieving features {feature_refs} for {len(entity_rows)} entities from source '{source_id}'")
-            features = feature_store.get_online_features(
-                entity_rows=entity_rows,
-                features=feature_refs
+            logger.info("Retrieving features %s for %s entities from source '%s'", feature_refs, len(entity_rows), source_id)
+            # Keep the event loop serving other requests during the lookup
+            return await asyncio.get_running_loop().run_in_executor(
+                None,
+                _fetch_online_features,
+                feature_store,
+                entity_rows,
+                feature_refs
             )
-            
-            # Convert Feast response to dictionary
-            result = {}
-            for feature_name in features.keys():
-                result[feature_name] = features[feature_name]
-            
-            return result
         except Exception as e:
-            logger.error(f"Error retrieving features from source '{source_id}': {str(e)}")
+            logger.error("Error retrieving features from source '%s': %s", source_id, e)
             raise FeastError(f"Failed to retrieve features: {str(e)}", source_id)
     
     # Example operations for the customer domain
@@ -98,6 +169,21 @@ class FeastClient:
         Returns:
             Dictionary of feature values
         """
+        customers_features = await self.get_customers_features([customer_id], feature_refs, source_id)
+        return customers_features.get(customer_id, {})
+    
+    async def get_customers_features(self, customer_ids: List[str], feature_refs: Optional[List[str]] = None,
+                                     source_id: str = "default") -> Dict[str, Dict[str, Any]]:
+        """Get features for several customers with one online store lookup.
+        
+        Args:
+            customer_ids: The customer IDs
+            feature_refs: List of feature references (or None for default set)
+            source_id: The feature store source ID
+            
+        Returns:
+            Dictionary mapping each customer ID to its feature values
+        """
         # Get default feature references if not provided
         if feature_refs is None:
             # Get from configuration
@@ -105,23 +191,24 @@ class FeastClient:
             default_features = config.get("default_customer_features", [])
             feature_refs = default_features
         
-        # Create entity row
-        entity_row = {"customer_id": customer_id}
+        # One entity row per customer, all fetched in a single request
+        entity_rows = [{"customer_id": customer_id} for customer_id in customer_ids]
         
         try:
             features_result = await self.get_online_features(
-                entity_rows=[entity_row],
+                entity_rows=entity_rows,
                 feature_refs=feature_refs,
                 source_id=source_id
             )
             
-            # Convert to a simpler format with a single value per feature
-            result = {}
+            # Feast returns a column of values per feature, in entity row
+            # order; turn the columns into one dict of values per customer
+            result = {customer_id: {} for customer_id in customer_ids}
             for feature_name, values in features_result.items():
-                if values and len(values) > 0:
-                    result[feature_name] = values[0]
+                for customer_id, value in zip(customer_ids, values or ()):
+                    result[customer_id][feature_name] = value
             
             return result
         except Exception as e:
-            logger.error(f"Error retrieving features for customer {customer_id}: {str(e)}")
+            logger.error("Error retrieving features for customers %s: %s", customer_ids, e)
             raise FeastError(f"Failed to retrieve customer features: {str(e)}", source_id)
@@ -1,8 +1,8 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from fastapi import Depends
-import json
 
 from app.adapters.api.http_client import HttpClient
+from app.adapters.ml.prediction_request_builder import PredictionRequestBuilder
 from app.config.data_source_config_manager import DataSourceConfigManager
 from app.common.errors.custom_exceptions import ModelError
 from app.common.utils.logging_utils import get_logger
@@ -19,26 +19,45 @@ class ModelClient:
     ):
         self.config_manager = config_manager
         self.http_client = http_client
+        
+        # Resolved prediction endpoints keyed by (source ID, model ID)
+        self.model_endpoints: Dict[Tuple[str, str], str] = {}
     
-    async def predict(self, model_id: str, features: Dict[str, Any], source_id: str = "default") -> Dict[str, Any]:
-        """Get predictions from an ML model.
+    def preload_models(self) -> int:
+        """Resolve the endpoints of all configured models ahead of the first prediction.
+        
+        Any previously resolved endpoints are dropped first, so this is also
+        used to pick up reloaded ML service configuration.
         
-        Args:
-            model_id: The model identifier
-            features: Model input features
-            source_id: The ML service source ID
-            
         Returns:
-            Prediction results
+            The number of model endpoints resolved
         """
+        self.model_endpoints.clear()
+        
+        for source_id, source_config in self.config_manager.get_all_data_sources("ml").items():
+            for model_id in (source_config or {}).get("models") or ():
+                try:
+                    self._get_model_endpoint(model_id, source_id)
+                except ModelError as e:
+                    logger.warning("Skipping model preload: %s", e)
+        
+        logger.info("Preloaded %s model endpoints", len(self.model_endpoints))
+        return len(self.model_endpoints)
+    
+    def _get_model_endpoint(self, model_id: str, source_id: str) -> str:
+        """Get the prediction endpoint for a model from the ML service configuration."""
+        endpoint = self.model_endpoints.get((source_id, model_id))
+        if endpoint is not None:
+            return endpoint
+        
         # Get the ML service configuration
         config = self.config_manager.get_data_source_config("ml", source_id)
         if not config:
             raise ModelError(f"ML service configuration not found for source '{source_id}'", source_id)
         
         # Find the model endpoint
-        models = config.get("models", {})
-        model_config = models.get(model_id)
+        models = config.get("models")
+        model_config = models.get(model_id) if models else None
         if not model_config:
             raise ModelError(f"Model '{model_id}' not found in ML service '{source_id}'", source_id)
         
@@ -46,6 +65,22 @@ class ModelClient:
         if not endpoint:
             raise ModelError(f"Endpoint not defined for model '{model_id}' in ML service '{source_id}'", source_id)
         
+        self.model_endpoints[(source_id, model_id)] = endpoint
+        return endpoint
+    
+    async def predict(self, model_id: str, features: Dict[str, Any], source_id: str = "default") -> Dict[str, Any]:
+        """Get predictions from an ML model.
+        
+        Args:
+            model_id: The model identifier
+            features: Model input features
+            source_id: The ML service source ID
+            
+        Returns:
+            Prediction results
+        """
+        endpoint = self._get_model_endpoint(model_id, source_id)
+        
         # Prepare request data
         request_data = {
             "model_id": model_id,
@@ -53,7 +88,7 @@ class ModelClient:
         }
         
         try:
-            logger.info(f"Making prediction request for model '{model_id}' in source '{source_id}'")
+            logger.info("Making prediction request for model '%s' in source '%s'", model_id, source_id)
             
             # Send prediction request
             response = await self.http_client.post(
@@ -65,9 +100,43 @@ class ModelClient:
             return response
             
         except Exception as e:
-            logger.error(f"Error making prediction with model '{model_id}' in source '{source_id}': {str(e)}")
+            logger.error("Error making prediction with model '%s' in source '%s': %s", model_id, source_id, e)
             raise ModelError(f"Failed to get prediction: {str(e)}", source_id)
     
+    async def predict_batch(self, model_id: str, instances: List[Dict[str, Any]], source_id: str = "default") -> List[Any]:
+        """Get predictions for several sets of features in a single request.
+        
+        Args:
+            model_id: The model identifier
+            instances: List of model input features, one entry per prediction
+            source_id: The ML service source ID
+            
+        Returns:
+            Prediction results in the same order as the instances
+        """
+        if not instances:
+            return []
+        
+        endpoint = self._get_model_endpoint(model_id, source_id)
+        
+        # One request for the whole batch instead of one per instance
+        request_data = PredictionRequestBuilder.build_batch_prediction_request(instances, model_id)
+        
+        try:
+            logger.info("Making batch prediction request for %s instances of model '%s' in source '%s'", len(instances), model_id, source_id)
+            
+            response = await self.http_client.post(
+                endpoint,
+                data=request_data,
+                source_id=source_id
+            )
+            
+            return PredictionRequestBuilder.extract_prediction_results(response)
+            
+        except Exception as e:
+            logger.error("Error making batch prediction with model '%s' in source '%s': %s", model_id, source_id, e)
+            raise ModelError(f"Failed to get batch prediction: {str(e)}", source_id)
+    
     # Example operations for the customer domain
     
     async def predict_customer_churn(self, customer_features: Dict[str, Any], source_id: str = "default") -> Dict[str, Any]:
@@ -83,5 +152,5 @@ class ModelClient:
         try:
             return await self.predict("customer_churn", customer_features, source_id)
         except Exception as e:
-            logger.error(f"Error predicting customer churn: {str(e)}")
+            logger.error("Error predicting customer churn: %s", e)
             raise ModelError(f"Failed to predict customer churn: {str(e)}", source_id)
@@ -1,6 +1,55 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 import json
 
+from app.common.utils.identity_cache import IdentityCache
+
+def _to_array(value: Any) -> List[Any]:
+    """Convert a feature value to a list, parsing JSON strings."""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        # Try to parse as JSON
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return [value]
+    return [value]
+
+# Converters for the schema feature types; other types are passed through
+_FEATURE_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "string": str,
+    "array": _to_array
+}
+
+# Compiled feature schemas, keyed by schema. Callers may pass a new schema
+# object on every call, so the cache is bounded.
+_compiled_schemas = IdentityCache(maxsize=256)
+
+def clear_compiled_schemas() -> None:
+    """Forget all compiled feature schemas, e.g. after a reload."""
+    _compiled_schemas.clear()
+
+def _compile_schema(schema: Dict[str, Any]) -> Dict[str, Optional[Callable[[Any], Any]]]:
+    """Resolve the converter of every feature in a schema once.
+    
+    Args:
+        schema: Schema defining feature types
+        
+    Returns:
+        A mapping of feature names to converters, or None for pass-through
+    """
+    return _compiled_schemas.get(schema, _resolve_converters)
+
+def _resolve_converters(schema: Dict[str, Any]) -> Dict[str, Optional[Callable[[Any], Any]]]:
+    """Map each feature of a schema to the converter of its type."""
+    return {
+        feature_name: _FEATURE_CONVERTERS.get(feature_schema.get("type"))
+        for feature_name, feature_schema in schema.get("properties", {}).items()
+    }
+
 class PredictionRequestBuilder:
     """Builds prediction requests for ML services."""
     
@@ -19,38 +68,18 @@ class PredictionRequestBuilder:
             return features
             
         result = {}
-        schema_properties = schema.get("properties", {})
+        converters = _compile_schema(schema)
         
         for feature_name, value in features.items():
             # Skip if feature not in schema
-            if feature_name not in schema_properties:
+            if feature_name not in converters:
                 continue
-                
-            feature_schema = schema_properties[feature_name]
-            feature_type = feature_schema.get("type")
             
             # Convert value to the correct type
-            if feature_type == "integer" and value is not None:
-                result[feature_name] = int(value)
-            elif feature_type == "number" and value is not None:
-                result[feature_name] = float(value)
-            elif feature_type == "boolean" and value is not None:
-                result[feature_name] = bool(value)
-            elif feature_type == "string" and value is not None:
-                result[feature_name] = str(value)
-            elif feature_type == "array" and value is not None:
-                if isinstance(value, list):
-                    result[feature_name] = value
-                elif isinstance(value, str):
-                    # Try to parse as JSON
-                    try:
-                        result[feature_name] = json.loads(value)
-                    except json.JSONDecodeError:
-                        result[feature_name] = [value]
-                else:
-                    result[feature_name] = [value]
-            else:
-                result[feature_name] = value
+            convert = converters[feature_name]
+            if convert is not None and value is not None:
+                value = convert(value)
+            result[feature_name] = value
         
         return result
     
@@ -1,8 +1,15 @@
-from fastapi import APIRouter
-from app.api.routes import router as api_router
+from fastapi import FastAPI
+from app.api.routes import domain_routers
 
-# Main API router
-router = APIRouter(prefix="/api")
+# Path prefix for all API endpoints
+API_PREFIX = "/api"
 
-# Include domain-specific routes
-router.include_router(api_router)
+def include_api_routes(app: FastAPI) -> None:
+    """Mount every domain router directly on the app under the API prefix.
+    
+    Each level of nested routers is another match step on every request, so
+    domain routers are included with their full prefix instead of through an
+    intermediate /api router.
+    """
+    for router, prefix, tags in domain_routers:
+        app.include_router(router, prefix=API_PREFIX + prefix, tags=tags)
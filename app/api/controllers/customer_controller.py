@@ -1,31 +1,62 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from typing import Any, Dict, List, Optional, Tuple
+import base64
+import binascii
+
+import orjson
 
 from app.common.models.request_models import CustomerRequest
 from app.common.models.response_models import CustomerResponse
+from app.api.dependencies import get_request_processor
 from app.orchestration.request_processor import RequestProcessor
 
 router = APIRouter()
 
+# Response header carrying the cursor for the page after a full page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def _encode_cursor(customer: Dict[str, Any]) -> str:
+    """Encode the position of a customer in the listing as an opaque cursor."""
+    position = orjson.dumps([customer["created_at"], customer["customer_id"]])
+    return base64.urlsafe_b64encode(position).decode("ascii")
+
+def _decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """Decode a cursor into the (created_at, customer_id) it points after."""
+    try:
+        created_at, customer_id = orjson.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, orjson.JSONDecodeError, UnicodeEncodeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return created_at, customer_id
+
 @router.get("/", response_model=List[CustomerResponse])
 async def get_customers(
+    response: Response,
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    request_processor: RequestProcessor = Depends()
+    cursor: Optional[str] = Query(None),
+    request_processor: RequestProcessor = Depends(get_request_processor)
 ):
     """
-    Retrieve a list of customers.
+    Retrieve a list of customers, newest first.
+    
+    Pass the X-Next-Cursor header of a full page as the cursor to get the
+    next page; unlike offset, its cost doesn't grow with the page depth.
     """
-    return await request_processor.process(
+    customers = await request_processor.process(
         "customers", 
         "list", 
-        {"limit": limit, "offset": offset}
+        {"limit": limit, "offset": offset, "cursor": _decode_cursor(cursor) if cursor else None}
     )
+    
+    if customers and len(customers) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(customers[-1])
+    
+    return customers
 
 @router.get("/{customer_id}", response_model=CustomerResponse)
 async def get_customer(
     customer_id: str,
-    request_processor: RequestProcessor = Depends()
+    request_processor: RequestProcessor = Depends(get_request_processor)
 ):
     """
     Retrieve a single customer by ID.
@@ -44,7 +75,7 @@ async def get_customer(
 @router.post("/", response_model=CustomerResponse, status_code=201)
 async def create_customer(
     customer: CustomerRequest,
-    request_processor: RequestProcessor = Depends()
+    request_processor: RequestProcessor = Depends(get_request_processor)
 ):
     """
     Create a new customer.
@@ -55,11 +86,25 @@ async def create_customer(
         customer.model_dump()
     )
 
+@router.post("/batch", response_model=List[CustomerResponse], status_code=201)
+async def create_customers(
+    customers: List[CustomerRequest],
+    request_processor: RequestProcessor = Depends(get_request_processor)
+):
+    """
+    Create several customers at once.
+    """
+    return await request_processor.process(
+        "customers", 
+        "create_batch", 
+        {"customers": [customer.model_dump() for customer in customers]}
+    )
+
 @router.put("/{customer_id}", response_model=CustomerResponse)
 async def update_customer(
     customer_id: str,
     customer: CustomerRequest,
-    request_processor: RequestProcessor = Depends()
+    request_processor: RequestProcessor = Depends(get_request_processor)
 ):
     """
     Update an existing customer.
@@ -0,0 +1,46 @@
+from fastapi import Request
+
+from app.adapters.api.http_client import HttpClient
+from app.adapters.database.database_client import DatabaseClient
+from app.adapters.feast.feast_client import FeastClient
+from app.adapters.ml.model_client import ModelClient
+from app.config.config_loader import ConfigLoader
+from app.config.data_source_config_manager import DataSourceConfigManager
+from app.config.endpoint_config_manager import EndpointConfigManager
+from app.orchestration.data_orchestrator import DataOrchestrator
+from app.orchestration.execution_tracker import ExecutionTracker
+from app.orchestration.request_processor import RequestProcessor
+from app.orchestration.response_assembler import ResponseAssembler
+
+def build_request_processor(config_loader: ConfigLoader, config_manager: DataSourceConfigManager) -> RequestProcessor:
+    """Build the request processing component graph.
+    
+    Args:
+        config_loader: The configuration loader shared by all components
+        config_manager: The data source configuration manager shared by all adapters
+    
+    Returns:
+        A fully wired request processor
+    """
+    http_client = HttpClient(config_manager)
+    
+    data_orchestrator = DataOrchestrator(
+        database=DatabaseClient(config_manager),
+        http_client=http_client,
+        feast_client=FeastClient(config_manager),
+        model_client=ModelClient(config_manager, http_client)
+    )
+    
+    endpoint_config = EndpointConfigManager(config_loader)
+    endpoint_config.preload_endpoint_configs()
+    
+    return RequestProcessor(
+        endpoint_config=endpoint_config,
+        data_orchestrator=data_orchestrator,
+        execution_tracker=ExecutionTracker(),
+        response_assembler=ResponseAssembler()
+    )
+
+def get_request_processor(request: Request) -> RequestProcessor:
+    """Return the request processor built at application startup."""
+    return request.app.state.request_processor
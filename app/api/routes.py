@@ -1,8 +1,6 @@
-from fastapi import APIRouter
 from app.api.controllers.customer_controller import router as customer_router
 
-# Main router for all API endpoints
-router = APIRouter()
-
-# Include domain-specific routers
-router.include_router(customer_router, prefix="/customers", tags=["customers"])
+# Domain-specific routers with their path prefixes and tags
+domain_routers = [
+    (customer_router, "/customers", ["customers"]),
+]
@@ -1,5 +1,8 @@
+import os
+import traceback
+import uuid
+from typing import Any, Dict
 from fastapi import Request
-from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException
 
@@ -12,13 +15,17 @@ from app.common.errors.custom_exceptions import (
     AuthorizationError
 )
 from app.common.utils.logging_utils import get_logger
+from app.common.utils.response_utils import ORJSONResponse
 
 logger = get_logger(__name__)
 
+# Include tracebacks in error responses; only meant for local debugging
+_DEBUG = os.environ.get("APP_DEBUG", "").lower() in ("1", "true", "yes")
+
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle FastAPI's RequestValidationError."""
-    logger.warning(f"Validation error: {exc}")
-    return JSONResponse(
+    logger.warning("Validation error: %s", exc)
+    return ORJSONResponse(
         status_code=422,
         content={
             "status": "error",
@@ -29,8 +36,8 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle Starlette's HTTPException."""
-    logger.warning(f"HTTP error {exc.status_code}: {exc.detail}")
-    return JSONResponse(
+    logger.warning("HTTP error %s: %s", exc.status_code, exc.detail)
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "status": "error",
@@ -40,8 +47,8 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 
 async def resource_not_found_handler(request: Request, exc: ResourceNotFoundError):
     """Handle ResourceNotFoundError."""
-    logger.warning(f"Resource not found: {exc}")
-    return JSONResponse(
+    logger.warning("Resource not found: %s", exc)
+    return ORJSONResponse(
         status_code=404,
         content={
             "status": "error",
@@ -51,8 +58,8 @@ async def resource_not_found_handler(request: Request, exc: ResourceNotFoundErro
 
 async def authorization_error_handler(request: Request, exc: AuthorizationError):
     """Handle AuthorizationError."""
-    logger.warning(f"Authorization error: {exc}")
-    return JSONResponse(
+    logger.warning("Authorization error: %s", exc)
+    return ORJSONResponse(
         status_code=403,
         content={
             "status": "error",
@@ -62,8 +69,8 @@ async def authorization_error_handler(request: Request, exc: AuthorizationError)
 
 async def validation_error_handler(request: Request, exc: ValidationError):
     """Handle ValidationError."""
-    logger.warning(f"Validation error: {exc}")
-    return JSONResponse(
+    logger.warning("Validation error: %s", exc)
+    return ORJSONResponse(
         status_code=422,
         content={
             "status": "error",
@@ -74,8 +81,8 @@ async def validation_error_handler(request: Request, exc: ValidationError):
 
 async def data_source_error_handler(request: Request, exc: DataSourceError):
     """Handle DataSourceError."""
-    logger.error(f"Data source error: {exc}")
-    return JSONResponse(
+    logger.error("Data source error: %s", exc)
+    return ORJSONResponse(
         status_code=502,  # Bad Gateway for external service errors
         content={
             "status": "error",
@@ -85,8 +92,8 @@ async def data_source_error_handler(request: Request, exc: DataSourceError):
 
 async def configuration_error_handler(request: Request, exc: ConfigurationError):
     """Handle ConfigurationError."""
-    logger.error(f"Configuration error: {exc}")
-    return JSONResponse(
+    logger.error("Configuration error: %s", exc)
+    return ORJSONResponse(
         status_code=500,
         content={
             "status": "error",
@@ -96,8 +103,8 @@ async def configuration_error_handler(request: Request, exc: ConfigurationError)
 
 async def orchestrator_error_handler(request: Request, exc: OrchestratorError):
     """Handle generic OrchestratorError."""
-    logger.error(f"Orchestrator error: {exc}")
-    return JSONResponse(
+    logger.error("Orchestrator error: %s", exc)
+    return ORJSONResponse(
         status_code=500,
         content={
             "status": "error",
@@ -105,19 +112,43 @@ async def orchestrator_error_handler(request: Request, exc: OrchestratorError):
         }
     )
 
-async def generic_exception_handler(request: Request, exc: Exception):
-    """Handle any unhandled exceptions."""
-    logger.exception(f"Unhandled exception: {exc}")
-    return JSONResponse(
-        status_code=500,
-        content={
-            "status": "error",
-            "message": "An unexpected error occurred"
-        }
-    )
+def unhandled_error_content(exc: Exception) -> Dict[str, Any]:
+    """Log an unhandled exception and build the error response content.
+    
+    The traceback is only written to the log; the client gets an error ID it
+    can quote to find the matching log entry. With APP_DEBUG set, the
+    formatted traceback is returned as well.
+    
+    Args:
+        exc: The unhandled exception
+        
+    Returns:
+        The JSON content of the error response
+    """
+    error_id = uuid.uuid4().hex
+    content = {
+        "status": "error",
+        "message": "An unexpected error occurred",
+        "error_id": error_id
+    }
+    
+    if _DEBUG:
+        # Format the traceback once and reuse it for the log and the response
+        formatted = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+        logger.error("Unhandled exception (error id %s): %s\n%s", error_id, exc, formatted.rstrip("\n"))
+        content["traceback"] = formatted
+    else:
+        # The traceback is only formatted if the log record is emitted
+        logger.exception("Unhandled exception (error id %s): %s", error_id, exc, exc_info=exc)
+    
+    return content
 
 def register_exception_handlers(app):
-    """Register all exception handlers with the FastAPI app."""
+    """Register all exception handlers with the FastAPI app.
+    
+    Exceptions that none of these handle are turned into a 500 response by
+    ErrorASGIMiddleware rather than by an exception handler for Exception.
+    """
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
     app.add_exception_handler(HTTPException, http_exception_handler)
     app.add_exception_handler(ResourceNotFoundError, resource_not_found_handler)
@@ -126,4 +157,3 @@ def register_exception_handlers(app):
     app.add_exception_handler(DataSourceError, data_source_error_handler)
     app.add_exception_handler(ConfigurationError, configuration_error_handler)
     app.add_exception_handler(OrchestratorError, orchestrator_error_handler)
-    app.add_exception_handler(Exception, generic_exception_handler)
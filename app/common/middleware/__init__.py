@@ -0,0 +1 @@
+# Middleware package initialization
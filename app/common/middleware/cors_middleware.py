@@ -0,0 +1,169 @@
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+Header = Tuple[bytes, bytes]
+
+# Methods a "*" in allow_methods stands for when it has to be spelled out
+_ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+
+# Request headers browsers may always send, whatever allow_headers says
+_SAFELISTED_HEADERS = frozenset((b"accept", b"accept-language", b"content-language", b"content-type"))
+
+# Answer to a preflight asking for a method or header that isn't allowed
+_DISALLOWED_PREFLIGHT_BODY = b"Disallowed CORS method or headers"
+
+class FastCORSMiddleware:
+    """Pure ASGI middleware that adds CORS headers to HTTP responses.
+    
+    All response headers are encoded once at construction, and preflight
+    requests are answered directly without reaching the router. When all
+    origins are allowed, non-OPTIONS requests skip the request header scan
+    and just get the static headers appended to the response.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Iterable[str] = ("*",),
+        allow_methods: Iterable[str] = ("*",),
+        allow_headers: Iterable[str] = ("*",),
+        expose_headers: Iterable[str] = (),
+        allow_credentials: bool = False,
+        max_age: int = 600
+    ):
+        self.app = app
+        self.allow_origins = frozenset(allow_origins)
+        self.allow_all_origins = "*" in self.allow_origins
+        
+        # Browsers reject credentialed responses with a wildcard origin, and
+        # echoing the origin instead would lose the static-header fast path
+        if allow_credentials and self.allow_all_origins:
+            raise ValueError("allow_credentials requires an explicit list of allowed origins")
+        
+        # Whether a response depends on the origin; with an explicit origin
+        # list it does even when no CORS headers are added, so shared caches
+        # don't serve one origin's response to another
+        self.vary_headers: List[Header] = [] if self.allow_all_origins else [(b"vary", b"Origin")]
+        
+        # Headers added to every CORS response; the allow-origin value is
+        # only static when all origins are allowed
+        self.simple_headers: List[Header] = []
+        if self.allow_all_origins:
+            self.simple_headers.append((b"access-control-allow-origin", b"*"))
+        else:
+            self.simple_headers.append((b"vary", b"Origin"))
+        if allow_credentials:
+            self.simple_headers.append((b"access-control-allow-credentials", b"true"))
+        
+        # Response headers beyond the CORS-safelisted ones that scripts on
+        # other origins may read, such as the paging cursor
+        expose_headers = ", ".join(expose_headers)
+        if expose_headers:
+            self.simple_headers.append((b"access-control-expose-headers", expose_headers.encode("latin-1")))
+        
+        # Browsers take "*" literally in answers to credentialed requests, so
+        # then the methods are spelled out and the requested headers echoed
+        allow_methods = tuple(allow_methods)
+        allow_headers = tuple(allow_headers)
+        
+        # Methods and headers preflights may ask for, or None for any
+        self.allowed_methods: Optional[FrozenSet[bytes]] = None
+        if "*" not in allow_methods:
+            self.allowed_methods = frozenset(method.upper().encode("latin-1") for method in allow_methods)
+        self.allowed_headers: Optional[FrozenSet[bytes]] = None
+        if "*" not in allow_headers:
+            self.allowed_headers = _SAFELISTED_HEADERS | {header.lower().encode("latin-1") for header in allow_headers}
+        
+        if allow_credentials and "*" in allow_methods:
+            allow_methods = _ALL_METHODS
+        self.echo_request_headers = allow_credentials and "*" in allow_headers
+        
+        # Additional headers only sent in answer to a preflight request; the
+        # max-age lets browsers skip repeat preflights for the same resource
+        self.preflight_headers: List[Header] = self.simple_headers + [
+            (b"access-control-allow-methods", ", ".join(allow_methods).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+        ]
+        if not self.echo_request_headers:
+            self.preflight_headers.append((b"access-control-allow-headers", ", ".join(allow_headers).encode("latin-1")))
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # The wildcard headers are the same for every origin, and harmless on
+        # same-origin responses, so only preflights need the request headers
+        if self.allow_all_origins and scope["method"] != "OPTIONS":
+            await self.app(scope, receive, self._wrap_send(send, self.simple_headers))
+            return
+        
+        origin: Optional[bytes] = None
+        request_method: Optional[bytes] = None
+        request_headers: Optional[bytes] = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+        
+        # Not a cross-origin request, or an origin we don't allow
+        if origin is None or not (self.allow_all_origins or origin.decode("latin-1") in self.allow_origins):
+            if self.vary_headers:
+                send = self._wrap_send(send, self.vary_headers)
+            await self.app(scope, receive, send)
+            return
+        
+        if request_method is not None and scope["method"] == "OPTIONS":
+            await self._send_preflight_response(origin, request_method, request_headers, send)
+            return
+        
+        headers = self.simple_headers
+        if not self.allow_all_origins:
+            headers = headers + [(b"access-control-allow-origin", origin)]
+        
+        await self.app(scope, receive, self._wrap_send(send, headers))
+    
+    @staticmethod
+    def _wrap_send(send: Send, headers: List[Header]) -> Send:
+        """Wrap send so the given headers are appended to the response start."""
+        async def send_with_cors_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *headers]
+            await send(message)
+        
+        return send_with_cors_headers
+    
+    def _is_preflight_allowed(self, request_method: bytes, request_headers: Optional[bytes]) -> bool:
+        """Check that a preflight only asks for allowed methods and headers."""
+        if self.allowed_methods is not None and request_method.upper() not in self.allowed_methods:
+            return False
+        if self.allowed_headers is not None and request_headers:
+            for header in request_headers.split(b","):
+                header = header.strip().lower()
+                if header and header not in self.allowed_headers:
+                    return False
+        return True
+    
+    async def _send_preflight_response(self, origin: bytes, request_method: bytes, request_headers: Optional[bytes], send: Send) -> None:
+        """Answer a CORS preflight request without invoking the application."""
+        if not self._is_preflight_allowed(request_method, request_headers):
+            headers = self.vary_headers + [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(_DISALLOWED_PREFLIGHT_BODY)).encode("latin-1"))
+            ]
+            await send({"type": "http.response.start", "status": 400, "headers": headers})
+            await send({"type": "http.response.body", "body": _DISALLOWED_PREFLIGHT_BODY})
+            return
+        
+        headers = self.preflight_headers
+        if not self.allow_all_origins:
+            headers = headers + [(b"access-control-allow-origin", origin)]
+        if self.echo_request_headers and request_headers:
+            headers = headers + [(b"access-control-allow-headers", request_headers)]
+        
+        await send({"type": "http.response.start", "status": 204, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
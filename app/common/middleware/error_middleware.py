@@ -0,0 +1,45 @@
+import orjson
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.common.errors.error_handlers import unhandled_error_content
+
+class ErrorASGIMiddleware:
+    """Pure ASGI middleware that turns unhandled exceptions into JSON 500s.
+    
+    Successful requests only pay for a try block and a wrapped send; no
+    Request object is built unless an exception actually escapes the app.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_tracking_start)
+        except Exception as exc:
+            # Too late to replace a response that is already on the wire
+            if response_started:
+                raise
+            
+            body = orjson.dumps(unhandled_error_content(exc))
+            await send({
+                "type": "http.response.start",
+                "status": 500,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1"))
+                ]
+            })
+            await send({"type": "http.response.body", "body": body})
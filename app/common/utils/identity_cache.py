@@ -0,0 +1,48 @@
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+T = TypeVar("T")
+
+class IdentityCache:
+    """Bounded cache of values derived from objects, keyed by object identity.
+    
+    Meant for configuration that is parsed into a faster form on first use:
+    looking the object up by id() avoids hashing or comparing its contents.
+    Each entry keeps the object alive, so its id cannot be reused by another
+    object while cached; once the cache is full the oldest entry is evicted.
+    """
+    
+    def __init__(self, maxsize: int = 1024):
+        """Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        self.maxsize = maxsize
+        self._entries: Dict[int, Tuple[Any, Any]] = {}
+    
+    def get(self, obj: Any, compute: Callable[[Any], T]) -> T:
+        """Get the value derived from an object, computing it on first use.
+        
+        Args:
+            obj: The object the value is derived from
+            compute: Function deriving the value from the object
+        
+        Returns:
+            The cached or newly computed value
+        """
+        entry = self._entries.get(id(obj))
+        if entry is not None and entry[0] is obj:
+            return entry[1]
+        
+        value = compute(obj)
+        if len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[id(obj)] = (obj, value)
+        return value
+    
+    def clear(self) -> None:
+        """Remove all cached values."""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
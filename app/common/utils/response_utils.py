@@ -0,0 +1,18 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the standard json module."""
+    
+    def render(self, content: Any) -> bytes:
+        """Serialize the response content to JSON bytes.
+        
+        Args:
+            content: The response content
+            
+        Returns:
+            The encoded response body
+        """
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
@@ -0,0 +1,66 @@
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+class TTLCache:
+    """Small in-process cache whose entries expire after a fixed time.
+    
+    Entries are kept in insertion order, so once the cache is full the oldest
+    entry is evicted first. Lookups and updates are plain dict operations and
+    never await, so the cache is safe to share between coroutines.
+    """
+    
+    def __init__(self, maxsize: int = 10000, ttl: float = 60.0):
+        """Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: How long an entry is returned after it is set, in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get the value cached for a key.
+        
+        Args:
+            key: The cache key
+        
+        Returns:
+            The cached value, or None if it is missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return entry[1]
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value for a key.
+        
+        Args:
+            key: The cache key
+            value: The value to cache
+        """
+        # Re-insert the key so it moves to the end of the eviction order
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+    
+    def pop(self, key: Hashable) -> None:
+        """Remove the value cached for a key, if any.
+        
+        Args:
+            key: The cache key
+        """
+        self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Remove all cached values."""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,19 +1,38 @@
 import os
+import threading
+import time
 import yaml
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from pathlib import Path
 
 from app.common.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Parsed configuration files shared by all loaders, keyed by config directory
+_config_caches: Dict[str, Dict[str, Any]] = {}
+
+# How long a missing file is remembered before the filesystem is checked again
+_MISSING_FILE_TTL = 5.0
+
+# Expiry times of missing configuration files, keyed by file path
+_missing_files: Dict[str, float] = {}
+
+# How long a directory listing is reused before the directory is listed again
+_LISTING_TTL = 30.0
+
+# Expiry times and domain names of listed domain directories, keyed by path
+_domain_listings: Dict[str, Tuple[float, Tuple[str, ...]]] = {}
+
 class ConfigLoader:
     """Loads and parses configuration files."""
     
     def __init__(self, config_dir: Optional[str] = None):
         # Default to the config directory in the project root
         self.config_dir = config_dir or os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "config")
-        self.config_cache = {}
+        # Share parsed files with every other loader for the same directory,
+        # so a new loader does not re-read and re-parse the YAML from disk
+        self.config_cache = _config_caches.setdefault(self.config_dir, {})
     
     def load_config(self) -> Dict[str, Any]:
         """Load the global configuration."""
@@ -34,9 +53,14 @@ class ConfigLoader:
         
         filepath = os.path.join(self.config_dir, filename)
         
+        # Skip the filesystem check for a file recently found to be missing
+        if _missing_files.get(filepath, 0.0) > time.monotonic():
+            return {}
+        
         try:
             if not os.path.exists(filepath):
-                logger.warning(f"Configuration file not found: {filepath}")
+                logger.warning("Configuration file not found: %s", filepath)
+                _missing_files[filepath] = time.monotonic() + _MISSING_FILE_TTL
                 return {}
             
             with open(filepath, "r") as file:
@@ -46,7 +70,7 @@ class ConfigLoader:
             self.config_cache[filename] = config
             return config
         except Exception as e:
-            logger.error(f"Error loading configuration file {filepath}: {str(e)}")
+            logger.error("Error loading configuration file %s: %s", filepath, e)
             return {}
     
     def load_domain_config(self, domain: str) -> Dict[str, Any]:
@@ -60,6 +84,30 @@ class ConfigLoader:
         """
         return self.load_yaml_file(f"domains/{domain}.yaml")
     
+    def list_domain_configs(self) -> Tuple[str, ...]:
+        """List the domains that have a configuration file.
+        
+        Returns:
+            The sorted domain names, as an immutable tuple shared between calls
+        """
+        domains_dir = os.path.join(self.config_dir, "domains")
+        
+        # Reuse a recent listing instead of hitting the filesystem again
+        listing = _domain_listings.get(domains_dir)
+        if listing is not None and listing[0] > time.monotonic():
+            return listing[1]
+        
+        domains: Tuple[str, ...] = ()
+        if os.path.isdir(domains_dir):
+            domains = tuple(sorted(
+                os.path.splitext(entry)[0]
+                for entry in os.listdir(domains_dir)
+                if entry.endswith(".yaml")
+            ))
+        
+        _domain_listings[domains_dir] = (time.monotonic() + _LISTING_TTL, domains)
+        return domains
+    
     def load_integration_config(self, integration_type: str) -> Dict[str, Any]:
         """Load integration-specific configuration.
         
@@ -80,7 +128,27 @@ class ConfigLoader:
         if filename:
             if filename in self.config_cache:
                 del self.config_cache[filename]
+            _missing_files.pop(os.path.join(self.config_dir, filename), None)
         else:
             self.config_cache.clear()
+            _missing_files.clear()
+            _domain_listings.clear()
         
-        logger.info(f"Reloaded configuration {'for ' + filename if filename else 'for all files'}")
+        logger.info("Reloaded configuration %s", "for " + filename if filename else "for all files")
+
+# Loader for the default config directory, shared by every app instance
+_default_loader: Optional[ConfigLoader] = None
+_default_loader_lock = threading.Lock()
+
+def get_config_loader() -> ConfigLoader:
+    """Get the configuration loader for the default config directory.
+    
+    Returns:
+        The shared loader, created on first use
+    """
+    global _default_loader
+    if _default_loader is None:
+        with _default_loader_lock:
+            if _default_loader is None:
+                _default_loader = ConfigLoader()
+    return _default_loader
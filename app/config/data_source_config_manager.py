@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from fastapi import Depends
 
 from app.config.config_loader import ConfigLoader
@@ -6,12 +6,36 @@ from app.common.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Configuration files for the built-in source types; any other type is read
+# from integrations/<source_type>.yaml
+_SOURCE_CONFIG_FILES = {
+    "database": "database.yaml",
+    "api": "integrations/api_sources.yaml",
+    "feast": "integrations/feast_config.yaml",
+    "ml": "integrations/ml_config.yaml"
+}
+
 class DataSourceConfigManager:
     """Manages data source configurations for the orchestration engine."""
     
     def __init__(self, config_loader: ConfigLoader = Depends()):
         self.config_loader = config_loader
-        self.source_cache = {}
+        self.source_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    
+    def _get_config_file(self, source_type: str) -> str:
+        """Get the configuration file name for a data source type."""
+        return _SOURCE_CONFIG_FILES.get(source_type) or f"integrations/{source_type}.yaml"
+    
+    def _get_sources(self, config: Dict[str, Any], source_type: str) -> Dict[str, Any]:
+        """Get the sources section of a configuration file.
+        
+        Sources are either at the top level of the file or nested under a
+        key named after the source type (e.g. "database: sources: ...").
+        """
+        sources = config.get("sources")
+        if sources is None:
+            sources = (config.get(source_type) or {}).get("sources")
+        return sources or {}
     
     def get_data_source_config(self, source_type: str, source_id: str) -> Optional[Dict[str, Any]]:
         """Get the configuration for a specific data source.
@@ -24,31 +48,23 @@ class DataSourceConfigManager:
             The data source configuration or None if not found
         """
         # Check cache first
-        cache_key = f"{source_type}.{source_id}"
-        if cache_key in self.source_cache:
-            return self.source_cache[cache_key]
+        cache_key = (source_type, source_id)
+        source_config = self.source_cache.get(cache_key)
+        if source_config is not None:
+            return source_config
         
         # Load integration configuration based on source type
-        if source_type == "database":
-            config_file = "database.yaml"
-        elif source_type == "api":
-            config_file = "integrations/api_sources.yaml"
-        elif source_type == "feast":
-            config_file = "integrations/feast_config.yaml"
-        else:
-            config_file = f"integrations/{source_type}.yaml"
-        
-        config = self.config_loader.load_yaml_file(config_file)
+        config = self.config_loader.load_yaml_file(self._get_config_file(source_type))
         if not config:
-            logger.warning(f"No configuration found for source type '{source_type}'")
+            logger.warning("No configuration found for source type '%s'", source_type)
             return None
         
         # Get the configuration for this specific source
-        sources = config.get("sources", {})
+        sources = self._get_sources(config, source_type)
         source_config = sources.get(source_id)
         
         if not source_config:
-            logger.warning(f"No configuration found for source '{source_id}' of type '{source_type}'")
+            logger.warning("No configuration found for source '%s' of type '%s'", source_id, source_type)
             return None
         
         # Cache the result
@@ -64,17 +80,8 @@ class DataSourceConfigManager:
         Returns:
             A dictionary mapping source IDs to source configurations
         """
-        if source_type == "database":
-            config_file = "database.yaml"
-        elif source_type == "api":
-            config_file = "integrations/api_sources.yaml"
-        elif source_type == "feast":
-            config_file = "integrations/feast_config.yaml"
-        else:
-            config_file = f"integrations/{source_type}.yaml"
-        
-        config = self.config_loader.load_yaml_file(config_file)
-        return config.get("sources", {})
+        config = self.config_loader.load_yaml_file(self._get_config_file(source_type))
+        return self._get_sources(config, source_type)
     
     def reload_data_source_config(self, source_type: Optional[str] = None) -> None:
         """Reload data source configurations from disk.
@@ -85,18 +92,11 @@ class DataSourceConfigManager:
         if source_type:
             # Clear cache entries for this source type
             for cache_key in list(self.source_cache.keys()):
-                if cache_key.startswith(f"{source_type}."):
+                if cache_key[0] == source_type:
                     del self.source_cache[cache_key]
             
             # Reload the source type configuration
-            if source_type == "database":
-                self.config_loader.reload_config("database.yaml")
-            elif source_type == "api":
-                self.config_loader.reload_config("integrations/api_sources.yaml")
-            elif source_type == "feast":
-                self.config_loader.reload_config("integrations/feast_config.yaml")
-            else:
-                self.config_loader.reload_config(f"integrations/{source_type}.yaml")
+            self.config_loader.reload_config(self._get_config_file(source_type))
         else:
             # Clear all cache entries
             self.source_cache.clear()
@@ -104,4 +104,4 @@ class DataSourceConfigManager:
             # Reload all configurations
             self.config_loader.reload_config()
         
-        logger.info(f"Reloaded data source configurations {'for type ' + source_type if source_type else 'for all types'}")
+        logger.info("Reloaded data source configurations %s", "for type " + source_type if source_type else "for all types")
@@ -24,14 +24,15 @@ class EndpointConfigManager:
             The endpoint configuration or None if not found
         """
         # Check cache first
-        cache_key = f"{domain}.{operation}"
-        if cache_key in self.endpoint_cache:
-            return self.endpoint_cache[cache_key]
+        cache_key = (domain, operation)
+        endpoint_config = self.endpoint_cache.get(cache_key)
+        if endpoint_config is not None:
+            return endpoint_config
         
         # Load domain configuration
         domain_config = self.config_loader.load_domain_config(domain)
         if not domain_config:
-            logger.warning(f"No configuration found for domain '{domain}'")
+            logger.warning("No configuration found for domain '%s'", domain)
             return None
         
         # Get the endpoint configuration for this operation
@@ -39,13 +40,32 @@ class EndpointConfigManager:
         endpoint_config = endpoints.get(operation)
         
         if not endpoint_config:
-            logger.warning(f"No configuration found for operation '{operation}' in domain '{domain}'")
+            logger.warning("No configuration found for operation '%s' in domain '%s'", operation, domain)
             return None
         
         # Cache the result
         self.endpoint_cache[cache_key] = endpoint_config
         return endpoint_config
     
+    def preload_endpoint_configs(self) -> int:
+        """Load every domain's endpoint configurations into the cache.
+        
+        Endpoint configurations are read-only at runtime, so loading them all
+        at startup keeps YAML parsing off the request path.
+        
+        Returns:
+            The number of endpoint configurations loaded
+        """
+        count = 0
+        for domain in self.config_loader.list_domain_configs():
+            endpoints = self.config_loader.load_domain_config(domain).get("endpoints", {})
+            for operation, endpoint_config in endpoints.items():
+                self.endpoint_cache[(domain, operation)] = endpoint_config
+                count += 1
+        
+        logger.info("Preloaded %s endpoint configurations", count)
+        return count
+    
     def get_all_endpoints(self, domain: str) -> Dict[str, Any]:
         """Get all endpoint configurations for a domain.
         
@@ -67,7 +87,7 @@ class EndpointConfigManager:
         if domain:
             # Clear cache entries for this domain
             for cache_key in list(self.endpoint_cache.keys()):
-                if cache_key.startswith(f"{domain}."):
+                if cache_key[0] == domain:
                     del self.endpoint_cache[cache_key]
             
             # Reload the domain configuration
@@ -79,4 +99,4 @@ class EndpointConfigManager:
             # Reload all domain configurations
             self.config_loader.reload_config()
         
-        logger.info(f"Reloaded endpoint configurations {'for domain ' + domain if domain else 'for all domains'}")
+        logger.info("Reloaded endpoint configurations %s", "for domain " + domain if domain else "for all domains")
@@ -1,14 +1,25 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from fastapi import Depends
+import asyncio
 
 from app.adapters.database.database_client import DatabaseClient
 from app.adapters.api.http_client import HttpClient
 from app.adapters.feast.feast_client import FeastClient
 from app.adapters.ml.model_client import ModelClient
+from app.common.utils.identity_cache import IdentityCache
 from app.common.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Compiled source params: (param name, referenced root or None for a literal, path, literal value)
+CompiledParams = Tuple[Tuple[str, Optional[str], Tuple[str, ...], Any], ...]
+
+# Data sources grouped into stages that can each run concurrently
+SourceStages = Tuple[Tuple[Dict[str, Any], ...], ...]
+
+# Marks a source that was skipped and has no result
+_SKIPPED = object()
+
 class DataOrchestrator:
     """Orchestrates data flow between different data sources."""
     
@@ -25,6 +36,22 @@ class DataOrchestrator:
             "feast": feast_client,
             "ml": model_client
         }
+        
+        # Compiled params and source stages, keyed by their config objects
+        self.compiled_params = IdentityCache()
+        self.source_stages = IdentityCache()
+        
+        # Bound operation methods keyed by (source type, operation)
+        self.operations: Dict[Tuple[str, str], Callable[..., Any]] = {}
+    
+    def clear_caches(self) -> None:
+        """Forget everything compiled from configuration, e.g. after a reload.
+        
+        The cache entries keep the old configuration objects alive, so they
+        are dropped rather than left to accumulate.
+        """
+        self.compiled_params.clear()
+        self.source_stages.clear()
     
     async def orchestrate(
         self, 
@@ -44,77 +71,192 @@ class DataOrchestrator:
         """
         result = {}
         
-        # Get the data sources defined in the endpoint configuration
-        sources = endpoint_config.get("data_sources", [])
+        # Get the data sources defined in the endpoint configuration. Sources
+        # marked parallel that don't use each other's results run
+        # concurrently, so their round trips overlap; each stage sees the
+        # results of earlier ones
+        sources = endpoint_config.get("data_sources", ())
         
-        for source in sources:
-            source_type = source.get("type")
-            source_name = source.get("name")
-            operation = source.get("operation")
-            params = source.get("params", {})
-            transform = source.get("transform", None)
+        for stage in self._get_source_stages(sources):
+            if len(stage) == 1:
+                stage_results = [await self._run_source(execution_id, stage[0], request_data, result)]
+            else:
+                stage_results = await self._run_stage(execution_id, stage, request_data, result)
+            
+            # Add the results to the combined result in configuration order
+            for source, source_result in zip(stage, stage_results):
+                if source_result is not _SKIPPED:
+                    result[source["name"]] = source_result
+        
+        return result
+    
+    async def _run_stage(
+        self,
+        execution_id: str,
+        stage: Tuple[Dict[str, Any], ...],
+        request_data: Dict[str, Any],
+        current_result: Dict[str, Any]
+    ) -> List[Any]:
+        """Run the sources of a stage concurrently, returning their results in order.
+        
+        As with asyncio.TaskGroup, the first failure cancels the sources that
+        are still running and is raised once they have stopped, so a failed
+        request doesn't leave work running in the background.
+        """
+        tasks = [
+            asyncio.ensure_future(self._run_source(execution_id, source, request_data, current_result))
+            for source in stage
+        ]
+        try:
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        except BaseException:
+            # Cancelled from outside: take the stage down with us
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        # Raise the failure of the first failed source in configuration order,
+        # retrieving every exception so none is reported as never retrieved
+        error = None
+        for task in tasks:
+            if task.done() and not task.cancelled():
+                task_error = task.exception()
+                if error is None:
+                    error = task_error
+        if error is not None:
+            raise error
+        
+        return [task.result() for task in tasks]
+    
+    async def _run_source(
+        self,
+        execution_id: str,
+        source: Dict[str, Any],
+        request_data: Dict[str, Any],
+        current_result: Dict[str, Any]
+    ) -> Any:
+        """Run one data source, returning its result or _SKIPPED."""
+        source_type = source.get("type")
+        source_name = source.get("name")
+        operation = source.get("operation")
+        transform = source.get("transform")
+        
+        # Skip if missing required configuration
+        if not (source_type and source_name and operation):
+            logger.warning("Skipping misconfigured source in execution %s", execution_id)
+            return _SKIPPED
+        
+        # Skip if the source type is not supported
+        if source_type not in self.sources:
+            logger.warning("Unsupported source type '%s' in execution %s", source_type, execution_id)
+            return _SKIPPED
+        
+        try:
+            # Resolve parameter values from request data
+            resolved_params = self._resolve_params(source.get("params"), request_data, current_result)
+            
+            # Execute the operation on the data source
+            source_result = await self._execute_source_operation(
+                source_type, 
+                operation, 
+                resolved_params
+            )
             
-            # Skip if missing required configuration
-            if not all([source_type, source_name, operation]):
-                logger.warning(f"Skipping misconfigured source in execution {execution_id}")
-                continue
+            # Apply transform if specified
+            if transform and source_result:
+                source_result = self._apply_transform(transform, source_result, current_result)
             
-            # Skip if the source type is not supported
-            if source_type not in self.sources:
-                logger.warning(f"Unsupported source type '{source_type}' in execution {execution_id}")
-                continue
+            return source_result
             
-            try:
-                # Resolve parameter values from request data
-                resolved_params = self._resolve_params(params, request_data, result)
-                
-                # Execute the operation on the data source
-                source_result = await self._execute_source_operation(
-                    source_type, 
-                    operation, 
-                    resolved_params
-                )
-                
-                # Apply transform if specified
-                if transform and source_result:
-                    source_result = self._apply_transform(transform, source_result, result)
-                
-                # Add the result to the combined result
-                result[source_name] = source_result
-                
-            except Exception as e:
-                logger.error(f"Error executing source '{source_name}' in execution {execution_id}: {str(e)}")
-                raise
+        except Exception as e:
+            logger.error("Error executing source '%s' in execution %s: %s", source_name, execution_id, e)
+            raise
+    
+    def _get_source_stages(self, sources: Any) -> SourceStages:
+        """Get the data sources grouped into stages, grouping them on first use.
         
-        return result
+        Sources are kept in configuration order, and run one by one unless
+        they opt in with "parallel: true": consecutive parallel sources share
+        a stage, except that a source referencing the result of a source in
+        the current stage starts a new one, so every reference resolves
+        exactly as it would running one by one. Concurrency is opt-in since
+        only the configuration knows whether an operation, such as a raw
+        query, writes.
+        """
+        return self.source_stages.get(sources, self._group_source_stages)
     
-    def _resolve_params(self, params: Dict[str, Any], request_data: Dict[str, Any], current_result: Dict[str, Any]) -> Dict[str, Any]:
+    def _group_source_stages(self, sources: Any) -> SourceStages:
+        """Group data sources into stages."""
+        stages: List[Tuple[Dict[str, Any], ...]] = []
+        stage: List[Dict[str, Any]] = []
+        stage_names = set()
+        stage_parallel = False
+        for source in sources:
+            # Request data is always available; only results can depend on
+            # the current stage
+            params = source.get("params")
+            roots = {root for _, root, _, _ in self._get_compiled_params(params)} if params else set()
+            roots.discard("request")
+            parallel = bool(source.get("parallel"))
+            if stage and not (parallel and stage_parallel and roots.isdisjoint(stage_names)):
+                stages.append(tuple(stage))
+                stage, stage_names = [], set()
+            stage.append(source)
+            stage_names.add(source.get("name"))
+            stage_parallel = parallel
+        if stage:
+            stages.append(tuple(stage))
+        return tuple(stages)
+    
+    def _resolve_params(self, params: Optional[Dict[str, Any]], request_data: Dict[str, Any], current_result: Dict[str, Any]) -> Dict[str, Any]:
         """Resolve parameter values from request data and earlier results."""
+        if not params:
+            return {}
+        
         resolved = {}
         
+        for param_name, root, path, literal in self._get_compiled_params(params):
+            if root is None:
+                # Use the literal value
+                resolved[param_name] = literal
+            elif root == "request":
+                # Get from request data
+                resolved[param_name] = self._get_nested_value(request_data, path)
+            elif root in current_result:
+                # Get from a previous source result
+                resolved[param_name] = self._get_nested_value(current_result[root], path)
+            else:
+                # Default to None if not found
+                resolved[param_name] = None
+        
+        return resolved
+    
+    def _get_compiled_params(self, params: Dict[str, Any]) -> CompiledParams:
+        """Get the compiled form of a source's params, compiling them on first use.
+        
+        Each "$root.path" reference is split once instead of on every request.
+        """
+        return self.compiled_params.get(params, self._compile_params)
+    
+    def _compile_params(self, params: Dict[str, Any]) -> CompiledParams:
+        """Split a source's params into literals and parsed references."""
+        compiled = []
         for param_name, param_value in params.items():
             # If the parameter value is a reference to request data or previous result
             if isinstance(param_value, str) and param_value.startswith("$"):
                 path = param_value[1:].split(".")
-                
-                if path[0] == "request":
-                    # Get from request data
-                    value = self._get_nested_value(request_data, path[1:])
-                elif path[0] in current_result:
-                    # Get from a previous source result
-                    value = self._get_nested_value(current_result[path[0]], path[1:])
-                else:
-                    # Default to None if not found
-                    value = None
-                
-                resolved[param_name] = value
+                compiled.append((param_name, path[0], tuple(path[1:]), None))
             else:
-                # Use the literal value
-                resolved[param_name] = param_value
-        
-        return resolved
+                compiled.append((param_name, None, (), param_value))
+        return tuple(compiled)
     
-    def _get_nested_value(self, data: Dict[str, Any], path: List[str]) -> Any:
+    def _get_nested_value(self, data: Dict[str, Any], path: Tuple[str, ...]) -> Any:
         """Get a value from nested dictionaries using a path."""
         current = data
         
@@ -128,13 +270,25 @@ class DataOrchestrator:
     
     async def _execute_source_operation(self, source_type: str, operation: str, params: Dict[str, Any]) -> Any:
         """Execute an operation on a data source."""
-        source = self.sources[source_type]
+        method = self.operations.get((source_type, operation))
+        if method is None:
+            method = self._bind_operation(source_type, operation)
+        return await method(**params)
+    
+    def _bind_operation(self, source_type: str, operation: str) -> Callable[..., Any]:
+        """Look an operation method up on its source client and keep it bound.
         
-        # Call the operation method on the source client
-        if hasattr(source, operation) and callable(getattr(source, operation)):
-            return await getattr(source, operation)(**params)
-        else:
+        Only public methods are operations, so configuration can't reach the
+        clients' internals.
+        """
+        method = None
+        if not operation.startswith("_"):
+            method = getattr(self.sources[source_type], operation, None)
+        if not callable(method):
             raise ValueError(f"Operation '{operation}' not supported by source type '{source_type}'")
+        
+        self.operations[(source_type, operation)] = method
+        return method
     
     def _apply_transform(self, transform: Dict[str, Any], source_result: Any, current_result: Dict[str, Any]) -> Any:
         """Apply a transformation to the source result."""
@@ -142,7 +296,8 @@ class DataOrchestrator:
         transform_type = transform.get("type")
         
         if transform_type == "select_fields":
-            fields = transform.get("fields", [])
+            # Set membership instead of scanning the field list for every key
+            fields = frozenset(transform.get("fields", ()))
             if isinstance(source_result, dict):
                 return {k: v for k, v in source_result.items() if k in fields}
             elif isinstance(source_result, list) and all(isinstance(item, dict) for item in source_result):
@@ -1,4 +1,5 @@
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Dict, Optional
 
@@ -9,8 +10,11 @@ logger = get_logger(__name__)
 class ExecutionTracker:
     """Tracks the state of request executions."""
     
-    def __init__(self):
-        self.executions = {}
+    def __init__(self, max_history: int = 1000):
+        # The tracker lives for the lifetime of the app, so only the most
+        # recent executions are kept
+        self.max_history = max_history
+        self.executions = OrderedDict()
     
     def start_execution(self, domain: str, operation: str, request_data: Dict[str, Any]) -> str:
         """Start tracking a new execution.
@@ -37,7 +41,9 @@ class ExecutionTracker:
         }
         
         self.executions[execution_id] = execution
-        logger.info(f"Started execution {execution_id} for {domain}.{operation}")
+        if len(self.executions) > self.max_history:
+            self.executions.popitem(last=False)
+        logger.info("Started execution %s for %s.%s", execution_id, domain, operation)
         
         return execution_id
     
@@ -50,7 +56,7 @@ class ExecutionTracker:
             error: Error message if failed
         """
         if execution_id not in self.executions:
-            logger.warning(f"Attempted to complete unknown execution {execution_id}")
+            logger.warning("Attempted to complete unknown execution %s", execution_id)
             return
         
         execution = self.executions[execution_id]
@@ -59,9 +65,9 @@ class ExecutionTracker:
         
         if not success and error:
             execution["error"] = error
-            logger.error(f"Execution {execution_id} failed: {error}")
+            logger.error("Execution %s failed: %s", execution_id, error)
         else:
-            logger.info(f"Execution {execution_id} completed successfully")
+            logger.info("Execution %s completed successfully", execution_id)
     
     def get_execution(self, execution_id: str) -> Optional[Dict[str, Any]]:
         """Get details of a specific execution.
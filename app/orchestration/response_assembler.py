@@ -1,8 +1,21 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from app.common.utils.identity_cache import IdentityCache
+
+# A compiled response mapping: (target field, nested mapping or None, source name, path)
+CompiledMapping = Tuple[Tuple[str, Optional["CompiledMapping"], Optional[str], Tuple[str, ...]], ...]
 
 class ResponseAssembler:
     """Assembles the final response from orchestration results."""
     
+    def __init__(self):
+        # Compiled response mappings, keyed by their mapping configs
+        self.compiled_mappings = IdentityCache()
+    
+    def clear_caches(self) -> None:
+        """Forget all compiled response mappings, e.g. after a reload."""
+        self.compiled_mappings.clear()
+    
     def assemble_response(
         self, 
         execution_id: str, 
@@ -20,7 +33,7 @@ class ResponseAssembler:
             The assembled response or None if no data available
         """
         # Get the response mapping from the endpoint configuration
-        response_mapping = endpoint_config.get("response_mapping", {})
+        response_mapping = endpoint_config.get("response_mapping")
         
         # If no mapping is defined, return the primary data source result
         if not response_mapping:
@@ -30,13 +43,43 @@ class ResponseAssembler:
             return None
         
         # Apply the response mapping to create the final response
-        return self._map_response(response_mapping, data_result)
+        return self._map_response(self._get_compiled_mapping(response_mapping), data_result)
     
-    def _map_response(self, mapping: Dict[str, Any], data_result: Dict[str, Any]) -> Dict[str, Any]:
-        """Map data from multiple sources into a single response structure.
+    def _get_compiled_mapping(self, mapping: Dict[str, Any]) -> CompiledMapping:
+        """Get the compiled form of a response mapping, compiling it on first use."""
+        return self.compiled_mappings.get(mapping, self._compile_mapping)
+    
+    def _compile_mapping(self, mapping: Dict[str, Any]) -> CompiledMapping:
+        """Parse a response mapping configuration once into field instructions.
         
         Args:
             mapping: The response mapping configuration
+            
+        Returns:
+            The compiled mapping
+        """
+        compiled = []
+        
+        for target_field, source_ref in mapping.items():
+            # Compile nested mappings recursively
+            if isinstance(source_ref, dict):
+                compiled.append((target_field, self._compile_mapping(source_ref), None, ()))
+                continue
+            
+            # Skip anything that is not a source reference
+            if not isinstance(source_ref, str) or not source_ref.startswith("$"):
+                continue
+            
+            parts = source_ref[1:].split(".")
+            compiled.append((target_field, None, parts[0], tuple(parts[1:])))
+        
+        return tuple(compiled)
+    
+    def _map_response(self, mapping: CompiledMapping, data_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Map data from multiple sources into a single response structure.
+        
+        Args:
+            mapping: The compiled response mapping
             data_result: The data result from orchestration
             
         Returns:
@@ -44,36 +87,25 @@ class ResponseAssembler:
         """
         response = {}
         
-        for target_field, source_ref in mapping.items():
+        for target_field, nested, source_name, path in mapping:
             # Handle nested mappings recursively
-            if isinstance(source_ref, dict):
-                response[target_field] = self._map_response(source_ref, data_result)
+            if nested is not None:
+                response[target_field] = self._map_response(nested, data_result)
                 continue
-                
-            # Skip if not a string reference
-            if not isinstance(source_ref, str):
+            
+            # Skip if the source is not in the data result
+            if source_name not in data_result:
                 continue
-                
-            # Parse the source reference
-            if source_ref.startswith("$"):
-                parts = source_ref[1:].split(".")
-                source_name = parts[0]
-                
-                # Skip if the source is not in the data result
-                if source_name not in data_result:
-                    continue
-                
-                # Get the value from the source
-                if len(parts) > 1:
-                    value = self._get_nested_value(data_result[source_name], parts[1:])
-                else:
-                    value = data_result[source_name]
-                
-                response[target_field] = value
+            
+            # Get the value from the source
+            if path:
+                response[target_field] = self._get_nested_value(data_result[source_name], path)
+            else:
+                response[target_field] = data_result[source_name]
         
         return response
     
-    def _get_nested_value(self, data: Any, path: list) -> Any:
+    def _get_nested_value(self, data: Any, path: Tuple[str, ...]) -> Any:
         """Get a value from nested data structures using a path."""
         current = data
         
@@ -14,6 +14,7 @@ Run this before testing the Customer 360 API.
 
 import argparse
 import json
+import operator
 import random
 import time
 from datetime import datetime, timedelta
@@ -173,6 +174,40 @@ CREDIT_SCORES = {
     }
 }
 
+# The mock data never changes, so orders are sorted (most recent first) once
+SORTED_ORDERS = {
+    customer_id: sorted(orders, key=operator.itemgetter('order_date'), reverse=True)
+    for customer_id, orders in ORDERS.items()
+}
+
+# Recommendations for each churn risk level
+RECOMMENDATIONS = {
+    "Low": "Standard Discount Offer",
+    "Medium": "Loyalty Program Upgrade",
+    "High": "Premium Subscription at Special Rate"
+}
+
+# Response bodies that only depend on the mock data, encoded once
+CUSTOMER_BODIES = {
+    customer_id: json.dumps(customer).encode()
+    for customer_id, customer in CUSTOMERS.items()
+}
+CREDIT_SCORE_BODIES = {
+    customer_id: json.dumps(credit_score).encode()
+    for customer_id, credit_score in CREDIT_SCORES.items()
+}
+FEATURE_BODIES = {
+    customer_id: json.dumps({
+        'customer_id': [customer_id],
+        **{k: [v] for k, v in features.items()}
+    }).encode()
+    for customer_id, features in FEATURES.items()
+}
+CUSTOMER_NOT_FOUND_BODY = json.dumps({"error": "Customer not found"}).encode()
+FEATURES_NOT_FOUND_BODY = json.dumps({"error": "Features not found"}).encode()
+ENDPOINT_NOT_FOUND_BODY = json.dumps({"error": "Endpoint not found"}).encode()
+INVALID_REQUEST_BODY = json.dumps({"error": "Invalid request data"}).encode()
+
 class MockServiceHandler(BaseHTTPRequestHandler):
     """HTTP request handler for mock services"""
     
@@ -185,25 +220,20 @@ class MockServiceHandler(BaseHTTPRequestHandler):
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
                 self.end_headers()
-                self.wfile.write(json.dumps(CUSTOMERS[customer_id]).encode())
+                self.wfile.write(CUSTOMER_BODIES[customer_id])
             else:
                 self.send_response(404)
                 self.send_header('Content-type', 'application/json')
                 self.end_headers()
-                self.wfile.write(json.dumps({"error": "Customer not found"}).encode())
+                self.wfile.write(CUSTOMER_NOT_FOUND_BODY)
         
         # Database endpoint - recent orders
         elif re.match(r'^/api/v1/database/customers/cust_\d+/orders$', self.path):
             parts = self.path.split('/')
             customer_id = parts[-2]
             
-            if customer_id in ORDERS:
-                # Sort orders by date (most recent first)
-                sorted_orders = sorted(
-                    ORDERS[customer_id], 
-                    key=lambda x: x['order_date'], 
-                    reverse=True
-                )
+            if customer_id in SORTED_ORDERS:
+                sorted_orders = SORTED_ORDERS[customer_id]
                 
                 # Get limit from query string, default to 5
                 limit = 5
@@ -225,7 +255,7 @@ class MockServiceHandler(BaseHTTPRequestHandler):
                 self.send_response(404)
                 self.send_header('Content-type', 'application/json')
                 self.end_headers()
-                self.wfile.write(json.dumps({"error": "Customer not found"}).encode())
+                self.wfile.write(CUSTOMER_NOT_FOUND_BODY)
         
         # Credit API endpoint
         elif re.match(r'^/api/v1/credit/customers/cust_\d+/credit-score$', self.path):
@@ -235,17 +265,17 @@ class MockServiceHandler(BaseHTTPRequestHandler):
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
                 self.end_headers()
-                self.wfile.write(json.dumps(CREDIT_SCORES[customer_id]).encode())
+                self.wfile.write(CREDIT_SCORE_BODIES[customer_id])
             else:
                 self.send_response(404)
                 self.send_header('Content-type', 'application/json')
                 self.end_headers()
-                self.wfile.write(json.dumps({"error": "Customer not found"}).encode())
+                self.wfile.write(CUSTOMER_NOT_FOUND_BODY)
         else:
             self.send_response(404)
             self.send_header('Content-type', 'application/json')
             self.end_headers()
-            self.wfile.write(json.dumps({"error": "Endpoint not found"}).encode())
+            self.wfile.write(ENDPOINT_NOT_FOUND_BODY)
     
     def do_POST(self):
         """Handle POST requests"""
@@ -263,19 +293,15 @@ class MockServiceHandler(BaseHTTPRequestHandler):
                 # Simulate a delay for realism
                 time.sleep(0.2)
                 
-                features = FEATURES[customer_id]
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
                 self.end_headers()
-                self.wfile.write(json.dumps({
-                    'customer_id': [customer_id],
-                    **{k: [v] for k, v in features.items()}
-                }).encode())
+                self.wfile.write(FEATURE_BODIES[customer_id])
             else:
                 self.send_response(404)
                 self.send_header('Content-type', 'application/json')
                 self.end_headers()
-                self.wfile.write(json.dumps({"error": "Features not found"}).encode())
+                self.wfile.write(FEATURES_NOT_FOUND_BODY)
         
         # ML model endpoint
         elif self.path == '/api/v1/ml/predict/churn':
@@ -300,31 +326,24 @@ class MockServiceHandler(BaseHTTPRequestHandler):
                 elif churn_probability > 0.3:
                     risk_level = "Medium"
                 
-                # Generate a recommendation based on the risk level
-                recommendations = {
-                    "Low": "Standard Discount Offer",
-                    "Medium": "Loyalty Program Upgrade",
-                    "High": "Premium Subscription at Special Rate"
-                }
-                
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
                 self.end_headers()
                 self.wfile.write(json.dumps({
                     "probability": churn_probability,
                     "risk_level": risk_level,
-                    "recommendation": recommendations[risk_level]
+                    "recommendation": RECOMMENDATIONS[risk_level]
                 }).encode())
             else:
                 self.send_response(400)
                 self.send_header('Content-type', 'application/json')
                 self.end_headers()
-                self.wfile.write(json.dumps({"error": "Invalid request data"}).encode())
+                self.wfile.write(INVALID_REQUEST_BODY)
         else:
             self.send_response(404)
             self.send_header('Content-type', 'application/json')
             self.end_headers()
-            self.wfile.write(json.dumps({"error": "Endpoint not found"}).encode())
+            self.wfile.write(ENDPOINT_NOT_FOUND_BODY)
 
 def main():
     parser = argparse.ArgumentParser(description='Run mock services for Customer 360 example')
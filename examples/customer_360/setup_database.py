@@ -182,6 +182,10 @@ def setup_database():
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
     
+    # Use write-ahead logging, so readers don't block the writer or each
+    # other; the mode is stored in the file and applies to every connection
+    cursor.execute('PRAGMA journal_mode=WAL')
+    
     # Create customers table
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS customers (
@@ -246,6 +250,15 @@ def setup_database():
     )
     ''')
     
+    # Index the ORDER BY ... LIMIT lookups so SQLite can read the newest rows
+    # straight from the index instead of sorting every matching row
+    # Customers are paged by (created_at, customer_id), which replaces the
+    # narrower created_at index of earlier versions of this script
+    cursor.execute('DROP INDEX IF EXISTS idx_customers_created_at')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_customers_created_at_id ON customers (created_at, customer_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_orders_customer_date ON orders (customer_id, order_date)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_churn_predictions_customer_created ON churn_predictions (customer_id, created_at)')
+    
     # Insert data into customers table
     for customer_id, customer in CUSTOMERS.items():
         cursor.execute('''
@@ -3,7 +3,21 @@
 import uvicorn
 from app import create_app
 
-app = create_app()
+_app = None
+
+def __getattr__(name):
+    """Build the module-level app for "uvicorn main:app" on first access.
+    
+    Creating it at import time would also build an app in the reloader
+    process and in every process that merely imports this module.
+    """
+    global _app
+    if name != "app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if _app is None:
+        _app = create_app()
+    return _app
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    # Let uvicorn build the app through the factory in the serving process
+    uvicorn.run("app:create_app", factory=True, host="0.0.0.0", port=8000, reload=True)
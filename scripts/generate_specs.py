@@ -10,6 +10,8 @@ from pathlib import Path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from app import create_app
+from app.common.models.request_models import CustomerRequest
+from app.common.models.response_models import CustomerResponse
 
 def generate_openapi_spec():
     """Generate OpenAPI specification from the FastAPI app."""
@@ -39,10 +41,6 @@ def generate_schemas():
     """Generate JSON schemas from Pydantic models."""
     print("Generating JSON schemas from Pydantic models...")
     
-    # Import models
-    from app.common.models.request_models import CustomerRequest
-    from app.common.models.response_models import CustomerResponse
-    
     # Create the schemas directory if it doesn't exist
     schemas_dir = Path('api_spec/schemas')
     schemas_dir.mkdir(exist_ok=True, parents=True)
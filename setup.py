@@ -7,10 +7,13 @@ setup(
     install_requires=[
         "fastapi>=0.100.0",
         "pydantic>=2.0.0",
-        "uvicorn>=0.22.0",
+        "uvicorn[standard]>=0.22.0",
         "requests>=2.31.0",
+        "httpx>=0.25.0",
+        "httpcore>=1.0.0",
         "sqlalchemy>=2.0.0",
         "pyyaml>=6.0",
+        "orjson>=3.8.0",
         "feast>=0.30.0",
     ],
     python_requires='>=3.8',
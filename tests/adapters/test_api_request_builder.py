@@ -0,0 +1,87 @@
+import pytest
+
+from app.adapters.api.api_request_builder import ApiRequestBuilder
+
+def test_build_request_body_encodes_json_bytes():
+    """Test that JSON bodies are encoded straight to bytes."""
+    body, headers = ApiRequestBuilder.build_request_body({"customer_id": "cust_123", "limit": 5})
+    
+    assert body == b'{"customer_id":"cust_123","limit":5}'
+    assert headers == {"Content-Type": "application/json"}
+
+def test_build_request_body_encodes_form_data():
+    """Test that form bodies are URL-encoded."""
+    body, headers = ApiRequestBuilder.build_request_body(
+        {"name": "John Doe", "limit": 5},
+        "application/x-www-form-urlencoded"
+    )
+    
+    assert body == b"name=John+Doe&limit=5"
+    assert headers == {"Content-Type": "application/x-www-form-urlencoded"}
+
+def test_build_request_body_encodes_text_and_bytes():
+    """Test that text and binary bodies are encoded to bytes."""
+    assert ApiRequestBuilder.build_request_body("héllo", "text/plain")[0] == "héllo".encode("utf-8")
+    assert ApiRequestBuilder.build_request_body(bytearray(b"\x00\x01"), "application/octet-stream")[0] == b"\x00\x01"
+
+def test_build_request_body_rejects_unknown_content_type():
+    """Test that unsupported content types raise an error."""
+    with pytest.raises(ValueError):
+        ApiRequestBuilder.build_request_body({}, "application/xml")
+
+def test_register_encoder_adds_content_type(monkeypatch):
+    """Test that registered encoders are used for their content type."""
+    from app.adapters.api import api_request_builder
+    
+    # Register on a copy so other tests keep the default encoders
+    monkeypatch.setattr(api_request_builder, "_ENCODERS", dict(api_request_builder._ENCODERS))
+    ApiRequestBuilder.register_encoder("application/xml", lambda data: b"<xml/>")
+    
+    body, headers = ApiRequestBuilder.build_request_body({}, "application/xml")
+    
+    assert body == b"<xml/>"
+    assert headers == {"Content-Type": "application/xml"}
+
+def test_parse_response_decodes_json():
+    """Test that JSON responses are parsed with or without a content type."""
+    assert ApiRequestBuilder.parse_response('{"a": [1, 2]}', "application/json") == {"a": [1, 2]}
+    assert ApiRequestBuilder.parse_response('  [1, 2]') == [1, 2]
+    assert ApiRequestBuilder.parse_response('\r\n\t{"a": 1}\n') == {"a": 1}
+
+def test_parse_response_recognizes_json_mime_types():
+    """Test that JSON MIME types are matched regardless of parameters and case."""
+    assert ApiRequestBuilder.parse_response('"ok"', "application/json; charset=utf-8") == "ok"
+    assert ApiRequestBuilder.parse_response('"ok"', "Application/Problem+JSON") == "ok"
+    assert ApiRequestBuilder.parse_response('"ok"', "text/plain") == '"ok"'
+
+def test_parse_response_falls_back_to_text():
+    """Test that non-JSON responses are returned as text."""
+    assert ApiRequestBuilder.parse_response("") is None
+    assert ApiRequestBuilder.parse_response("plain text") == "plain text"
+    assert ApiRequestBuilder.parse_response("{not json") == "{not json"
+    assert ApiRequestBuilder.parse_response("   ") == "   "
+
+def test_build_url_joins_base_and_path():
+    """Test that exactly one slash separates the base URL and path."""
+    assert ApiRequestBuilder.build_url("http://svc", "/customers") == "http://svc/customers"
+    assert ApiRequestBuilder.build_url("http://svc/", "customers") == "http://svc/customers"
+    assert ApiRequestBuilder.build_url("http://svc//", "//customers") == "http://svc/customers"
+
+def test_build_url_encodes_query_params():
+    """Test that query parameters are encoded, with sequences repeated."""
+    url = ApiRequestBuilder.build_url("http://svc", "/orders", {"limit": 5, "status": ["open", "paid"]})
+    
+    assert url == "http://svc/orders?limit=5&status=open&status=paid"
+    assert ApiRequestBuilder.build_url("http://svc", "/orders", {}) == "http://svc/orders"
+
+def test_build_headers_copies_only_when_merging():
+    """Test that defaults are returned as-is unless headers are merged into a copy."""
+    defaults = {"Accept": "application/json"}
+    
+    assert ApiRequestBuilder.build_headers(defaults) is defaults
+    assert ApiRequestBuilder.build_headers() == {}
+    
+    merged = ApiRequestBuilder.build_headers(defaults, {"Accept": "text/plain", "X-Trace": "1"})
+    
+    assert merged == {"Accept": "text/plain", "X-Trace": "1"}
+    assert defaults == {"Accept": "application/json"}
@@ -0,0 +1,271 @@
+import pytest
+import sqlalchemy
+
+from app.adapters.database import database_client as database_client_module
+from app.adapters.database.database_client import DatabaseClient
+from app.common.utils.ttl_cache import TTLCache
+
+@pytest.fixture
+def file_database_client(tmp_path, data_source_config, register_engine):
+    """Create a database client backed by a SQLite file with sample rows."""
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    with engine.begin() as connection:
+        connection.exec_driver_sql("CREATE TABLE items (item_id TEXT PRIMARY KEY, name TEXT, quantity INTEGER)")
+        connection.exec_driver_sql("INSERT INTO items VALUES ('a', 'Apple', 3), ('b', 'Banana', 5)")
+    
+    client = DatabaseClient(data_source_config)
+    client.engines["default"] = register_engine(engine)
+    
+    yield client
+    
+    engine.dispose()
+
+@pytest.fixture
+def customer_database_client(tmp_path, data_source_config, register_engine):
+    """Create a database client backed by a SQLite file with one customer."""
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'customers.db'}")
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "CREATE TABLE customers (customer_id TEXT PRIMARY KEY, name TEXT, email TEXT, phone TEXT, "
+            "address TEXT, date_of_birth TEXT, created_at TIMESTAMP, updated_at TIMESTAMP)"
+        )
+        connection.exec_driver_sql(
+            "INSERT INTO customers (customer_id, name, email) VALUES ('cust_1', 'Jane Doe', 'jane@example.com')"
+        )
+        connection.exec_driver_sql(
+            "CREATE TABLE credit_scores (customer_id TEXT PRIMARY KEY, score INTEGER, risk_tier TEXT, updated_at TEXT)"
+        )
+        connection.exec_driver_sql("INSERT INTO credit_scores VALUES ('cust_1', 720, 'Low', '2023-03-01')")
+    
+    client = DatabaseClient(data_source_config)
+    client.engines["default"] = register_engine(engine)
+    
+    yield client
+    
+    engine.dispose()
+
+@pytest.mark.asyncio
+async def test_query_returns_rows_as_dicts(file_database_client):
+    """Test that query results are returned as column-keyed dicts."""
+    rows = await file_database_client.query("SELECT item_id, name, quantity FROM items ORDER BY item_id")
+    
+    assert rows == [
+        {"item_id": "a", "name": "Apple", "quantity": 3},
+        {"item_id": "b", "name": "Banana", "quantity": 5}
+    ]
+
+@pytest.mark.asyncio
+async def test_query_respects_max_rows(file_database_client):
+    """Test that max_rows limits how many rows are fetched."""
+    rows = await file_database_client.query("SELECT item_id FROM items ORDER BY item_id", max_rows=1)
+    
+    assert rows == [{"item_id": "a"}]
+
+def test_sqlite_pool_is_sized_from_source_config(tmp_path):
+    """Test that pool settings from the source config are applied."""
+    engine, max_connections = database_client_module._create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        {"pool_size": 4, "max_overflow": 2, "pool_timeout": 5}
+    )
+    
+    try:
+        assert engine.pool.size() == 4
+        assert engine.pool._max_overflow == 2
+        assert engine.pool._timeout == 5
+        assert max_connections == 6
+    finally:
+        engine.dispose()
+
+@pytest.mark.asyncio
+async def test_update_customer_returns_updated_row(customer_database_client):
+    """Test that an update returns the updated customer, or None if missing."""
+    updated = await customer_database_client.update_customer("cust_1", {"name": "Jane Smith", "unknown": "ignored"})
+    
+    assert updated["name"] == "Jane Smith"
+    assert updated["email"] == "jane@example.com"
+    assert await customer_database_client.update_customer("cust_missing", {"name": "Nobody"}) is None
+
+@pytest.mark.asyncio
+async def test_delete_customer_reports_whether_a_row_was_deleted(customer_database_client):
+    """Test that deleting reports True once and False when nothing matches."""
+    assert await customer_database_client.delete_customer("cust_1") is True
+    assert await customer_database_client.delete_customer("cust_1") is False
+
+@pytest.mark.asyncio
+async def test_credit_score_is_cached_until_customer_changes(customer_database_client, monkeypatch):
+    """Test that lookups are served from the cache until the customer is updated."""
+    monkeypatch.setattr(database_client_module, "_lookup_cache", TTLCache())
+    engine = customer_database_client.engines["default"]
+    
+    first = await customer_database_client.get_customer_credit_score("cust_1")
+    with engine.begin() as connection:
+        connection.exec_driver_sql("UPDATE credit_scores SET score = 650 WHERE customer_id = 'cust_1'")
+    
+    assert (await customer_database_client.get_customer_credit_score("cust_1"))["score"] == first["score"] == 720
+    
+    await customer_database_client.update_customer("cust_1", {"name": "Jane Smith"})
+    assert (await customer_database_client.get_customer_credit_score("cust_1"))["score"] == 650
+
+@pytest.mark.asyncio
+async def test_list_customers_continues_after_cursor(customer_database_client):
+    """Test that keyset pages follow on from the offset pages they replace."""
+    engine = customer_database_client.engines["default"]
+    with engine.begin() as connection:
+        connection.exec_driver_sql("UPDATE customers SET created_at = '2023-01-01'")
+        connection.exec_driver_sql(
+            "INSERT INTO customers (customer_id, name, email, created_at) VALUES "
+            "('cust_2', 'B', 'b@example.com', '2023-01-02'), ('cust_3', 'C', 'c@example.com', '2023-01-02')"
+        )
+    
+    first_page = await customer_database_client.list_customers(limit=2)
+    last = first_page[-1]
+    next_page = await customer_database_client.list_customers(limit=2, cursor=(last["created_at"], last["customer_id"]))
+    
+    assert [c["customer_id"] for c in first_page] == ["cust_3", "cust_2"]
+    assert next_page == await customer_database_client.list_customers(limit=2, offset=2)
+    assert [c["customer_id"] for c in next_page] == ["cust_1"]
+
+@pytest.mark.asyncio
+async def test_warmup_opens_a_connection_per_source(file_database_client):
+    """Test that warmup runs a query against each configured database."""
+    engine = file_database_client.engines["default"]
+    
+    assert await file_database_client.warmup() == 1
+    assert engine.pool.checkedin() == 1
+
+@pytest.mark.asyncio
+async def test_customer_360_combines_related_lookups(customer_database_client):
+    """Test that the 360 view returns the customer with each related lookup."""
+    engine = customer_database_client.engines["default"]
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "CREATE TABLE customer_features (customer_id TEXT PRIMARY KEY, customer_lifetime_value REAL, "
+            "days_since_last_purchase INTEGER, purchase_frequency REAL, average_order_value REAL, total_purchases INTEGER)"
+        )
+        connection.exec_driver_sql(
+            "CREATE TABLE orders (order_id TEXT PRIMARY KEY, customer_id TEXT, order_date TEXT, "
+            "total_amount REAL, status TEXT, items_count INTEGER)"
+        )
+        connection.exec_driver_sql(
+            "CREATE TABLE churn_predictions (id INTEGER PRIMARY KEY, customer_id TEXT, probability REAL, "
+            "risk_level TEXT, recommendation TEXT, created_at TEXT)"
+        )
+        connection.exec_driver_sql(
+            "INSERT INTO orders VALUES ('o1', 'cust_1', '2023-01-01', 10.0, 'shipped', 1), "
+            "('o2', 'cust_1', '2023-02-01', 20.0, 'shipped', 2), ('o3', 'cust_1', '2023-03-01', 30.0, 'pending', 3)"
+        )
+    
+    view = await customer_database_client.get_customer_360("cust_1", orders_limit=2)
+    
+    assert view["customer"]["name"] == "Jane Doe"
+    assert view["credit_score"]["score"] == 720
+    assert view["features"] is None
+    assert view["churn_prediction"] is None
+    assert [order["order_id"] for order in view["recent_orders"]] == ["o3", "o2"]
+    assert await customer_database_client.get_customer_360("cust_missing") is None
+
+def test_pool_size_can_be_overridden_from_environment(tmp_path, monkeypatch):
+    """Test that the environment overrides the configured pool size."""
+    monkeypatch.setenv("ORCH_DB_POOL_SIZE", "8")
+    monkeypatch.setenv("ORCH_DB_MAX_OVERFLOW", "4")
+    engine, max_connections = database_client_module._create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        {"pool_size": 2, "max_overflow": 0}
+    )
+    
+    try:
+        assert engine.pool.size() == 8
+        assert max_connections == 12
+    finally:
+        engine.dispose()
+
+def test_sqlite_connections_are_configured(tmp_path):
+    """Test that new SQLite connections get the performance settings."""
+    engine, _ = database_client_module._create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    
+    try:
+        with engine.connect() as connection:
+            # The journal mode is stored in the file, so it is left alone
+            assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "delete"
+            assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+            assert connection.exec_driver_sql("PRAGMA mmap_size").scalar() == 268435456
+            assert connection.exec_driver_sql("PRAGMA busy_timeout").scalar() == 5000
+    finally:
+        engine.dispose()
+
+def test_engines_are_created_for_all_configured_sources():
+    """Test that the client creates every configured engine up front."""
+    sources = {"default": {"connection_string": "sqlite://"}, "reporting": {"connection_string": "sqlite:///:memory:"}}
+    
+    class StubConfigManager:
+        def get_data_source_config(self, source_type, source_id):
+            return sources.get(source_id)
+        
+        def get_all_data_sources(self, source_type):
+            return sources
+    
+    client = DatabaseClient(StubConfigManager())
+    
+    assert set(client.engines) == {"default", "reporting"}
+
+@pytest.mark.asyncio
+async def test_create_customers_inserts_all_rows(customer_database_client):
+    """Test that a batch of customers is inserted and returned in order."""
+    created = await customer_database_client.create_customers([
+        {"name": "Ann", "email": "ann@example.com"},
+        {"name": "Bob", "email": "bob@example.com", "phone": "+100"}
+    ])
+    
+    assert [customer["name"] for customer in created] == ["Ann", "Bob"]
+    assert created[0]["customer_id"] != created[1]["customer_id"]
+    
+    # Records are shaped like the single create's, as stored by the database
+    single = await customer_database_client.create_customer({"name": "Cy", "email": "cy@example.com"})
+    assert list(created[1]) == list(single)
+    assert type(created[1]["created_at"]) is type(single["created_at"])
+    
+    stored = await customer_database_client.get_customer(created[1]["customer_id"])
+    assert stored == created[1]
+    assert await customer_database_client.create_customers([]) == []
+
+@pytest.mark.asyncio
+async def test_create_customers_spans_several_batches(customer_database_client, monkeypatch):
+    """Test that batches larger than one statement keep their order."""
+    monkeypatch.setattr(database_client_module, "_INSERT_CUSTOMERS_BATCH_SIZE", 2)
+    names = [f"Customer {i}" for i in range(5)]
+    
+    created = await customer_database_client.create_customers([{"name": name, "email": "c@example.com"} for name in names])
+    
+    assert [customer["name"] for customer in created] == names
+
+def test_reload_engines_rebuilds_changed_sources(tmp_path, monkeypatch):
+    """Test that a reload replaces only the engines whose source configuration changed."""
+    monkeypatch.setattr(database_client_module, "_shared_engines", {})
+    monkeypatch.setattr(database_client_module, "_engine_executors", {})
+    sources = {
+        "default": {"connection_string": f"sqlite:///{tmp_path / 'a.db'}"},
+        "reporting": {"connection_string": f"sqlite:///{tmp_path / 'b.db'}", "pool_size": 2}
+    }
+    
+    class StubConfigManager:
+        def get_data_source_config(self, source_type, source_id):
+            return sources.get(source_id)
+        
+        def get_all_data_sources(self, source_type):
+            return sources
+    
+    client = DatabaseClient(StubConfigManager())
+    default_engine, old_engine = client.engines["default"], client.engines["reporting"]
+    
+    sources = {**sources, "reporting": {**sources["reporting"], "pool_size": 3}}
+    
+    try:
+        assert client.reload_engines() == 1
+        assert client.engines["default"] is default_engine
+        assert client.engines["reporting"] is not old_engine
+        assert client.engines["reporting"].pool.size() == 3
+        assert old_engine not in database_client_module._engine_executors
+    finally:
+        for engine, executor in database_client_module._engine_executors.items():
+            engine.dispose()
+            executor.shutdown(wait=False)
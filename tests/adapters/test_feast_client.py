@@ -0,0 +1,47 @@
+import pytest
+
+from app.adapters.feast.feast_client import FeastClient
+
+@pytest.mark.asyncio
+async def test_customers_features_are_fetched_in_one_lookup(data_source_config, monkeypatch):
+    """Test that several customers' features come from one online lookup."""
+    client = FeastClient(data_source_config)
+    calls = []
+    
+    async def mock_get_online_features(entity_rows, feature_refs, source_id="default"):
+        calls.append(entity_rows)
+        return {"lifetime_value": [100.0, 250.5], "total_purchases": [3, 7]}
+    
+    monkeypatch.setattr(client, "get_online_features", mock_get_online_features)
+    
+    result = await client.get_customers_features(["cust_1", "cust_2"], ["lifetime_value", "total_purchases"])
+    
+    assert calls == [[{"customer_id": "cust_1"}, {"customer_id": "cust_2"}]]
+    assert result == {
+        "cust_1": {"lifetime_value": 100.0, "total_purchases": 3},
+        "cust_2": {"lifetime_value": 250.5, "total_purchases": 7}
+    }
+
+@pytest.mark.asyncio
+async def test_online_features_are_fetched_off_the_event_loop(data_source_config, monkeypatch):
+    """Test that the blocking Feast lookup runs on a worker thread."""
+    import threading
+    
+    class StubResponse:
+        def to_dict(self):
+            return {"customer_id": ["cust_1"], "lifetime_value": [100.0]}
+    
+    class StubFeatureStore:
+        def get_online_features(self, entity_rows, features):
+            threads.append(threading.current_thread())
+            return StubResponse()
+    
+    threads = []
+    client = FeastClient(data_source_config)
+    client.feature_stores["default"] = StubFeatureStore()
+    monkeypatch.setattr(FeastClient, "feast", object())
+    
+    result = await client.get_online_features([{"customer_id": "cust_1"}], ["lifetime_value"])
+    
+    assert result == {"customer_id": ["cust_1"], "lifetime_value": [100.0]}
+    assert threads and threads[0] is not threading.main_thread()
@@ -0,0 +1,315 @@
+import httpcore
+import httpx
+import pytest
+
+from app.adapters.api import http_client as http_client_module
+from app.adapters.api.http_client import HttpClient
+
+class StubConfigManager:
+    """Data source config manager stub serving fixed API source configurations."""
+    
+    def __init__(self, sources):
+        self.sources = sources
+    
+    def get_data_source_config(self, source_type, source_id):
+        return self.sources.get(source_id)
+
+@pytest.fixture
+def shared_clients(monkeypatch):
+    """Give each test its own shared client and transport registries."""
+    clients = {}
+    monkeypatch.setattr(http_client_module, "_shared_clients", clients)
+    monkeypatch.setattr(http_client_module, "_shared_client_configs", {})
+    monkeypatch.setattr(http_client_module, "_retired_clients", [])
+    monkeypatch.setattr(http_client_module, "_shared_transports", {})
+    # Don't let proxies set in the environment bypass the stub transports
+    monkeypatch.setattr(http_client_module, "getproxies", dict)
+    return clients
+
+def test_client_pool_limits_come_from_config(shared_clients, monkeypatch):
+    """Test that connection pool limits are read from the source configuration."""
+    created = []
+    
+    def capture_transport(**kwargs):
+        created.append(kwargs)
+        return httpx.MockTransport(lambda request: httpx.Response(200))
+    
+    monkeypatch.setattr(http_client_module, "CachingDNSTransport", capture_transport)
+    client = HttpClient(StubConfigManager({
+        "default": {"base_url": "http://svc"},
+        "tuned": {"base_url": "http://svc", "max_connections": 50, "max_keepalive_connections": 5}
+    }))
+    
+    client._get_client("default")
+    client._get_client("tuned")
+    
+    assert created[0]["limits"] == httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0)
+    assert created[1]["limits"] == httpx.Limits(max_connections=50, max_keepalive_connections=5, keepalive_expiry=30.0)
+    assert created[0]["http2"] is False
+    assert created[0]["dns_ttl"] == 60.0
+    assert set(shared_clients) == {"default", "tuned"}
+
+@pytest.mark.asyncio
+async def test_requests_reuse_one_client_per_source(shared_clients, monkeypatch):
+    """Test that requests, including those to absolute URLs, share the source's client."""
+    seen = []
+    
+    async def handler(request):
+        seen.append(str(request.url))
+        return httpx.Response(200, json={"ok": True})
+    
+    transport = httpx.MockTransport(handler)
+    created = []
+    real_client = httpx.AsyncClient
+    
+    def client_with_transport(**kwargs):
+        kwargs["transport"] = transport
+        client = real_client(**kwargs)
+        created.append(client)
+        return client
+    
+    monkeypatch.setattr(httpx, "AsyncClient", client_with_transport)
+    client = HttpClient(StubConfigManager({"default": {"base_url": "http://svc"}}))
+    
+    assert await client.get("/customers") == {"ok": True}
+    assert await client.get("http://other/orders") == {"ok": True}
+    
+    assert seen == ["http://svc/customers", "http://other/orders"]
+    assert len(created) == 1
+    await created[0].aclose()
+
+@pytest.mark.asyncio
+async def test_dns_lookups_are_cached(monkeypatch):
+    """Test that a host is resolved once and connections fall back through its addresses."""
+    from app.adapters.api import dns_cache
+    
+    lookups = []
+    
+    class Loop:
+        async def getaddrinfo(self, host, port, type):
+            lookups.append(host)
+            return [(None, None, None, "", ("::1", port)), (None, None, None, "", ("10.0.0.7", port))]
+    
+    class RecordingBackend:
+        def __init__(self):
+            self.hosts = []
+        
+        async def connect_tcp(self, host, port, **kwargs):
+            self.hosts.append(host)
+            if host == "::1":
+                raise httpcore.ConnectError("refused")
+            return host
+    
+    monkeypatch.setattr(dns_cache, "_resolved_hosts", {})
+    monkeypatch.setattr(dns_cache.asyncio, "get_running_loop", lambda: Loop())
+    inner = RecordingBackend()
+    backend = dns_cache.CachingDNSBackend(inner)
+    
+    for _ in range(2):
+        await backend.connect_tcp("api.example.com", 443)
+    
+    assert lookups == ["api.example.com"]
+    assert inner.hosts == ["::1", "10.0.0.7", "::1", "10.0.0.7"]
+
+@pytest.mark.asyncio
+async def test_error_responses_use_service_message(shared_clients, monkeypatch):
+    """Test that JSON error bodies provide the ApiError message and status code."""
+    from app.common.errors.custom_exceptions import ApiError
+    
+    transport = httpx.MockTransport(lambda request: httpx.Response(404, json={"message": "Customer not found"}))
+    monkeypatch.setattr(http_client_module, "CachingDNSTransport", lambda **kwargs: transport)
+    client = HttpClient(StubConfigManager({"default": {"base_url": "http://svc"}}))
+    
+    with pytest.raises(ApiError) as exc_info:
+        await client.get("/customers/missing")
+    
+    assert "Customer not found" in str(exc_info.value)
+    assert exc_info.value.status_code == 404
+    await shared_clients["default"].aclose()
+
+def test_non_json_responses_return_text():
+    """Test that responses without a JSON content type are returned as text."""
+    json_response = httpx.Response(200, json={"score": 720})
+    text_response = httpx.Response(200, text="ok")
+    
+    assert HttpClient._parse_response(json_response) == {"score": 720}
+    assert HttpClient._parse_response(text_response) == {"content": "ok", "status_code": 200}
+
+@pytest.mark.parametrize("content_type", ["application/problem+json", "text/json", "Application/JSON; charset=utf-8"])
+def test_json_content_type_variants_are_parsed(content_type):
+    """Test that every JSON media type is parsed, whatever its case or parameters."""
+    response = httpx.Response(200, content=b'{"score": 720}', headers={"content-type": content_type})
+    
+    assert HttpClient._parse_response(response) == {"score": 720}
+
+@pytest.mark.asyncio
+async def test_warmup_connects_to_every_source(shared_clients, monkeypatch):
+    """Test that warmup sends a HEAD request to each source and tolerates failures."""
+    seen = []
+    
+    def handler(request):
+        seen.append((request.method, str(request.url)))
+        assert request.extensions["timeout"]["connect"] == http_client_module._WARMUP_TIMEOUT
+        if request.url.host == "down":
+            raise httpx.ConnectError("Connection refused")
+        return httpx.Response(405)
+    
+    monkeypatch.setattr(http_client_module, "CachingDNSTransport", lambda **kwargs: httpx.MockTransport(handler))
+    config_manager = StubConfigManager({"up": {"base_url": "http://up/api"}, "down": {"base_url": "http://down"}})
+    config_manager.get_all_data_sources = lambda source_type: config_manager.sources
+    client = HttpClient(config_manager)
+    
+    assert await client.warmup() == 1
+    assert sorted(seen) == [("HEAD", "http://down/"), ("HEAD", "http://up/api/")]
+    
+    for shared_client in shared_clients.values():
+        await shared_client.aclose()
+
+@pytest.mark.asyncio
+async def test_request_bodies_are_encoded_as_json(shared_clients, monkeypatch):
+    """Test that bodies are sent as JSON without overriding the caller's content type."""
+    seen = []
+    
+    def handler(request):
+        seen.append((request.headers["content-type"], request.content))
+        return httpx.Response(200, json={})
+    
+    monkeypatch.setattr(http_client_module, "CachingDNSTransport", lambda **kwargs: httpx.MockTransport(handler))
+    client = HttpClient(StubConfigManager({"default": {"base_url": "http://svc"}}))
+    
+    await client.post("/items", {"name": "Apple", "tags": ["fruit"]})
+    await client.post("/items", {"name": "Apple"}, headers={"content-type": "application/vnd.api+json"})
+    
+    assert seen == [
+        ("application/json", b'{"name":"Apple","tags":["fruit"]}'),
+        ("application/vnd.api+json", b'{"name":"Apple"}')
+    ]
+    await shared_clients["default"].aclose()
+
+def test_sources_with_same_settings_share_a_transport(shared_clients, monkeypatch):
+    """Test that sources only get their own transport when their settings differ."""
+    monkeypatch.setattr(http_client_module, "CachingDNSTransport", lambda **kwargs: httpx.MockTransport(lambda request: httpx.Response(200)))
+    client = HttpClient(StubConfigManager({
+        "gateway_a": {"base_url": "http://gateway/a"},
+        "gateway_b": {"base_url": "http://gateway/b"},
+        "tuned": {"base_url": "http://gateway/c", "max_connections": 10}
+    }))
+    
+    transports = {source_id: client._get_client(source_id)._transport for source_id in ("gateway_a", "gateway_b", "tuned")}
+    
+    assert transports["gateway_a"] is transports["gateway_b"]
+    assert transports["tuned"] is not transports["gateway_a"]
+
+@pytest.mark.asyncio
+async def test_only_json_object_credit_scores_are_cached(shared_clients, monkeypatch):
+    """Test that credit scores are cached as copies, and other payloads not at all."""
+    from app.common.utils.ttl_cache import TTLCache
+    
+    bodies = {
+        "/customers/c1/credit-score": httpx.Response(200, json={"score": 720}),
+        "/customers/c2/credit-score": httpx.Response(200, json=[720]),
+        "/customers/c3/credit-score": httpx.Response(200, text="unavailable")
+    }
+    seen = []
+    
+    def handler(request):
+        seen.append(request.url.path)
+        return bodies[request.url.path]
+    
+    monkeypatch.setattr(http_client_module, "CachingDNSTransport", lambda **kwargs: httpx.MockTransport(handler))
+    monkeypatch.setattr(http_client_module, "_credit_score_cache", TTLCache())
+    client = HttpClient(StubConfigManager({"credit_api": {"base_url": "http://credit"}}))
+    
+    for _ in range(2):
+        score = await client.get_customer_credit_score("c1")
+        assert score == {"score": 720}
+        score["score"] = 0
+        assert await client.get_customer_credit_score("c2") == [720]
+        assert (await client.get_customer_credit_score("c3"))["content"] == "unavailable"
+    
+    assert seen.count("/customers/c1/credit-score") == 1
+    assert seen.count("/customers/c2/credit-score") == 2
+    assert seen.count("/customers/c3/credit-score") == 2
+    await shared_clients["credit_api"].aclose()
+
+@pytest.mark.asyncio
+async def test_dns_transport_connects_to_cached_addresses(monkeypatch):
+    """Test that the transport connects to the cached address and maps httpcore errors."""
+    import asyncio
+    from app.adapters.api import dns_cache
+    
+    async def handle(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\ncontent-length: 11\r\n\r\n{\"ok\":true}")
+        await writer.drain()
+        writer.close()
+    
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    
+    async def fake_resolve_host(host, port, ttl=dns_cache.DEFAULT_DNS_TTL):
+        return ("127.0.0.1",)
+    
+    monkeypatch.setattr(dns_cache, "resolve_host", fake_resolve_host)
+    
+    try:
+        async with httpx.AsyncClient(transport=dns_cache.CachingDNSTransport()) as client:
+            response = await client.get(f"http://service.invalid:{port}/")
+            assert response.json() == {"ok": True}
+            assert response.request.headers["host"] == f"service.invalid:{port}"
+            
+            server.close()
+            await server.wait_closed()
+            with pytest.raises(httpx.ConnectError):
+                await client.get(f"http://service.invalid:{port}/")
+    finally:
+        server.close()
+
+@pytest.mark.asyncio
+async def test_clients_use_proxies_from_the_environment(monkeypatch):
+    """Test that requests go through the proxy set in HTTP_PROXY."""
+    import asyncio
+    
+    request_lines = []
+    
+    async def handle(reader, writer):
+        head = await reader.readuntil(b"\r\n\r\n")
+        request_lines.append(head.split(b"\r\n", 1)[0])
+        writer.write(b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\ncontent-length: 2\r\n\r\n{}")
+        await writer.drain()
+        writer.close()
+    
+    proxy = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = proxy.sockets[0].getsockname()[1]
+    for name in ("HTTP_PROXY", "http_proxy"):
+        monkeypatch.setenv(name, f"http://127.0.0.1:{port}")
+    for name in ("NO_PROXY", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    clients = {}
+    monkeypatch.setattr(http_client_module, "_shared_clients", clients)
+    monkeypatch.setattr(http_client_module, "_shared_client_configs", {})
+    monkeypatch.setattr(http_client_module, "_shared_transports", {})
+    client = HttpClient(StubConfigManager({"default": {"base_url": "http://service.invalid"}}))
+    
+    try:
+        assert await client.get("/customers") == {}
+        assert request_lines == [b"GET http://service.invalid/customers HTTP/1.1"]
+    finally:
+        for shared_client in clients.values():
+            await shared_client.aclose()
+        proxy.close()
+
+def test_reload_clients_replaces_changed_sources(shared_clients, monkeypatch):
+    """Test that a reload replaces only the clients whose source configuration changed."""
+    monkeypatch.setattr(http_client_module, "CachingDNSTransport", lambda **kwargs: httpx.MockTransport(lambda request: httpx.Response(200)))
+    config_manager = StubConfigManager({"a": {"base_url": "http://a"}, "b": {"base_url": "http://b"}})
+    client = HttpClient(config_manager)
+    client_a, client_b = client._get_client("a"), client._get_client("b")
+    
+    config_manager.sources = {"a": {"base_url": "http://a"}, "b": {"base_url": "http://b2"}}
+    
+    assert client.reload_clients() == 1
+    assert client._get_client("a") is client_a
+    assert client._get_client("b") is not client_b
+    assert str(client._get_client("b").base_url) == "http://b2"
+    assert http_client_module._retired_clients == [client_b]
@@ -0,0 +1,37 @@
+import pytest
+
+from app.adapters.ml.model_client import ModelClient
+
+class StubConfigManager:
+    """Data source config manager stub serving a fixed ML configuration."""
+    
+    def __init__(self, sources):
+        self.sources = sources
+        self.lookups = 0
+    
+    def get_data_source_config(self, source_type, source_id):
+        self.lookups += 1
+        return self.sources.get(source_id)
+    
+    def get_all_data_sources(self, source_type):
+        return self.sources
+
+def test_preload_models_resolves_configured_endpoints():
+    """Test that preloading resolves every valid model endpoint once."""
+    config_manager = StubConfigManager({
+        "default": {
+            "models": {
+                "churn": {"endpoint": "/predict/churn"},
+                "broken": {"timeout": 10}
+            }
+        }
+    })
+    client = ModelClient(config_manager, None)
+    
+    assert client.preload_models() == 1
+    assert client.model_endpoints == {("default", "churn"): "/predict/churn"}
+    
+    # Later lookups are served without reading the configuration
+    lookups = config_manager.lookups
+    assert client._get_model_endpoint("churn", "default") == "/predict/churn"
+    assert config_manager.lookups == lookups
@@ -0,0 +1,47 @@
+import pytest
+
+from app.adapters.ml.prediction_request_builder import PredictionRequestBuilder
+
+# Test schema
+test_schema = {
+    "properties": {
+        "total_purchases": {"type": "integer"},
+        "lifetime_value": {"type": "number"},
+        "is_active": {"type": "boolean"},
+        "segment": {"type": "string"},
+        "tags": {"type": "array"},
+        "metadata": {"type": "object"}
+    }
+}
+
+def test_format_features_converts_schema_types():
+    """Test that feature values are converted to their schema types."""
+    features = {
+        "total_purchases": "12",
+        "lifetime_value": "2450.75",
+        "is_active": 1,
+        "segment": 3,
+        "tags": '["loyal", "premium"]',
+        "metadata": {"source": "crm"},
+        "unknown": "dropped"
+    }
+    
+    result = PredictionRequestBuilder.format_features(features, test_schema)
+    
+    assert result == {
+        "total_purchases": 12,
+        "lifetime_value": 2450.75,
+        "is_active": True,
+        "segment": "3",
+        "tags": ["loyal", "premium"],
+        "metadata": {"source": "crm"}
+    }
+
+def test_format_features_keeps_missing_values():
+    """Test that None values and unparseable arrays are handled."""
+    features = {"total_purchases": None, "tags": "not json"}
+    
+    # Format twice to exercise the compiled schema cache
+    for _ in range(2):
+        result = PredictionRequestBuilder.format_features(features, test_schema)
+        assert result == {"total_purchases": None, "tags": ["not json"]}
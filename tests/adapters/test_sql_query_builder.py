@@ -0,0 +1,30 @@
+from app.adapters.database.sql_query_builder import SQLQueryBuilder
+
+def test_select_query_binds_where_values():
+    """Test that SELECT values are bound as parameters, not inlined."""
+    query, params = SQLQueryBuilder.build_select_query(
+        "customers", ["customer_id", "name"], {"email": "a@example.com"}, order_by="name", limit=5
+    )
+    
+    assert query == "SELECT customer_id, name FROM customers WHERE email = :param_0 ORDER BY name LIMIT :_limit"
+    assert params == {"param_0": "a@example.com", "_limit": 5}
+
+def test_select_pages_share_sql():
+    """Test that LIMIT and OFFSET are bound, so every page uses the same SQL."""
+    first, first_params = SQLQueryBuilder.build_select_query("customers", limit=10, offset=0)
+    second, second_params = SQLQueryBuilder.build_select_query("customers", limit=10, offset=10)
+    
+    assert first is second
+    assert first == "SELECT * FROM customers LIMIT :_limit OFFSET :_offset"
+    assert first_params == {"_limit": 10, "_offset": 0}
+    assert second_params == {"_limit": 10, "_offset": 10}
+
+def test_queries_of_the_same_shape_share_sql():
+    """Test that only the parameters differ between queries of the same shape."""
+    first, first_params = SQLQueryBuilder.build_update_query("customers", {"name": "A"}, {"customer_id": "c1"}, returning=["name"])
+    second, second_params = SQLQueryBuilder.build_update_query("customers", {"name": "B"}, {"customer_id": "c2"}, returning=["name"])
+    
+    assert first is second
+    assert first == "UPDATE customers SET name = :set_0 WHERE customer_id = :where_0 RETURNING name"
+    assert first_params == {"set_0": "A", "where_0": "c1"}
+    assert second_params == {"set_0": "B", "where_0": "c2"}
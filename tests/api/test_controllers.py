@@ -83,7 +83,7 @@ async def test_get_customer(app_client, database_client, monkeypatch):
 async def test_list_customers(app_client, database_client, monkeypatch):
     """Test listing customers."""
     # Mock database client to return a predefined response
-    async def mock_list_customers(self, limit=10, offset=0, source_id="default"):
+    async def mock_list_customers(self, limit=10, offset=0, cursor=None, source_id="default"):
         return [
             {
                 "customer_id": "cust_test123",
@@ -118,4 +118,33 @@ async def test_list_customers(app_client, database_client, monkeypatch):
     data = response.json()
     assert len(data) == 2
     assert data[0]["name"] == "John Doe"
-    assert data[1]["name"] == "Jane Smith"
\ No newline at end of file
+    assert data[1]["name"] == "Jane Smith"
+
+@pytest.mark.asyncio
+async def test_list_customers_pages_with_cursor(app_client, database_client, monkeypatch):
+    """Test that a full page returns a cursor that selects the next page."""
+    cursors = []
+    
+    async def mock_list_customers(self, limit=10, offset=0, cursor=None, source_id="default"):
+        cursors.append(cursor)
+        return [
+            {
+                "customer_id": f"cust_{i}",
+                "name": "John Doe",
+                "email": "john.doe@example.com",
+                "created_at": "2023-01-01T00:00:00",
+                "updated_at": "2023-01-01T00:00:00"
+            }
+            for i in range(limit)
+        ]
+    
+    # Apply the mock
+    monkeypatch.setattr(database_client.__class__, "list_customers", mock_list_customers)
+    
+    response = app_client.get("/api/customers/", params={"limit": 2}, headers={"Origin": "http://example.com"})
+    next_cursor = response.headers["X-Next-Cursor"]
+    assert "X-Next-Cursor" in response.headers["Access-Control-Expose-Headers"]
+    app_client.get("/api/customers/", params={"limit": 2, "cursor": next_cursor})
+    
+    assert cursors == [None, ("2023-01-01T00:00:00", "cust_1")]
+    assert app_client.get("/api/customers/", params={"cursor": "not-a-cursor"}).status_code == 400
\ No newline at end of file
@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import pytest
+from fastapi import Request
+from fastapi.testclient import TestClient
+
+import app as app_module
+from app import create_app, reload_configuration
+from app.api.dependencies import get_request_processor
+from app.config.config_loader import ConfigLoader
+
+@pytest.mark.asyncio
+async def test_requests_reuse_startup_graph(app_client, database_client, monkeypatch):
+    """Test that requests reuse the processor built at startup without loading config."""
+    async def mock_list_customers(self, limit=10, offset=0, cursor=None, source_id="default"):
+        return []
+    
+    def fail_load(self, filename):
+        raise AssertionError(f"Configuration file loaded during a request: {filename}")
+    
+    # Apply the mocks
+    monkeypatch.setattr(database_client.__class__, "list_customers", mock_list_customers)
+    monkeypatch.setattr(ConfigLoader, "load_yaml_file", fail_load)
+    
+    processor = app_client.app.state.request_processor
+    seen = []
+    
+    def tracking_dependency(request: Request):
+        resolved = get_request_processor(request)
+        seen.append(resolved)
+        return resolved
+    
+    app_client.app.dependency_overrides[get_request_processor] = tracking_dependency
+    try:
+        for _ in range(2):
+            response = app_client.get("/api/customers/")
+            assert response.status_code == 200
+    finally:
+        app_client.app.dependency_overrides.clear()
+    
+    assert seen == [processor, processor]
+
+def test_reload_configuration_preloads_endpoints(app_client):
+    """Test that reloading configuration repopulates the endpoint cache."""
+    endpoint_config = app_client.app.state.request_processor.endpoint_config
+    endpoint_config.endpoint_cache.clear()
+    
+    reload_configuration(app_client.app)
+    
+    assert ("customers", "get") in endpoint_config.endpoint_cache
+
+def test_reload_configuration_drops_compiled_config(app_client):
+    """Test that reloading configuration drops entries compiled from the old config."""
+    processor = app_client.app.state.request_processor
+    old_config = processor.endpoint_config.get_endpoint_config("customers", "get")
+    processor.data_orchestrator._get_source_stages(old_config["data_sources"])
+    processor.response_assembler._get_compiled_mapping({"id": "$customer.customer_id"})
+    
+    reload_configuration(app_client.app)
+    
+    assert len(processor.data_orchestrator.source_stages) == 0
+    assert len(processor.data_orchestrator.compiled_params) == 0
+    assert len(processor.response_assembler.compiled_mappings) == 0
+
+def test_failed_feast_preload_is_logged(monkeypatch, caplog):
+    """Test that an error importing Feast in the background is logged."""
+    def fail_preload():
+        raise ImportError("No module named 'feast'")
+    
+    monkeypatch.setattr(app_module, "preload_feast", fail_preload)
+    
+    with caplog.at_level(logging.ERROR, logger="app"):
+        with TestClient(create_app()) as client:
+            async def wait_for_preload():
+                await asyncio.wait([client.app.state.feast_preload])
+            
+            client.portal.call(wait_for_preload)
+    
+    assert "Failed to preload Feast" in caplog.text
@@ -0,0 +1,143 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.common.middleware.cors_middleware import FastCORSMiddleware
+
+def create_test_client(**cors_options):
+    """Create a test client for a minimal app wrapped in the CORS middleware."""
+    app = FastAPI()
+    
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+    
+    app.add_middleware(FastCORSMiddleware, **cors_options)
+    return TestClient(app)
+
+def test_simple_request_gets_wildcard_origin():
+    """Test that a cross-origin request is answered with the static CORS headers."""
+    client = create_test_client()
+    
+    response = client.get("/ping", headers={"Origin": "http://example.com"})
+    
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+    assert response.headers["access-control-allow-origin"] == "*"
+
+def test_wildcard_headers_skip_origin_check():
+    """Test that wildcard CORS adds its static headers without inspecting the request."""
+    client = create_test_client()
+    
+    response = client.get("/ping")
+    
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "*"
+
+def test_same_origin_request_is_untouched_with_explicit_origins():
+    """Test that requests without an Origin header get no CORS headers."""
+    client = create_test_client(allow_origins=["http://allowed.com"])
+    
+    response = client.get("/ping")
+    
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
+
+def test_wildcard_options_without_preflight_reaches_app():
+    """Test that a plain OPTIONS request is routed rather than treated as a preflight."""
+    client = create_test_client()
+    
+    response = client.options("/ping", headers={"Origin": "http://example.com"})
+    
+    assert response.status_code == 405
+    assert response.headers["access-control-allow-origin"] == "*"
+
+def test_preflight_is_answered_without_routing():
+    """Test that a preflight request is answered directly by the middleware."""
+    client = create_test_client(allow_methods=["GET", "POST"], max_age=86400)
+    
+    response = client.options(
+        "/not-a-route",
+        headers={
+            "Origin": "http://example.com",
+            "Access-Control-Request-Method": "POST"
+        }
+    )
+    
+    assert response.status_code == 204
+    assert response.content == b""
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert response.headers["access-control-allow-methods"] == "GET, POST"
+    assert response.headers["access-control-max-age"] == "86400"
+
+def test_explicit_origins_are_echoed():
+    """Test that an explicit origin list echoes only allowed origins."""
+    client = create_test_client(allow_origins=["http://allowed.com"])
+    
+    response = client.get("/ping", headers={"Origin": "http://allowed.com"})
+    assert response.headers["access-control-allow-origin"] == "http://allowed.com"
+    assert response.headers["vary"] == "Origin"
+    
+    response = client.get("/ping", headers={"Origin": "http://other.com"})
+    assert "access-control-allow-origin" not in response.headers
+
+def test_credentials_require_explicit_origins():
+    """Test that credentials are only allowed with an explicit origin list."""
+    with pytest.raises(ValueError):
+        FastCORSMiddleware(None, allow_credentials=True)
+    
+    client = create_test_client(allow_origins=["http://allowed.com"], allow_credentials=True)
+    
+    response = client.get("/ping", headers={"Origin": "http://allowed.com"})
+    assert response.headers["access-control-allow-origin"] == "http://allowed.com"
+    assert response.headers["access-control-allow-credentials"] == "true"
+
+def test_expose_headers_are_sent_on_responses():
+    """Test that exposed headers are listed so cross-origin scripts can read them."""
+    client = create_test_client(expose_headers=["X-Next-Cursor"])
+    
+    response = client.get("/ping", headers={"Origin": "http://example.com"})
+    
+    assert response.headers["access-control-expose-headers"] == "X-Next-Cursor"
+
+def test_credentialed_preflight_spells_out_wildcards():
+    """Test that credentialed preflights list methods and echo headers instead of "*"."""
+    client = create_test_client(allow_origins=["http://allowed.com"], allow_credentials=True)
+    
+    response = client.options(
+        "/ping",
+        headers={
+            "Origin": "http://allowed.com",
+            "Access-Control-Request-Method": "PUT",
+            "Access-Control-Request-Headers": "x-token"
+        }
+    )
+    
+    assert response.status_code == 204
+    assert "PUT" in response.headers["access-control-allow-methods"].split(", ")
+    assert response.headers["access-control-allow-headers"] == "x-token"
+    assert response.headers["access-control-allow-credentials"] == "true"
+
+def test_explicit_origins_always_vary_on_origin():
+    """Test that responses vary on Origin even when no CORS headers are added."""
+    client = create_test_client(allow_origins=["http://allowed.com"])
+    
+    for headers in ({}, {"Origin": "http://other.com"}):
+        response = client.get("/ping", headers=headers)
+        assert response.headers["vary"] == "Origin"
+        assert "access-control-allow-origin" not in response.headers
+
+def test_preflight_rejects_disallowed_method_or_headers():
+    """Test that preflights asking for unlisted methods or headers are refused."""
+    client = create_test_client(allow_methods=["GET", "POST"], allow_headers=["X-Token"])
+    
+    def preflight(method, headers=None):
+        request_headers = {"Origin": "http://example.com", "Access-Control-Request-Method": method}
+        if headers:
+            request_headers["Access-Control-Request-Headers"] = headers
+        return client.options("/ping", headers=request_headers)
+    
+    assert preflight("POST", "x-token, content-type").status_code == 204
+    assert preflight("PUT").status_code == 400
+    assert preflight("POST", "x-other").status_code == 400
+    assert "access-control-allow-origin" not in preflight("PUT").headers
@@ -0,0 +1,24 @@
+from app.common.errors import error_handlers
+
+def raise_and_catch() -> Exception:
+    """Raise an exception and return it with its traceback attached."""
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError as e:
+        return e
+
+def test_unhandled_error_content_has_error_id():
+    """Test that unhandled errors return an error ID without a traceback."""
+    data = error_handlers.unhandled_error_content(raise_and_catch())
+    
+    assert data["message"] == "An unexpected error occurred"
+    assert len(data["error_id"]) == 32
+    assert "traceback" not in data
+
+def test_unhandled_error_content_includes_traceback_in_debug(monkeypatch):
+    """Test that the traceback is only returned when debugging is enabled."""
+    monkeypatch.setattr(error_handlers, "_DEBUG", True)
+    
+    data = error_handlers.unhandled_error_content(raise_and_catch())
+    
+    assert "RuntimeError: boom" in data["traceback"]
@@ -0,0 +1,57 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.common.errors.custom_exceptions import DatabaseError
+from app.common.middleware.error_middleware import ErrorASGIMiddleware
+
+def create_test_client():
+    """Create a test client for a minimal app wrapped in the error middleware."""
+    app = FastAPI()
+    
+    @app.get("/ok")
+    async def ok():
+        return {"status": "ok"}
+    
+    @app.get("/fail")
+    async def fail():
+        raise RuntimeError("boom")
+    
+    app.add_middleware(ErrorASGIMiddleware)
+    return TestClient(app)
+
+def test_successful_request_is_untouched():
+    """Test that successful responses pass through unchanged."""
+    client = create_test_client()
+    
+    response = client.get("/ok")
+    
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+def test_unhandled_exception_becomes_json_500():
+    """Test that an unhandled exception is answered with a JSON error."""
+    client = create_test_client()
+    
+    response = client.get("/fail")
+    
+    assert response.status_code == 500
+    data = response.json()
+    assert data["status"] == "error"
+    assert data["message"] == "An unexpected error occurred"
+    assert "error_id" in data
+    assert "boom" not in response.text
+
+@pytest.mark.asyncio
+async def test_domain_errors_use_their_handlers(app_client, database_client, monkeypatch):
+    """Test that domain errors keep their mapped status codes in the app."""
+    async def mock_get_customer(self, customer_id, source_id="default"):
+        raise DatabaseError("Connection refused", source_id)
+    
+    # Apply the mock
+    monkeypatch.setattr(database_client.__class__, "get_customer", mock_get_customer)
+    
+    response = app_client.get("/api/customers/cust_test123")
+    
+    assert response.status_code == 502
+    assert response.json()["status"] == "error"
@@ -0,0 +1,30 @@
+from app.common.utils.identity_cache import IdentityCache
+
+def test_values_are_computed_once_per_object():
+    """Test that equal but distinct objects get their own entries."""
+    cache = IdentityCache()
+    calls = []
+    
+    def compute(obj):
+        calls.append(obj)
+        return len(obj)
+    
+    first, second = {"a": 1}, {"a": 1}
+    assert cache.get(first, compute) == 1
+    assert cache.get(first, compute) == 1
+    assert cache.get(second, compute) == 1
+    
+    assert len(calls) == 2
+    assert len(cache) == 2
+
+def test_oldest_entry_is_evicted_when_full():
+    """Test that the cache never holds more than maxsize objects."""
+    cache = IdentityCache(maxsize=2)
+    objects = [[i] for i in range(3)]
+    
+    for obj in objects:
+        cache.get(obj, len)
+    
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
@@ -0,0 +1,29 @@
+from app.common.utils import ttl_cache
+from app.common.utils.ttl_cache import TTLCache
+
+def test_entries_expire_after_ttl(monkeypatch):
+    """Test that entries are only returned until their TTL has passed."""
+    now = [100.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10.0)
+    
+    cache.set("key", "value")
+    now[0] = 109.0
+    assert cache.get("key") == "value"
+    
+    now[0] = 110.0
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+def test_oldest_entry_is_evicted_when_full():
+    """Test that a full cache evicts the least recently set entry."""
+    cache = TTLCache(maxsize=2)
+    
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 3)
+    cache.set("c", 4)
+    
+    assert cache.get("a") == 3
+    assert cache.get("b") is None
+    assert cache.get("c") == 4
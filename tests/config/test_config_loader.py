@@ -0,0 +1,53 @@
+import pytest
+
+from app.config.config_loader import ConfigLoader
+
+def test_missing_file_is_remembered(tmp_path):
+    """Test that a missing file is not looked up again until reloaded."""
+    loader = ConfigLoader(str(tmp_path))
+    
+    assert loader.load_yaml_file("late.yaml") == {}
+    
+    # A file created within the TTL is not picked up straight away
+    (tmp_path / "late.yaml").write_text("enabled: true\n")
+    assert loader.load_yaml_file("late.yaml") == {}
+    
+    # Reloading forgets the missing file
+    loader.reload_config("late.yaml")
+    assert loader.load_yaml_file("late.yaml") == {"enabled": True}
+
+def test_loaders_share_parsed_files(tmp_path):
+    """Test that loaders for the same directory share parsed files."""
+    (tmp_path / "config.yaml").write_text("name: test\n")
+    
+    first = ConfigLoader(str(tmp_path)).load_config()
+    second = ConfigLoader(str(tmp_path)).load_config()
+    
+    assert first == {"name": "test"}
+    assert first is second
+
+def test_list_domain_configs(tmp_path):
+    """Test that domain names are listed from the domains directory."""
+    domains_dir = tmp_path / "domains"
+    domains_dir.mkdir()
+    (domains_dir / "orders.yaml").write_text("endpoints: {}\n")
+    (domains_dir / "customers.yaml").write_text("endpoints: {}\n")
+    (domains_dir / "notes.txt").write_text("ignored\n")
+    
+    assert ConfigLoader(str(tmp_path)).list_domain_configs() == ("customers", "orders")
+
+def test_domain_listing_is_reused_until_reload(tmp_path):
+    """Test that the domain listing is cached until configuration is reloaded."""
+    domains_dir = tmp_path / "domains"
+    domains_dir.mkdir()
+    (domains_dir / "customers.yaml").write_text("endpoints: {}\n")
+    loader = ConfigLoader(str(tmp_path))
+    
+    assert loader.list_domain_configs() == ("customers",)
+    
+    (domains_dir / "orders.yaml").write_text("endpoints: {}\n")
+    assert loader.list_domain_configs() == ("customers",)
+    
+    loader.reload_config()
+    assert loader.list_domain_configs() == ("customers", "orders")
+    assert loader.list_domain_configs() is loader.list_domain_configs()
@@ -0,0 +1,41 @@
+import pytest
+
+from app.config.data_source_config_manager import DataSourceConfigManager
+
+class CountingConfigLoader:
+    """Config loader stub that counts file loads."""
+    
+    def __init__(self):
+        self.loads = []
+        self.reloads = []
+    
+    def load_yaml_file(self, filename):
+        self.loads.append(filename)
+        return {"sources": {"default": {"connection_string": "sqlite:///test.db"}}}
+    
+    def reload_config(self, filename=None):
+        self.reloads.append(filename)
+
+def test_source_configs_are_cached_per_type_and_id():
+    """Test that a source configuration is loaded once and reused."""
+    loader = CountingConfigLoader()
+    manager = DataSourceConfigManager(loader)
+    
+    for _ in range(2):
+        config = manager.get_data_source_config("database", "default")
+        assert config == {"connection_string": "sqlite:///test.db"}
+    
+    assert loader.loads == ["database.yaml"]
+    assert manager.get_data_source_config("database", "missing") is None
+
+def test_reload_clears_only_the_given_source_type():
+    """Test that reloading one source type keeps other cached types."""
+    loader = CountingConfigLoader()
+    manager = DataSourceConfigManager(loader)
+    manager.get_data_source_config("database", "default")
+    manager.get_data_source_config("api", "default")
+    
+    manager.reload_data_source_config("database")
+    
+    assert list(manager.source_cache) == [("api", "default")]
+    assert loader.reloads == ["database.yaml"]
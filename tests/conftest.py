@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 from fastapi.testclient import TestClient
 import sqlalchemy
@@ -6,10 +7,14 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 
 from app import create_app
+from app.adapters.database import database_client as database_client_module
 from app.adapters.database.database_client import DatabaseClient
 from app.config.data_source_config_manager import DataSourceConfigManager
 from app.config.config_loader import ConfigLoader
 
+# Don't connect to the configured databases and APIs when test apps start
+os.environ.setdefault("ORCH_SKIP_WARMUP", "1")
+
 # Test database URL (use in-memory SQLite)
 TEST_DATABASE_URL = "sqlite:///:memory:"
 
@@ -76,15 +81,27 @@ def test_db_session(test_db_engine):
     session.close()
 
 @pytest.fixture
-def database_client(test_db_engine, data_source_config):
+def register_engine(monkeypatch):
+    """Register test engines with a query executor, as shared engines are."""
+    executors = []
+    
+    def register(engine):
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-query-test")
+        executors.append(executor)
+        monkeypatch.setitem(database_client_module._engine_executors, engine, executor)
+        return engine
+    
+    yield register
+    
+    for executor in executors:
+        executor.shutdown(wait=False)
+
+@pytest.fixture
+def database_client(test_db_engine, data_source_config, register_engine):
     """Create a database client for testing."""
     client = DatabaseClient(data_source_config)
     
     # Override the engine with our test engine
-    client.engines["default"] = test_db_engine
-    
-    # Override the session factory
-    Session = sessionmaker(bind=test_db_engine)
-    client.sessions["default"] = Session
+    client.engines["default"] = register_engine(test_db_engine)
     
     return client
\ No newline at end of file
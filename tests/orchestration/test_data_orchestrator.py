@@ -0,0 +1,143 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+from app.orchestration.data_orchestrator import DataOrchestrator
+
+def test_resolve_params_uses_request_and_previous_results():
+    """Test that parameter references resolve against request data and earlier results."""
+    orchestrator = DataOrchestrator(MagicMock(), MagicMock(), MagicMock(), MagicMock())
+    params = {
+        "customer_id": "$request.customer_id",
+        "score": "$credit.details.score",
+        "missing": "$unknown.value",
+        "limit": 5
+    }
+    
+    # Resolve twice to exercise the compiled params cache
+    for _ in range(2):
+        resolved = orchestrator._resolve_params(
+            params,
+            {"customer_id": "cust_123"},
+            {"credit": {"details": {"score": 720}}}
+        )
+        assert resolved == {
+            "customer_id": "cust_123",
+            "score": 720,
+            "missing": None,
+            "limit": 5
+        }
+    
+    assert len(orchestrator.compiled_params) == 1
+
+@pytest.mark.asyncio
+async def test_independent_sources_run_concurrently():
+    """Test that parallel sources run together unless they use a result of their stage."""
+    running = []
+    overlapped = []
+    
+    class StubDatabase:
+        async def lookup(self, name, customer_id=None):
+            running.append(name)
+            await asyncio.sleep(0)
+            overlapped.append((name, len(running)))
+            running.remove(name)
+            return {"name": name, "customer_id": customer_id}
+    
+    orchestrator = DataOrchestrator(StubDatabase(), MagicMock(), MagicMock(), MagicMock())
+    endpoint_config = {
+        "data_sources": [
+            {"name": "customer", "type": "database", "operation": "lookup", "parallel": True,
+             "params": {"name": "customer", "customer_id": "$request.customer_id"}},
+            {"name": "orders", "type": "database", "operation": "lookup", "parallel": True, "params": {"name": "orders"}},
+            {"name": "score", "type": "database", "operation": "lookup", "parallel": True,
+             "params": {"name": "score", "customer_id": "$customer.customer_id"}}
+        ]
+    }
+    
+    result = await orchestrator.orchestrate("exec_1", endpoint_config, {"customer_id": "cust_123"})
+    
+    assert list(result) == ["customer", "orders", "score"]
+    assert result["score"]["customer_id"] == "cust_123"
+    assert overlapped == [("customer", 2), ("orders", 1), ("score", 1)]
+
+@pytest.mark.asyncio
+async def test_operations_are_bound_once_and_must_be_public():
+    """Test that operation methods are looked up once and private ones are refused."""
+    class StubDatabase:
+        async def get_item(self, item_id):
+            return {"item_id": item_id}
+        
+        async def _internal(self):
+            return "secret"
+    
+    orchestrator = DataOrchestrator(StubDatabase(), MagicMock(), MagicMock(), MagicMock())
+    
+    for item_id in ("a", "b"):
+        assert await orchestrator._execute_source_operation("database", "get_item", {"item_id": item_id}) == {"item_id": item_id}
+    assert list(orchestrator.operations) == [("database", "get_item")]
+    
+    with pytest.raises(ValueError):
+        await orchestrator._execute_source_operation("database", "_internal", {})
+
+@pytest.mark.asyncio
+async def test_failing_source_cancels_the_rest_of_its_stage():
+    """Test that the first failure in a stage cancels the sources still running."""
+    cancelled = []
+    
+    class StubDatabase:
+        async def get_fail(self):
+            raise RuntimeError("boom")
+        
+        async def get_slow(self):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append("slow")
+                raise
+    
+    orchestrator = DataOrchestrator(StubDatabase(), MagicMock(), MagicMock(), MagicMock())
+    endpoint_config = {
+        "data_sources": [
+            {"name": "slow", "type": "database", "operation": "get_slow", "parallel": True},
+            {"name": "fail", "type": "database", "operation": "get_fail", "parallel": True}
+        ]
+    }
+    
+    with pytest.raises(RuntimeError, match="boom"):
+        await orchestrator.orchestrate("exec_1", endpoint_config, {})
+    
+    assert cancelled == ["slow"]
+
+@pytest.mark.asyncio
+async def test_sources_run_serially_unless_marked_parallel():
+    """Test that unmarked sources, such as raw queries, run one by one and stop at a failure."""
+    calls = []
+    
+    class StubDatabase:
+        async def get_customer(self):
+            calls.append("get_customer")
+            return {}
+        
+        async def query(self, query):
+            calls.append(query)
+            if query.startswith("UPDATE"):
+                raise RuntimeError("boom")
+            return []
+    
+    orchestrator = DataOrchestrator(StubDatabase(), MagicMock(), MagicMock(), MagicMock())
+    sources = [
+        {"name": "read", "type": "database", "operation": "get_customer", "parallel": True},
+        {"name": "update", "type": "database", "operation": "query", "params": {"query": "UPDATE customers SET name = 'x'"}},
+        {"name": "select", "type": "database", "operation": "query", "params": {"query": "SELECT * FROM customers"}},
+        {"name": "reread", "type": "database", "operation": "get_customer", "parallel": True}
+    ]
+    
+    assert [[source["name"] for source in stage] for stage in orchestrator._get_source_stages(sources)] == [
+        ["read"], ["update"], ["select"], ["reread"]
+    ]
+    
+    with pytest.raises(RuntimeError, match="boom"):
+        await orchestrator.orchestrate("exec_1", {"data_sources": sources}, {})
+    
+    assert calls == ["get_customer", "UPDATE customers SET name = 'x'"]